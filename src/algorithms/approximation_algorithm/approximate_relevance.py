@@ -0,0 +1,152 @@
+import os
+from typing import Optional, Set, Union
+
+from .batch_stability_labeler import BatchStabilityLabeler
+from .label_propagation import LabelPropagator, literal_properties
+from .packed_stability_labels import BLOCKED, DEFENDED, OUT, UNSATISFIABLE
+from .satisfiability_labeler import SatisfiabilityLabeler
+from ..grounded_evaluation import grounded_statuses
+from ..topic_cone import topic_cone
+from ...classes.incomplete_argumentation_theory import \
+    IncompleteArgumentationTheory
+from ...import_export.iat_from_lp_reader import read_from_lp_file, \
+    read_topics_from_lp_file
+
+STATUS_FLAGS = {'unsatisfiable': UNSATISFIABLE, 'defended': DEFENDED,
+                'out': OUT, 'blocked': BLOCKED}
+
+
+class RelevanceApproximation:
+    """
+    A RelevanceApproximation splits the queryables that are not in the
+    knowledge base into those that are certainly relevant, those that are
+    certainly irrelevant and those for which this is unknown.
+    """
+    __slots__ = ('certainly_relevant', 'certainly_irrelevant', 'unknown')
+
+    def __init__(self):
+        self.certainly_relevant: Set[str] = set()
+        self.certainly_irrelevant: Set[str] = set()
+        self.unknown: Set[str] = set()
+
+    def __str__(self):
+        return 'Certainly relevant: ' + \
+            ', '.join(sorted(self.certainly_relevant)) + \
+            '\nCertainly irrelevant: ' + \
+            ', '.join(sorted(self.certainly_irrelevant)) + \
+            '\nUnknown: ' + ', '.join(sorted(self.unknown))
+
+
+class ApproximateRelevanceSolver:
+    """
+    Polynomial-time, sound approximation of the relevance computed by the
+    RelevanceSolver (without preferences). A queryable is relevant for a
+    status of the topic if there is some future knowledge base in which the
+    topic is stable for this status, but not without this queryable.
+
+    A queryable is certainly irrelevant if the topic is already stable for
+    the status or can never get it, if the queryable cannot be added to the
+    knowledge base consistently or if it is outside the backward cone of the
+    topic (and does not conflict with a queryable inside it).
+
+    A queryable is certainly relevant if the StabilityLabeler finds the topic
+    stable after adding just this queryable, while the topic does not have
+    the status for some future of the current knowledge base.
+    """
+
+    def __init__(self):
+        pass
+
+    def relevance_all(
+            self, iat: Union[str, os.PathLike, IncompleteArgumentationTheory],
+            topic: Optional[str] = None, status: str = 'defended') -> \
+            RelevanceApproximation:
+        if not isinstance(iat, IncompleteArgumentationTheory):
+            if topic is None:
+                topic = read_topics_from_lp_file(iat)[0]
+            iat = read_from_lp_file(iat)
+        elif topic is None:
+            raise ValueError('The topic of an IncompleteArgumentationTheory '
+                             'must be given.')
+        status_flag = STATUS_FLAGS[status]
+
+        compiled = iat.argumentation_system.compiled
+        literal_ids = compiled.literal_ids
+        topic_id = literal_ids[topic]
+        knowledge_base_ids = [literal_ids[literal.s1]
+                              for literal in iat.knowledge_base]
+
+        relevance = RelevanceApproximation()
+        potential_queryables = [
+            queryable for queryable in iat.queryables
+            if not iat.is_knowledge_base_axiom(queryable)]
+
+        def conflicts(literal_id: int, other_ids) -> bool:
+            return any(other_id in other_ids
+                       for other_id in (*compiled.contraries(literal_id),
+                                        *compiled.contrary_of(literal_id)))
+
+        # If the knowledge base is inconsistent, there is no future
+        # knowledge base at all.
+        knowledge_base_id_set = set(knowledge_base_ids)
+        if any(conflicts(literal_id, knowledge_base_id_set)
+               for literal_id in knowledge_base_ids):
+            relevance.certainly_irrelevant = \
+                {queryable.s1 for queryable in potential_queryables}
+            return relevance
+
+        # The labeler treats a rule identifier with several heads as
+        # separate rules, unlike the ASP encodings, so the labels are only
+        # used if each rule has a single head.
+        use_labels = len({rule.id for rule in compiled.rules}) == \
+            compiled.nr_of_rules
+
+        # If the topic is stable for the status already, or can never get
+        # it, then no queryable is relevant.
+        if use_labels:
+            labels = SatisfiabilityLabeler().solve_stability(iat)
+            LabelPropagator(compiled, literal_properties(iat, compiled),
+                            labels).propagate()
+            topic_label = labels.literal_labels[topic_id]
+            if not topic_label & status_flag or topic_label == status_flag:
+                relevance.certainly_irrelevant = \
+                    {queryable.s1 for queryable in potential_queryables}
+                return relevance
+
+        # Queryables can only affect the topic from inside its backward
+        # cone, or by preventing a queryable in the cone to be added.
+        literals_in_cone, _ = topic_cone(compiled, [topic_id])
+        queryable_ids_in_cone = {
+            literal_ids[queryable.s1] for queryable in iat.queryables
+            if literals_in_cone[literal_ids[queryable.s1]]}
+        candidates = []
+        for queryable in potential_queryables:
+            queryable_id = literal_ids[queryable.s1]
+            if conflicts(queryable_id, knowledge_base_id_set) or not (
+                    queryable_id in queryable_ids_in_cone or
+                    conflicts(queryable_id, queryable_ids_in_cone)):
+                relevance.certainly_irrelevant.add(queryable.s1)
+            else:
+                candidates.append(queryable)
+
+        # A candidate is relevant if the topic is stable after adding it, but
+        # not before. The latter is witnessed by a future knowledge base in
+        # which the topic does not have the status: we try the current
+        # knowledge base and those with one candidate added.
+        if not use_labels or not any(
+                grounded_statuses(compiled, future_ids)[topic_id] != status
+                for future_ids in [
+                    knowledge_base_ids,
+                    *([*knowledge_base_ids, literal_ids[candidate.s1]]
+                      for candidate in candidates)]):
+            relevance.unknown = {candidate.s1 for candidate in candidates}
+            return relevance
+        stability_results = BatchStabilityLabeler().solve_stability(
+            iat.argumentation_system, iat.queryables,
+            [iat.knowledge_base + [candidate] for candidate in candidates])
+        for candidate, stability_result in zip(candidates, stability_results):
+            if topic in getattr(stability_result, 'stable_' + status):
+                relevance.certainly_relevant.add(candidate.s1)
+            else:
+                relevance.unknown.add(candidate.s1)
+        return relevance
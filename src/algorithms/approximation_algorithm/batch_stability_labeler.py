@@ -0,0 +1,246 @@
+from collections import deque
+from typing import Iterable, List, Sequence, Union
+
+from ..stability_result import StabilityResult
+from ...classes.argumentation_system import ArgumentationSystem
+from ...classes.literal import Literal
+
+
+def _literal_str(literal: Union[Literal, str]) -> str:
+    if isinstance(literal, Literal):
+        return literal.s1
+    return literal
+
+
+def _iterate_bits(bits: int):
+    while bits:
+        lowest_bit = bits & -bits
+        yield lowest_bit.bit_length() - 1
+        bits ^= lowest_bit
+
+
+class BatchStabilityLabeler:
+    """
+    The BatchStabilityLabeler applies the labeling conditions of the
+    StabilityLabeler to many knowledge bases over the same argumentation
+    system at once.
+
+    For each literal and rule, each status is stored as a column of bits: bit
+    k of the column indicates if, for the k-th knowledge base, the literal or
+    rule can still get this status. All conditions are evaluated with bitwise
+    operations on these columns, so for all knowledge bases at the same time.
+    As in the LabelPropagator, L-D-a and L-D-c do not apply to literals with
+    a strict rule that can be defended.
+    """
+
+    def __init__(self):
+        pass
+
+    def solve_stability(
+            self, argumentation_system: ArgumentationSystem,
+            queryables: Iterable[Union[Literal, str]],
+            knowledge_bases: Sequence[Iterable[Union[Literal, str]]]) -> \
+            List[StabilityResult]:
+        """
+        Get a StabilityResult for each of the knowledge bases, as the
+        StabilityLabeler would give for the incomplete argumentation theory
+        with these queryables and this knowledge base.
+        """
+        compiled = argumentation_system.compiled
+        literal_ids = compiled.literal_ids
+        nr_of_literals = compiled.nr_of_literals
+        nr_of_rules = compiled.nr_of_rules
+        all_instances = (1 << len(knowledge_bases)) - 1
+
+        is_queryable = bytearray(nr_of_literals)
+        for queryable in queryables:
+            is_queryable[literal_ids[_literal_str(queryable)]] = 1
+
+        # Columns of the instances in which the literal is observed / has an
+        # observed contrary / only has contraries with an observed contrary.
+        observed = [0] * nr_of_literals
+        for instance, knowledge_base in enumerate(knowledge_bases):
+            for literal in knowledge_base:
+                observed[literal_ids[_literal_str(literal)]] |= 1 << instance
+        observed_contrary = [0] * nr_of_literals
+        for literal_id in range(nr_of_literals):
+            for contrary_id in compiled.contraries(literal_id):
+                observed_contrary[literal_id] |= observed[contrary_id]
+        all_contraries_observed_contrary = [all_instances] * nr_of_literals
+        for literal_id in range(nr_of_literals):
+            for contrary_id in compiled.contraries(literal_id):
+                all_contraries_observed_contrary[literal_id] &= \
+                    observed_contrary[contrary_id]
+
+        literal_derivable, rule_derivable = self._derivable(
+            compiled, is_queryable, observed_contrary, all_instances)
+
+        # Initial labeling, as given by the SatisfiabilityLabeler
+        literal_columns = [[all_instances] * nr_of_literals,
+                           literal_derivable, list(literal_derivable),
+                           list(literal_derivable)]
+        rule_columns = [[all_instances] * nr_of_rules,
+                        rule_derivable, list(rule_derivable),
+                        list(rule_derivable)]
+
+        self._propagate(compiled, is_queryable, observed, observed_contrary,
+                        all_contraries_observed_contrary, all_instances,
+                        literal_columns, rule_columns)
+
+        stability_results = [StabilityResult() for _ in knowledge_bases]
+        statuses = ['unsatisfiable', 'defended', 'out', 'blocked']
+        for literal_id, literal_str in enumerate(compiled.literal_names):
+            columns = [status_columns[literal_id]
+                       for status_columns in literal_columns]
+            for status_index, status in enumerate(statuses):
+                stable = columns[status_index]
+                for other_index in range(len(statuses)):
+                    if other_index != status_index:
+                        stable &= ~columns[other_index]
+                for instance in _iterate_bits(stable):
+                    stability_results[instance].add_to_result(
+                        literal_str, status)
+        return stability_results
+
+    @staticmethod
+    def _derivable(compiled, is_queryable, observed_contrary, all_instances):
+        """
+        Forward chaining over the columns: a literal is derivable in the
+        instances where it is queryable without observed contrary or where
+        some rule for it has only derivable antecedents.
+        """
+        literal_derivable = [
+            all_instances & ~observed_contrary[literal_id]
+            if is_queryable[literal_id] else 0
+            for literal_id in range(compiled.nr_of_literals)]
+        rule_derivable = [0] * compiled.nr_of_rules
+
+        rules_to_visit = deque(range(compiled.nr_of_rules))
+        queued = bytearray([1]) * compiled.nr_of_rules
+        while rules_to_visit:
+            rule_id = rules_to_visit.popleft()
+            queued[rule_id] = 0
+            derivable = all_instances
+            for antecedent_id in compiled.antecedents(rule_id):
+                derivable &= literal_derivable[antecedent_id]
+            if not derivable & ~rule_derivable[rule_id]:
+                continue
+            rule_derivable[rule_id] |= derivable
+            consequent_id = compiled.rule_consequents[rule_id]
+            if derivable & ~literal_derivable[consequent_id]:
+                literal_derivable[consequent_id] |= derivable
+                for other_rule_id in compiled.rules_using(consequent_id):
+                    if not queued[other_rule_id]:
+                        queued[other_rule_id] = 1
+                        rules_to_visit.append(other_rule_id)
+        return literal_derivable, rule_derivable
+
+    @staticmethod
+    def _propagate(compiled, is_queryable, observed, observed_contrary,
+                   all_contraries_observed_contrary, all_instances,
+                   literal_columns, rule_columns):
+        """
+        Apply the conditions until no column changes anymore. As in the
+        LabelPropagator, literals are queued by their id and rules by ~id.
+        """
+        literal_u, literal_d, literal_o, literal_b = literal_columns
+        rule_u, rule_d, rule_o, rule_b = rule_columns
+
+        queue = deque(range(compiled.nr_of_literals))
+        queue.extend(~rule_id for rule_id in range(compiled.nr_of_rules))
+        queued_literals = bytearray([1]) * compiled.nr_of_literals
+        queued_rules = bytearray([1]) * compiled.nr_of_rules
+
+        while queue:
+            node = queue.popleft()
+            if node >= 0:
+                literal_id = node
+                queued_literals[literal_id] = 0
+
+                # Combine the columns of the children (rules for the
+                # literal) and contrary children (rules for contraries).
+                all_u = all_uo = all_uob = all_instances
+                any_d = any_o = any_b = strict_any_d = 0
+                for rule_id in compiled.rules_for(literal_id):
+                    if rule_id >= compiled.nr_of_defeasible_rules:
+                        strict_any_d |= rule_d[rule_id]
+                    all_u &= rule_u[rule_id]
+                    all_uo &= rule_u[rule_id] | rule_o[rule_id]
+                    all_uob &= rule_u[rule_id] | rule_o[rule_id] | \
+                        rule_b[rule_id]
+                    any_d |= rule_d[rule_id]
+                    any_o |= rule_o[rule_id]
+                    any_b |= rule_b[rule_id]
+                contrary_all_uo = all_instances
+                contrary_any_db = 0
+                for contrary_id in compiled.contraries(literal_id):
+                    for rule_id in compiled.rules_for(contrary_id):
+                        contrary_all_uo &= rule_u[rule_id] | rule_o[rule_id]
+                        contrary_any_db |= rule_d[rule_id] | rule_b[rule_id]
+
+                if is_queryable[literal_id]:
+                    axiom = observed[literal_id]
+                    # L-U-a, L-U-b
+                    drop_u = axiom | ~all_u
+                    # L-D-a (unless a strict rule can be defended)
+                    drop_d = observed_contrary[literal_id] & ~strict_any_d
+                    # L-O-a, L-O-b, L-O-c
+                    drop_o = axiom | (
+                        all_contraries_observed_contrary[literal_id] &
+                        (~any_o | ~all_uo))
+                    # L-B-a
+                    drop_b = all_instances
+                else:
+                    # L-U-b
+                    drop_u = ~all_u
+                    # L-D-b, L-D-c (unless a strict rule can be defended)
+                    drop_d = ~any_d | (~contrary_all_uo & ~strict_any_d)
+                    # L-O-d, L-O-e
+                    drop_o = ~any_o | ~all_uo
+                    # L-B-b, L-B-c, L-B-d
+                    drop_b = ~(any_d | any_b) | (
+                        ~contrary_any_db & (~any_b | ~all_uob))
+                # L-O-f
+                drop_o |= ~(any_d | any_o | any_b)
+
+                changed = False
+                for columns, drop in ((literal_u, drop_u),
+                                      (literal_d, drop_d),
+                                      (literal_o, drop_o),
+                                      (literal_b, drop_b)):
+                    if columns[literal_id] & drop:
+                        columns[literal_id] &= ~drop
+                        changed = True
+                if changed:
+                    for rule_id in compiled.rules_using(literal_id):
+                        if not queued_rules[rule_id]:
+                            queued_rules[rule_id] = 1
+                            queue.append(~rule_id)
+            else:
+                rule_id = ~node
+                queued_rules[rule_id] = 0
+
+                all_d = all_db = all_instances
+                any_u = any_o = any_b = 0
+                for literal_id in compiled.antecedents(rule_id):
+                    all_d &= literal_d[literal_id]
+                    all_db &= literal_d[literal_id] | literal_b[literal_id]
+                    any_u |= literal_u[literal_id]
+                    any_o |= literal_o[literal_id]
+                    any_b |= literal_b[literal_id]
+
+                changed = False
+                # R-U-a, R-D-a, R-O-a and R-B-a, R-B-b
+                for columns, drop in ((rule_u, ~any_u), (rule_d, ~all_d),
+                                      (rule_o, ~any_o),
+                                      (rule_b, ~any_b | ~all_db)):
+                    if columns[rule_id] & drop:
+                        columns[rule_id] &= ~drop
+                        changed = True
+                if changed:
+                    consequent_id = compiled.rule_consequents[rule_id]
+                    for literal_id in [consequent_id,
+                                       *compiled.contrary_of(consequent_id)]:
+                        if not queued_literals[literal_id]:
+                            queued_literals[literal_id] = 1
+                            queue.append(literal_id)
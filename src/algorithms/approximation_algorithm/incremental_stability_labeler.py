@@ -0,0 +1,100 @@
+import os
+from typing import List, Union
+
+from .label_propagation import LabelPropagator, literal_properties, \
+    literal_property_flags
+from .packed_stability_labels import DEFENDED, UNSATISFIABLE
+from .satisfiability_labeler import SatisfiabilityLabeler, update_derivable
+from ..stability_result import StabilityResult
+from ...classes.incomplete_argumentation_theory import \
+    IncompleteArgumentationTheory
+from ...classes.literal import Literal
+from ...import_export.iat_from_lp_reader import read_from_lp_file
+
+
+class IncrementalStabilityLabeler:
+    """
+    An IncrementalStabilityLabeler labels an incomplete argumentation theory
+    once and then keeps its labels up to date while axioms are added to the
+    knowledge base, for example when answers arrive one at a time in an
+    inquiry dialogue.
+
+    Adding an axiom only removes possibilities, so the labels are updated by
+    propagating the changes that are reachable from the new axiom and (the
+    literals that have as contrary) its contraries. The result is the same as
+    labeling the future theory from scratch.
+
+    The given theory itself is not changed: the labeler works on a view on it.
+    """
+
+    def __init__(self, iat: Union[str, os.PathLike,
+                                  IncompleteArgumentationTheory]):
+        if not isinstance(iat, IncompleteArgumentationTheory):
+            iat = read_from_lp_file(iat)
+        self.iat = iat.with_axioms([])
+        self.compiled = self.iat.argumentation_system.compiled
+
+        self.labels = SatisfiabilityLabeler().solve_stability(self.iat)
+        # The SatisfiabilityLabeler only keeps DEFENDED (and all other
+        # statuses) for literals and rules that can be derived.
+        self._derivable_literals = bytearray(
+            [bool(label & DEFENDED) for label in self.labels.literal_labels])
+        self._derivable_rules = bytearray(
+            [bool(label & DEFENDED) for label in self.labels.rule_labels])
+
+        self._propagator = LabelPropagator(
+            self.compiled, literal_properties(self.iat, self.compiled),
+            self.labels)
+        self._propagator.propagate()
+
+    def stability_result(self) -> StabilityResult:
+        return self.labels.to_stability_result()
+
+    def add_axiom(self, literal: Union[Literal, str]) -> List[Literal]:
+        """
+        Add the literal to the axioms of the knowledge base and update the
+        labels. Returns the literals whose label changed.
+        """
+        compiled = self.compiled
+        if isinstance(literal, str):
+            literal = self.iat.argumentation_system.language[literal]
+        if self.iat.is_knowledge_base_axiom(literal):
+            return []
+        self.iat.add_knowledge_base_axiom(literal)
+
+        # Only the properties of the literal, the literals that have it as a
+        # contrary and the contraries of those can change.
+        literal_id = compiled.literal_ids[literal.s1]
+        affected_literal_ids = {literal_id}
+        for observed_contrary_id in compiled.contrary_of(literal_id):
+            affected_literal_ids.add(observed_contrary_id)
+            affected_literal_ids.update(
+                compiled.contrary_of(observed_contrary_id))
+        properties = self._propagator.properties
+        for affected_literal_id in affected_literal_ids:
+            flags = literal_property_flags(
+                self.iat, compiled.literals[affected_literal_id])
+            if flags != properties[affected_literal_id]:
+                properties[affected_literal_id] = flags
+                self._propagator.reevaluate_literal(affected_literal_id)
+
+        self._update_derivable(compiled.contrary_of(literal_id))
+
+        changed_literal_ids = self._propagator.propagate()
+        return [compiled.literals[changed_literal_id]
+                for changed_literal_id in sorted(changed_literal_ids)]
+
+    def _update_derivable(self, observed_contrary_ids):
+        """
+        Literals with an observed contrary can no longer be assumed, so they
+        (and everything derived from them) may no longer be derivable. These
+        can only be unsatisfiable.
+        """
+        underivable_literal_ids, underivable_rule_ids = update_derivable(
+            self.compiled, self._propagator.properties,
+            self._derivable_literals, self._derivable_rules,
+            observed_contrary_ids)
+        for literal_id in underivable_literal_ids:
+            self._propagator.restrict_literal(literal_id, UNSATISFIABLE)
+        for rule_id in underivable_rule_ids:
+            self._propagator.restrict_rule(rule_id, UNSATISFIABLE)
@@ -0,0 +1,630 @@
+from collections import deque
+from typing import Callable, Dict, List, MutableSequence, Optional, \
+    Sequence, Set, Tuple
+
+from .packed_stability_labels import PackedStabilityLabels, BLOCKED, \
+    DEFENDED, OUT, UNSATISFIABLE
+from ...classes.compiled_argumentation_system import \
+    CompiledArgumentationSystem
+from ...classes.incomplete_argumentation_theory import \
+    IncompleteArgumentationTheory
+from ...classes.literal import Literal
+from ...classes.strongly_connected_components import \
+    strongly_connected_components
+
+# Properties of a literal that the labeling conditions depend on, but that do
+# not depend on the labels of other literals or rules.
+QUERYABLE = 1
+AXIOM = 2
+OBSERVED_CONTRARY = 4
+ALL_CONTRARIES_OBSERVED_CONTRARY = 8
+
+# For each literal, a counter is kept for each of these masks, counting the
+# rules for the literal (its children) whose label still intersects the mask.
+_CHILD_MASKS = (UNSATISFIABLE, DEFENDED, OUT, UNSATISFIABLE | OUT,
+                DEFENDED | OUT | BLOCKED, DEFENDED | BLOCKED, BLOCKED,
+                UNSATISFIABLE | OUT | BLOCKED)
+(_C_U, _C_D, _C_O, _C_UO, _C_DOB, _C_DB, _C_B, _C_UOB) = \
+    range(len(_CHILD_MASKS))
+
+# The same for the rules for contraries of the literal (contrary children).
+_CONTRARY_CHILD_MASKS = (UNSATISFIABLE | OUT, DEFENDED | BLOCKED)
+(_CC_UO, _CC_DB) = range(len(_CONTRARY_CHILD_MASKS))
+
+# And for each rule, for its antecedents.
+_ANTECEDENT_MASKS = (UNSATISFIABLE, DEFENDED, OUT, BLOCKED,
+                     DEFENDED | BLOCKED)
+(_A_U, _A_D, _A_O, _A_B, _A_DB) = range(len(_ANTECEDENT_MASKS))
+
+
+def _masks_present(masks):
+    return tuple(tuple(index for index, mask in enumerate(masks)
+                       if flags & mask)
+                 for flags in range(16))
+
+
+def _masks_lost(masks):
+    return tuple(tuple(tuple(index for index, mask in enumerate(masks)
+                             if old_flags & mask and not new_flags & mask)
+                       for new_flags in range(16))
+                 for old_flags in range(16))
+
+
+_CHILD_MASKS_PRESENT = _masks_present(_CHILD_MASKS)
+_CONTRARY_CHILD_MASKS_PRESENT = _masks_present(_CONTRARY_CHILD_MASKS)
+_ANTECEDENT_MASKS_PRESENT = _masks_present(_ANTECEDENT_MASKS)
+_CHILD_MASKS_LOST = _masks_lost(_CHILD_MASKS)
+_CONTRARY_CHILD_MASKS_LOST = _masks_lost(_CONTRARY_CHILD_MASKS)
+_ANTECEDENT_MASKS_LOST = _masks_lost(_ANTECEDENT_MASKS)
+
+
+def literal_property_flags(iat: IncompleteArgumentationTheory,
+                           literal: Literal) -> int:
+    """
+    Get the QUERYABLE/AXIOM/OBSERVED_CONTRARY/ALL_CONTRARIES_OBSERVED_CONTRARY
+    flags of a literal. Only queryable literals have flags.
+    """
+    if not iat.is_queryable(literal):
+        return 0
+    flags = QUERYABLE
+    if iat.is_in_knowledge_base(literal):
+        flags |= AXIOM
+    if iat.has_observed_contrary(literal):
+        flags |= OBSERVED_CONTRARY
+    if iat.all_contraries_have_observed_contrary(literal):
+        flags |= ALL_CONTRARIES_OBSERVED_CONTRARY
+    return flags
+
+
+def literal_properties(iat: IncompleteArgumentationTheory,
+                       compiled: CompiledArgumentationSystem) -> bytearray:
+    """
+    Get the property flags of each literal, indexed by literal id.
+    """
+    return bytearray([literal_property_flags(iat, literal)
+                      for literal in compiled.literals])
+
+
+def assignment_property_flags(compiled: CompiledArgumentationSystem,
+                              literal_id: int, queryable: bool, axiom: bool,
+                              has_observed_contrary: Sequence[int]) -> int:
+    """
+    Get the property flags of a literal, as literal_property_flags does, from
+    whether it is queryable and an axiom, and whether each literal (by id)
+    has a contrary that is an axiom.
+    """
+    if not queryable:
+        return 0
+    flags = QUERYABLE
+    if axiom:
+        flags |= AXIOM
+    if has_observed_contrary[literal_id]:
+        flags |= OBSERVED_CONTRARY
+    if all(has_observed_contrary[contrary_id]
+           for contrary_id in compiled.contraries(literal_id)):
+        flags |= ALL_CONTRARIES_OBSERVED_CONTRARY
+    return flags
+
+
+def assignment_properties(compiled: CompiledArgumentationSystem,
+                          is_queryable: Callable[[int], bool],
+                          is_axiom: Callable[[int], bool]) -> bytearray:
+    """
+    Get the property flags of each literal, as literal_properties does for an
+    IncompleteArgumentationTheory, from whether each literal (by id) is
+    queryable and an axiom.
+    """
+    has_observed_contrary = bytearray(compiled.nr_of_literals)
+    for literal_id in range(compiled.nr_of_literals):
+        if is_axiom(literal_id):
+            for other_id in compiled.contrary_of(literal_id):
+                has_observed_contrary[other_id] = 1
+    return bytearray([
+        assignment_property_flags(
+            compiled, literal_id, is_queryable(literal_id),
+            is_axiom(literal_id), has_observed_contrary)
+        for literal_id in range(compiled.nr_of_literals)])
+
+
+class LabelPropagator:
+    """
+    A LabelPropagator applies the labeling conditions of the StabilityLabeler
+    until no label changes, in the style of Dowling-Gallier unit propagation.
+
+    Instead of checking all children of a literal or rule each time it is
+    revisited, every literal and rule keeps counters of how many of its
+    children still possibly have some (combination of) statuses. Labels can
+    only lose flags, so every counter only decreases and each drop of a label
+    is pushed to the parents exactly once. The total work is linear in the
+    number of rules, antecedents and contrary relations.
+
+    Only the arrays of the compiled argumentation system are used, so any
+    object providing the same CSR arrays can be labeled.
+
+    Strict rules are children like defeasible rules, but their conclusion
+    cannot be attacked: a literal with a strict rule that can be defended
+    can be defended whatever its contraries are. So L-D-a and L-D-c only
+    apply to literals without such strict rules, which are counted per
+    literal as well.
+
+    If scc_ordered is set, the strongly connected components of the
+    dependency graph (from antecedents to rules and from rules to their
+    consequent and the literals that have it as contrary) are labeled in
+    topological order. Each component is labeled until a local fixpoint is
+    reached before the next is considered, so a component is never visited
+    again once it is settled and acyclic theories are labeled in one pass.
+
+    If trail is set to a list, each pushed label drop is recorded in it as
+    the literal (by its id) or rule (by ~id) with its old label, so that
+    undo can restore the labels and counters of an earlier state, for
+    instance when a solver backtracks.
+    """
+
+    def __init__(self, compiled: CompiledArgumentationSystem,
+                 properties: bytearray, labels: PackedStabilityLabels,
+                 scc_ordered: bool = False):
+        self.compiled = compiled
+        self.properties = properties
+        self.literal_labels = labels.literal_labels
+        self.rule_labels = labels.rule_labels
+        self.trail: Optional[List[Tuple[int, int]]] = None
+
+        nr_of_literals = compiled.nr_of_literals
+        nr_of_rules = compiled.nr_of_rules
+        literal_labels = self.literal_labels
+        rule_labels = self.rule_labels
+        rules_for_offsets = compiled.rules_for_offsets
+        rules_for_indices = compiled.rules_for_indices
+        contrary_offsets = compiled.contrary_offsets
+        contrary_indices = compiled.contrary_indices
+        antecedent_offsets = compiled.rule_antecedent_offsets
+        antecedent_indices = compiled.rule_antecedent_indices
+
+        self._nr_of_contrary_children = self._new_counters(nr_of_literals)
+        self._strict_child_d_counts = self._new_counters(nr_of_literals)
+        for rule_id in range(compiled.nr_of_defeasible_rules, nr_of_rules):
+            if rule_labels[rule_id] & DEFENDED:
+                self._strict_child_d_counts[
+                    compiled.rule_consequents[rule_id]] += 1
+
+        nr_of_child_masks = len(_CHILD_MASKS)
+        nr_of_contrary_child_masks = len(_CONTRARY_CHILD_MASKS)
+        nr_of_antecedent_masks = len(_ANTECEDENT_MASKS)
+        child_counts = self._new_counters(nr_of_literals * nr_of_child_masks)
+        contrary_child_counts = self._new_counters(
+            nr_of_literals * nr_of_contrary_child_masks)
+        antecedent_counts = self._new_counters(
+            nr_of_rules * nr_of_antecedent_masks)
+        for literal_id in range(nr_of_literals):
+            base = literal_id * nr_of_child_masks
+            for rule_id in rules_for_indices[
+                    rules_for_offsets[literal_id]:
+                    rules_for_offsets[literal_id + 1]]:
+                for mask_index in _CHILD_MASKS_PRESENT[rule_labels[rule_id]]:
+                    child_counts[base + mask_index] += 1
+            base = literal_id * nr_of_contrary_child_masks
+            for contrary_id in contrary_indices[
+                    contrary_offsets[literal_id]:
+                    contrary_offsets[literal_id + 1]]:
+                self._nr_of_contrary_children[literal_id] += \
+                    rules_for_offsets[contrary_id + 1] - \
+                    rules_for_offsets[contrary_id]
+                for rule_id in rules_for_indices[
+                        rules_for_offsets[contrary_id]:
+                        rules_for_offsets[contrary_id + 1]]:
+                    for mask_index in \
+                            _CONTRARY_CHILD_MASKS_PRESENT[
+                                rule_labels[rule_id]]:
+                        contrary_child_counts[base + mask_index] += 1
+        for rule_id in range(nr_of_rules):
+            base = rule_id * nr_of_antecedent_masks
+            for literal_id in antecedent_indices[
+                    antecedent_offsets[rule_id]:
+                    antecedent_offsets[rule_id + 1]]:
+                for mask_index in \
+                        _ANTECEDENT_MASKS_PRESENT[literal_labels[literal_id]]:
+                    antecedent_counts[base + mask_index] += 1
+        self._child_counts = child_counts
+        self._contrary_child_counts = contrary_child_counts
+        self._antecedent_counts = antecedent_counts
+
+        # Literals are queued by their id, rules by ~id (so as negatives).
+        # For the queued literals and rules, the label is kept as it was
+        # when it was last pushed to the counters of their parents.
+        self._queue = deque()
+        self._queued_literal_labels: Dict[int, int] = dict()
+        self._queued_rule_labels: Dict[int, int] = dict()
+
+        # Literals and rules in components that are not labeled yet are
+        # deferred: they are not evaluated until their component is.
+        self._deferred_literals = None
+        self._deferred_rules = None
+        self._components = None
+        if scc_ordered:
+            self._components = self._components_in_topological_order()
+            self._deferred_literals = bytearray([1]) * nr_of_literals
+            self._deferred_rules = bytearray([1]) * nr_of_rules
+        else:
+            for literal_id in range(nr_of_literals):
+                self.reevaluate_literal(literal_id)
+            for rule_id in range(nr_of_rules):
+                self.reevaluate_rule(rule_id)
+
+    def _new_counters(self, size: int) -> MutableSequence[int]:
+        """
+        Get size counters that are zero. Lists are the fastest to update.
+        """
+        return [0] * size
+
+    def _components_in_topological_order(self) -> List[List[int]]:
+        """
+        Strongly connected components of the dependency graph, such that
+        each component comes after the components it depends on. Literals
+        are nodes by their id and rules by ~id.
+        """
+        compiled = self.compiled
+        nr_of_literals = compiled.nr_of_literals
+        successors = [list(compiled.rules_using(literal_id))
+                      for literal_id in range(nr_of_literals)]
+        for literal_successors in successors:
+            for index, rule_id in enumerate(literal_successors):
+                literal_successors[index] = nr_of_literals + rule_id
+        for rule_id in range(compiled.nr_of_rules):
+            consequent_id = compiled.rule_consequents[rule_id]
+            successors.append(
+                [consequent_id, *compiled.contrary_of(consequent_id)])
+        return [[node if node < nr_of_literals else ~(node - nr_of_literals)
+                 for node in component]
+                for component in
+                reversed(strongly_connected_components(successors))]
+
+    def _removed(self, flag: int, condition: str, node: int):
+        """
+        Called when a labeling condition removes a flag from the label of a
+        literal (by its id) or a rule (by ~id). This does nothing, but see
+        InstrumentedLabelPropagator.
+        """
+
+    def _evaluate_literal(self, literal_id: int) -> int:
+        literal_label = self.literal_labels[literal_id]
+        properties = self.properties[literal_id]
+        rules_for_offsets = self.compiled.rules_for_offsets
+        nr_of_children = \
+            rules_for_offsets[literal_id + 1] - rules_for_offsets[literal_id]
+        base = literal_id * len(_CHILD_MASKS)
+        child_counts = self._child_counts[base:base + len(_CHILD_MASKS)]
+        base = literal_id * len(_CONTRARY_CHILD_MASKS)
+        contrary_child_counts = \
+            self._contrary_child_counts[base:base + len(_CONTRARY_CHILD_MASKS)]
+        queryable = properties & QUERYABLE
+        strictly_defensible = self._strict_child_d_counts[literal_id]
+
+        if properties & AXIOM:
+            # L-U-a: The literal is observed, so it cannot be unsatisfiable.
+            if literal_label & UNSATISFIABLE:
+                literal_label &= ~UNSATISFIABLE
+                self._removed(UNSATISFIABLE, 'L-U-a', literal_id)
+        elif child_counts[_C_U] < nr_of_children:
+            # L-U-b: There is a rule-based argument for the literal,
+            # so it cannot be unsatisfiable.
+            if literal_label & UNSATISFIABLE:
+                literal_label &= ~UNSATISFIABLE
+                self._removed(UNSATISFIABLE, 'L-U-b', literal_id)
+
+        if queryable:
+            if properties & OBSERVED_CONTRARY and not strictly_defensible:
+                # L-D-a: A contrary of the literal is observed, so the
+                # literal cannot be in the grounded extension.
+                if literal_label & DEFENDED:
+                    literal_label &= ~DEFENDED
+                    self._removed(DEFENDED, 'L-D-a', literal_id)
+        elif child_counts[_C_D] == 0:
+            # L-D-b: The literal is not observable and there is no
+            # defended rule, so the literal cannot be defended.
+            if literal_label & DEFENDED:
+                literal_label &= ~DEFENDED
+                self._removed(DEFENDED, 'L-D-b', literal_id)
+        elif contrary_child_counts[_CC_UO] < \
+                self._nr_of_contrary_children[literal_id] and \
+                not strictly_defensible:
+            # L-D-c: The literal is not observable and there is a
+            # defended or blocked rule for a contrary, so the
+            # literal cannot be defended.
+            if literal_label & DEFENDED:
+                literal_label &= ~DEFENDED
+                self._removed(DEFENDED, 'L-D-c', literal_id)
+
+        if queryable:
+            if properties & AXIOM:
+                # L-O-a: Observed literals cannot be out.
+                if literal_label & OUT:
+                    literal_label &= ~OUT
+                    self._removed(OUT, 'L-O-a', literal_id)
+            elif properties & ALL_CONTRARIES_OBSERVED_CONTRARY:
+                if child_counts[_C_O] == 0:
+                    # L-O-b
+                    if literal_label & OUT:
+                        literal_label &= ~OUT
+                        self._removed(OUT, 'L-O-b', literal_id)
+                elif child_counts[_C_UO] < nr_of_children:
+                    # L-O-c
+                    if literal_label & OUT:
+                        literal_label &= ~OUT
+                        self._removed(OUT, 'L-O-c', literal_id)
+        elif child_counts[_C_O] == 0:
+            # L-O-d
+            if literal_label & OUT:
+                literal_label &= ~OUT
+                self._removed(OUT, 'L-O-d', literal_id)
+        elif child_counts[_C_UO] < nr_of_children:
+            # L-O-e
+            if literal_label & OUT:
+                literal_label &= ~OUT
+                self._removed(OUT, 'L-O-e', literal_id)
+        if child_counts[_C_DOB] == 0:
+            # L-O-f: There is no rule-based argument for the literal,
+            # so the literal cannot be out.
+            if literal_label & OUT:
+                literal_label &= ~OUT
+                self._removed(OUT, 'L-O-f', literal_id)
+
+        if queryable:
+            # L-B-a: Observable literals cannot be blocked (only
+            # defended or unsatisfiable).
+            if literal_label & BLOCKED:
+                literal_label &= ~BLOCKED
+                self._removed(BLOCKED, 'L-B-a', literal_id)
+        elif child_counts[_C_DB] == 0:
+            # L-B-b: There is no defended or blocked rule-based argument for
+            # the literal, so it cannot be blocked.
+            if literal_label & BLOCKED:
+                literal_label &= ~BLOCKED
+                self._removed(BLOCKED, 'L-B-b', literal_id)
+        elif contrary_child_counts[_CC_DB] == 0:
+            if child_counts[_C_B] == 0:
+                # L-B-c: There is no rule-based counterargument that is
+                # strong enough.
+                if literal_label & BLOCKED:
+                    literal_label &= ~BLOCKED
+                    self._removed(BLOCKED, 'L-B-c', literal_id)
+            elif child_counts[_C_UOB] < nr_of_children:
+                # L-B-d: There is a rule-based argument in the
+                # grounded extension.
+                if literal_label & BLOCKED:
+                    literal_label &= ~BLOCKED
+                    self._removed(BLOCKED, 'L-B-d', literal_id)
+
+        return literal_label
+
+    def _evaluate_rule(self, rule_id: int) -> int:
+        rule_label = self.rule_labels[rule_id]
+        antecedent_offsets = self.compiled.rule_antecedent_offsets
+        nr_of_antecedents = \
+            antecedent_offsets[rule_id + 1] - antecedent_offsets[rule_id]
+        base = rule_id * len(_ANTECEDENT_MASKS)
+        antecedent_counts = \
+            self._antecedent_counts[base:base + len(_ANTECEDENT_MASKS)]
+
+        if antecedent_counts[_A_U] == 0:
+            # R-U-a: None of the antecedents can become unsatisfiable,
+            # so the rule cannot be unsatisfiable.
+            if rule_label & UNSATISFIABLE:
+                rule_label &= ~UNSATISFIABLE
+                self._removed(UNSATISFIABLE, 'R-U-a', ~rule_id)
+
+        if antecedent_counts[_A_D] < nr_of_antecedents:
+            # R-D-a: At least one of the antecedents cannot become defended,
+            # so the rule cannot be defended.
+            if rule_label & DEFENDED:
+                rule_label &= ~DEFENDED
+                self._removed(DEFENDED, 'R-D-a', ~rule_id)
+
+        if antecedent_counts[_A_O] == 0:
+            # R-O-a: None of the antecedents can become out, so the rule
+            # cannot be out.
+            if rule_label & OUT:
+                rule_label &= ~OUT
+                self._removed(OUT, 'R-O-a', ~rule_id)
+
+        if antecedent_counts[_A_B] == 0:
+            # R-B-a: None of the antecedents can become blocked, so the
+            # rule cannot be blocked.
+            if rule_label & BLOCKED:
+                rule_label &= ~BLOCKED
+                self._removed(BLOCKED, 'R-B-a', ~rule_id)
+        elif antecedent_counts[_A_DB] < nr_of_antecedents:
+            # R-B-b: At least one of the antecedents cannot become defended
+            # or blocked, so the rule cannot be blocked.
+            if rule_label & BLOCKED:
+                rule_label &= ~BLOCKED
+                self._removed(BLOCKED, 'R-B-b', ~rule_id)
+
+        return rule_label
+
+    def restrict_literal(self, literal_id: int, flags: int):
+        """
+        Remove all flags but the given ones from the label of the literal.
+        """
+        old_label = self.literal_labels[literal_id]
+        if old_label & flags != old_label:
+            self.literal_labels[literal_id] = old_label & flags
+            self._queue_literal(literal_id, old_label)
+
+    def restrict_rule(self, rule_id: int, flags: int):
+        """
+        Remove all flags but the given ones from the label of the rule.
+        """
+        old_label = self.rule_labels[rule_id]
+        if old_label & flags != old_label:
+            self.rule_labels[rule_id] = old_label & flags
+            self._queue_rule(rule_id, old_label)
+
+    def reevaluate_literal(self, literal_id: int):
+        """
+        Apply the conditions to the literal again, for instance because its
+        properties changed.
+        """
+        if self._deferred_literals is not None and \
+                self._deferred_literals[literal_id]:
+            return
+        old_label = self.literal_labels[literal_id]
+        literal_label = self._evaluate_literal(literal_id)
+        if literal_label != old_label:
+            self.literal_labels[literal_id] = literal_label
+            self._queue_literal(literal_id, old_label)
+
+    def reevaluate_rule(self, rule_id: int):
+        if self._deferred_rules is not None and \
+                self._deferred_rules[rule_id]:
+            return
+        old_label = self.rule_labels[rule_id]
+        rule_label = self._evaluate_rule(rule_id)
+        if rule_label != old_label:
+            self.rule_labels[rule_id] = rule_label
+            self._queue_rule(rule_id, old_label)
+
+    def _queue_literal(self, literal_id: int, old_label: int):
+        """
+        Queue the literal, whose label was old_label before it changed.
+        """
+        if literal_id not in self._queued_literal_labels:
+            self._queued_literal_labels[literal_id] = old_label
+            self._queue.append(literal_id)
+
+    def _queue_rule(self, rule_id: int, old_label: int):
+        if rule_id not in self._queued_rule_labels:
+            self._queued_rule_labels[rule_id] = old_label
+            self._queue.append(~rule_id)
+
+    def propagate(self) -> Set[int]:
+        """
+        Push all label drops to the counters of the parents until no label
+        changes anymore. Returns the ids of the literals whose label changed.
+        """
+        changed_literal_ids = set()
+        if self._components is not None:
+            components, self._components = self._components, None
+            for component in components:
+                for node in component:
+                    if node >= 0:
+                        self._deferred_literals[node] = 0
+                        self.reevaluate_literal(node)
+                    else:
+                        self._deferred_rules[~node] = 0
+                        self.reevaluate_rule(~node)
+                self._process_queue(changed_literal_ids)
+            self._deferred_literals = None
+            self._deferred_rules = None
+        self._process_queue(changed_literal_ids)
+        return changed_literal_ids
+
+    def _process_queue(self, changed_literal_ids: Set[int]):
+        compiled = self.compiled
+        rule_consequents = compiled.rule_consequents
+        rules_using_offsets = compiled.rules_using_offsets
+        rules_using_indices = compiled.rules_using_indices
+        contrary_of_offsets = compiled.contrary_of_offsets
+        contrary_of_indices = compiled.contrary_of_indices
+        child_counts = self._child_counts
+        contrary_child_counts = self._contrary_child_counts
+        antecedent_counts = self._antecedent_counts
+        nr_of_child_masks = len(_CHILD_MASKS)
+        nr_of_contrary_child_masks = len(_CONTRARY_CHILD_MASKS)
+        nr_of_antecedent_masks = len(_ANTECEDENT_MASKS)
+        nr_of_defeasible_rules = compiled.nr_of_defeasible_rules
+        queue = self._queue
+        trail = self.trail
+
+        while queue:
+            node = queue.popleft()
+            if node >= 0:
+                literal_id = node
+                old_label = self._queued_literal_labels.pop(literal_id)
+                new_label = self.literal_labels[literal_id]
+                if trail is not None:
+                    trail.append((node, old_label))
+                if old_label != new_label:
+                    changed_literal_ids.add(literal_id)
+                lost_masks = _ANTECEDENT_MASKS_LOST[old_label][new_label]
+                if not lost_masks:
+                    continue
+                for rule_id in rules_using_indices[
+                        rules_using_offsets[literal_id]:
+                        rules_using_offsets[literal_id + 1]]:
+                    base = rule_id * nr_of_antecedent_masks
+                    for mask_index in lost_masks:
+                        antecedent_counts[base + mask_index] -= 1
+                    self.reevaluate_rule(rule_id)
+            else:
+                rule_id = ~node
+                old_label = self._queued_rule_labels.pop(rule_id)
+                new_label = self.rule_labels[rule_id]
+                if trail is not None:
+                    trail.append((node, old_label))
+                consequent_id = rule_consequents[rule_id]
+                lost_masks = _CHILD_MASKS_LOST[old_label][new_label]
+                if lost_masks:
+                    base = consequent_id * nr_of_child_masks
+                    for mask_index in lost_masks:
+                        child_counts[base + mask_index] -= 1
+                    if old_label & ~new_label & DEFENDED and \
+                            rule_id >= nr_of_defeasible_rules:
+                        self._strict_child_d_counts[consequent_id] -= 1
+                    self.reevaluate_literal(consequent_id)
+                lost_masks = _CONTRARY_CHILD_MASKS_LOST[old_label][new_label]
+                if lost_masks:
+                    for literal_id in contrary_of_indices[
+                            contrary_of_offsets[consequent_id]:
+                            contrary_of_offsets[consequent_id + 1]]:
+                        base = literal_id * nr_of_contrary_child_masks
+                        for mask_index in lost_masks:
+                            contrary_child_counts[base + mask_index] -= 1
+                        self.reevaluate_literal(literal_id)
+
+    def undo(self, trail_length: int):
+        """
+        Restore the labels and counters to the state in which the trail had
+        the given length, by giving the literals and rules on the trail after
+        that their old labels back. Nothing may be queued.
+        """
+        compiled = self.compiled
+        rule_consequents = compiled.rule_consequents
+        rules_using_offsets = compiled.rules_using_offsets
+        rules_using_indices = compiled.rules_using_indices
+        contrary_of_offsets = compiled.contrary_of_offsets
+        contrary_of_indices = compiled.contrary_of_indices
+        nr_of_child_masks = len(_CHILD_MASKS)
+        nr_of_contrary_child_masks = len(_CONTRARY_CHILD_MASKS)
+        nr_of_antecedent_masks = len(_ANTECEDENT_MASKS)
+        trail = self.trail
+
+        while len(trail) > trail_length:
+            node, old_label = trail.pop()
+            if node >= 0:
+                new_label = self.literal_labels[node]
+                self.literal_labels[node] = old_label
+                lost_masks = _ANTECEDENT_MASKS_LOST[old_label][new_label]
+                for rule_id in rules_using_indices[
+                        rules_using_offsets[node]:
+                        rules_using_offsets[node + 1]]:
+                    base = rule_id * nr_of_antecedent_masks
+                    for mask_index in lost_masks:
+                        self._antecedent_counts[base + mask_index] += 1
+            else:
+                rule_id = ~node
+                new_label = self.rule_labels[rule_id]
+                self.rule_labels[rule_id] = old_label
+                consequent_id = rule_consequents[rule_id]
+                base = consequent_id * nr_of_child_masks
+                for mask_index in _CHILD_MASKS_LOST[old_label][new_label]:
+                    self._child_counts[base + mask_index] += 1
+                if old_label & ~new_label & DEFENDED and \
+                        rule_id >= compiled.nr_of_defeasible_rules:
+                    self._strict_child_d_counts[consequent_id] += 1
+                lost_masks = _CONTRARY_CHILD_MASKS_LOST[old_label][new_label]
+                for literal_id in contrary_of_indices[
+                        contrary_of_offsets[consequent_id]:
+                        contrary_of_offsets[consequent_id + 1]]:
+                    base = literal_id * nr_of_contrary_child_masks
+                    for mask_index in lost_masks:
+                        self._contrary_child_counts[base + mask_index] += 1
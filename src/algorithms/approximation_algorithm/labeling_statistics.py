@@ -0,0 +1,134 @@
+import json
+import os
+from typing import Dict, List, Optional, Union
+
+from .label_propagation import LabelPropagator
+from .packed_stability_labels import PackedStabilityLabels, BLOCKED, \
+    DEFENDED, OUT, UNSATISFIABLE
+from ..bitset_stability_result import STATUSES
+from ...classes.compiled_argumentation_system import \
+    CompiledArgumentationSystem
+
+LITERAL_CONDITIONS = ('L-U-a', 'L-U-b', 'L-D-a', 'L-D-b', 'L-D-c',
+                      'L-O-a', 'L-O-b', 'L-O-c', 'L-O-d', 'L-O-e', 'L-O-f',
+                      'L-B-a', 'L-B-b', 'L-B-c', 'L-B-d')
+RULE_CONDITIONS = ('R-U-a', 'R-D-a', 'R-O-a', 'R-B-a', 'R-B-b')
+
+# The SatisfiabilityLabeler is recorded as a condition as well: it removes
+# all flags but UNSATISFIABLE from literals and rules that cannot be derived.
+SATISFIABILITY = 'satisfiability'
+
+_STATUS_OF_FLAG = {UNSATISFIABLE: STATUSES[0], DEFENDED: STATUSES[1],
+                   OUT: STATUSES[2], BLOCKED: STATUSES[3]}
+
+
+class LabelingStatistics:
+    """
+    LabelingStatistics are collected by the SatisfiabilityLabeler and the
+    StabilityLabeler if they are given one. They count how often each
+    labeling condition removed a flag, how often each literal and rule was
+    evaluated and how long the worklist was after each addition to it.
+
+    If provenance is set, also the condition that removed each flag from
+    each literal and rule is recorded, so that one can explain why a literal
+    did (not) end up stable.
+
+    Literals are recorded by their name and rules by their compiled rule id,
+    as the rules for the heads of one rule share their identifier.
+    """
+
+    def __init__(self, provenance: bool = False):
+        self.condition_counts: Dict[str, int] = {
+            condition: 0 for condition in
+            (SATISFIABILITY, *LITERAL_CONDITIONS, *RULE_CONDITIONS)}
+        self.literal_evaluations: Dict[str, int] = dict()
+        self.rule_evaluations: Dict[int, int] = dict()
+        self.worklist_sizes: List[int] = []
+        self.literal_provenance: Optional[Dict[str, Dict[str, str]]] = \
+            dict() if provenance else None
+        self.rule_provenance: Optional[Dict[int, Dict[str, str]]] = \
+            dict() if provenance else None
+
+    def record_satisfiability(self, compiled: CompiledArgumentationSystem,
+                              labels: PackedStabilityLabels):
+        for names, node_labels, provenance in [
+                (compiled.literal_names, labels.literal_labels,
+                 self.literal_provenance),
+                (range(compiled.nr_of_rules), labels.rule_labels,
+                 self.rule_provenance)]:
+            for name, label in zip(names, node_labels):
+                if label == UNSATISFIABLE:
+                    # All flags but UNSATISFIABLE are removed
+                    self.condition_counts[SATISFIABILITY] += \
+                        len(STATUSES) - 1
+                    if provenance is not None:
+                        provenance[name] = {
+                            status: SATISFIABILITY
+                            for status in STATUSES[1:]}
+
+    def to_dict(self) -> dict:
+        result = {'condition_counts': self.condition_counts,
+                  'literal_evaluations': self.literal_evaluations,
+                  'rule_evaluations': self.rule_evaluations,
+                  'worklist_sizes': self.worklist_sizes}
+        if self.literal_provenance is not None:
+            result['literal_provenance'] = self.literal_provenance
+            result['rule_provenance'] = self.rule_provenance
+        return result
+
+    def to_json(self, path: Optional[Union[str, os.PathLike]] = None) -> \
+            str:
+        """
+        Export the statistics as JSON, and write them to the path if given.
+        """
+        json_str = json.dumps(self.to_dict(), indent=1)
+        if path is not None:
+            with open(path, 'w') as json_file:
+                json_file.write(json_str)
+        return json_str
+
+
+class InstrumentedLabelPropagator(LabelPropagator):
+    """
+    LabelPropagator that records LabelingStatistics: it counts the
+    evaluations of each literal and rule, and records each condition that
+    removes a flag.
+    """
+
+    def __init__(self, compiled: CompiledArgumentationSystem,
+                 properties: bytearray, labels: PackedStabilityLabels,
+                 statistics: LabelingStatistics, scc_ordered: bool = False):
+        self.statistics = statistics
+        super().__init__(compiled, properties, labels, scc_ordered)
+
+    def _removed(self, flag: int, condition: str, node: int):
+        statistics = self.statistics
+        statistics.condition_counts[condition] += 1
+        if node >= 0:
+            provenance = statistics.literal_provenance
+            name = self.compiled.literal_names[node]
+        else:
+            provenance = statistics.rule_provenance
+            name = ~node
+        if provenance is not None:
+            provenance.setdefault(name, dict())[
+                _STATUS_OF_FLAG[flag]] = condition
+
+    def _evaluate_literal(self, literal_id: int) -> int:
+        name = self.compiled.literal_names[literal_id]
+        literal_evaluations = self.statistics.literal_evaluations
+        literal_evaluations[name] = literal_evaluations.get(name, 0) + 1
+        return super()._evaluate_literal(literal_id)
+
+    def _evaluate_rule(self, rule_id: int) -> int:
+        rule_evaluations = self.statistics.rule_evaluations
+        rule_evaluations[rule_id] = rule_evaluations.get(rule_id, 0) + 1
+        return super()._evaluate_rule(rule_id)
+
+    def _queue_literal(self, literal_id: int, old_label: int):
+        super()._queue_literal(literal_id, old_label)
+        self.statistics.worklist_sizes.append(len(self._queue))
+
+    def _queue_rule(self, rule_id: int, old_label: int):
+        super()._queue_rule(rule_id, old_label)
+        self.statistics.worklist_sizes.append(len(self._queue))
@@ -0,0 +1,109 @@
+import os
+from array import array
+from typing import MutableSequence, Optional, Union
+
+from .label_propagation import LabelPropagator, QUERYABLE, \
+    OBSERVED_CONTRARY, assignment_properties
+from .packed_stability_labels import PackedStabilityLabels, stable_ids
+from .satisfiability_labeler import label_derivable
+from ..stability_result import StabilityResult
+from ...classes.mapped_argumentation_system import \
+    MappedArgumentationSystem, open_mapped_file
+
+LABELS_FILE = 'labels'
+
+# Number of labels that is scanned at once for stable literals.
+_CHUNK_SIZE = 1 << 20
+
+
+class MappedStabilityLabels(PackedStabilityLabels):
+    """
+    MappedStabilityLabels are PackedStabilityLabels of a
+    MappedArgumentationSystem, kept in a memory-mapped file: first one byte
+    per literal and then one byte per rule. As there are no Literal or Rule
+    objects, the labels can only be turned into a StabilityResult or a
+    BitsetStabilityResult.
+    """
+
+    def __init__(self, mapped: MappedArgumentationSystem,
+                 path: Union[str, os.PathLike]):
+        self.compiled = mapped
+        with open(path, 'wb') as labels_file:
+            labels_file.truncate(mapped.nr_of_literals + mapped.nr_of_rules)
+        self._mapped_file = open_mapped_file(path, writable=True)
+        self._view = memoryview(self._mapped_file)
+        self.literal_labels = self._view[:mapped.nr_of_literals]
+        self.rule_labels = self._view[mapped.nr_of_literals:]
+
+    def _stable_literal_ids(self):
+        for start in range(0, len(self.literal_labels), _CHUNK_SIZE):
+            yield from stable_ids(
+                bytes(self.literal_labels[start:start + _CHUNK_SIZE]), start)
+
+    def close(self):
+        for view in (self.literal_labels, self.rule_labels, self._view):
+            view.release()
+        if not isinstance(self._mapped_file, bytearray):
+            self._mapped_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class CompactLabelPropagator(LabelPropagator):
+    """
+    LabelPropagator that keeps its counters in int arrays, which take half
+    the memory of lists but are slower to update.
+    """
+
+    def _new_counters(self, size: int) -> MutableSequence[int]:
+        return array('i', bytes(4 * size))
+
+
+class MappedStabilityLabeler:
+    """
+    The MappedStabilityLabeler gives the same results as the
+    StabilityLabeler, for a theory that was converted to a
+    MappedArgumentationSystem by convert_lp_file. The theory is labeled
+    directly on the mapped arrays and the labels are kept in a mapped file
+    (by default the labels file in the directory of the theory), so only
+    the counters of the label propagation and the property flags are kept
+    in memory, in int arrays and byte arrays.
+    """
+
+    def __init__(self):
+        pass
+
+    def solve_stability(
+            self, mapped: Union[str, os.PathLike, MappedArgumentationSystem],
+            labels_path: Optional[Union[str, os.PathLike]] = None,
+            scc_ordered: bool = False) -> StabilityResult:
+        opened_here = not isinstance(mapped, MappedArgumentationSystem)
+        if opened_here:
+            mapped = MappedArgumentationSystem(mapped)
+        if labels_path is None:
+            labels_path = os.path.join(mapped.directory, LABELS_FILE)
+
+        try:
+            with MappedStabilityLabels(mapped, labels_path) as labels:
+                properties = assignment_properties(
+                    mapped, mapped.is_queryable, mapped.is_axiom)
+                label_derivable(mapped, labels, (
+                    literal_id for literal_id in range(mapped.nr_of_literals)
+                    if properties[literal_id] & QUERYABLE and
+                    not properties[literal_id] & OBSERVED_CONTRARY))
+                CompactLabelPropagator(mapped, properties, labels,
+                                       scc_ordered).propagate()
+                stability_result = labels.to_stability_result()
+        except BaseException:
+            # Do not leave a labels file with only part of the labels
+            if os.path.exists(labels_path):
+                os.remove(labels_path)
+            raise
+        finally:
+            if opened_here:
+                mapped.close()
+        return stability_result
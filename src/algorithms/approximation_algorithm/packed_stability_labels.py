@@ -0,0 +1,106 @@
+from typing import Dict
+
+from .stability_label import StabilityLabel
+from .stability_labels import StabilityLabels
+from ..bitset_stability_result import BitsetStabilityResult, STATUSES
+from ..stability_result import StabilityResult
+from ...classes.compiled_argumentation_system import \
+    CompiledArgumentationSystem
+from ...classes.literal import Literal
+from ...classes.rule import Rule
+
+# Flags of a packed label, one for each status that is still possible
+UNSATISFIABLE = 1
+DEFENDED = 2
+OUT = 4
+BLOCKED = 8
+ALL_STATUSES = UNSATISFIABLE | DEFENDED | OUT | BLOCKED
+
+# Translation table from a packed label to 0 if the label is not stable or to
+# the position (starting at 1) of its status in STATUSES otherwise.
+_STABLE_STATUS_TABLE = bytes(
+    [{UNSATISFIABLE: 1, DEFENDED: 2, OUT: 3, BLOCKED: 4}.get(flags, 0)
+     for flags in range(256)])
+
+
+def stable_ids(labels: bytes, first_id: int = 0):
+    """
+    Get (id, status) for each label that is stable for some status, where
+    the first label has the given id. The labels are translated in one pass
+    and then scanned per status.
+    """
+    stable_statuses = labels.translate(_STABLE_STATUS_TABLE)
+    for status_position, status in enumerate(STATUSES, start=1):
+        status_byte = bytes([status_position])
+        index = stable_statuses.find(status_byte)
+        while index != -1:
+            yield first_id + index, status
+            index = stable_statuses.find(status_byte, index + 1)
+
+
+def to_stability_label(flags: int) -> StabilityLabel:
+    return StabilityLabel(bool(flags & UNSATISFIABLE), bool(flags & DEFENDED),
+                          bool(flags & OUT), bool(flags & BLOCKED))
+
+
+def from_stability_label(stability_label: StabilityLabel) -> int:
+    return stability_label.unsatisfiable * UNSATISFIABLE | \
+        stability_label.defended * DEFENDED | \
+        stability_label.out * OUT | stability_label.blocked * BLOCKED
+
+
+class PackedStabilityLabels:
+    """
+    PackedStabilityLabels store the labels of all literals and rules of a
+    compiled argumentation system as one byte each, in which the flags
+    UNSATISFIABLE, DEFENDED, OUT and BLOCKED indicate which statuses are
+    still possible. Labels are indexed by literal and rule id, so checking if
+    a label changed is an integer comparison.
+    """
+
+    def __init__(self, compiled: CompiledArgumentationSystem):
+        self.compiled = compiled
+        self.literal_labels = bytearray(compiled.nr_of_literals)
+        self.rule_labels = bytearray(compiled.nr_of_rules)
+
+    def literal_label(self, literal: Literal) -> StabilityLabel:
+        return to_stability_label(
+            self.literal_labels[self.compiled.literal_ids[literal.s1]])
+
+    def rule_label(self, rule: Rule) -> StabilityLabel:
+        return to_stability_label(
+            self.rule_labels[self.compiled.rule_ids[id(rule)]])
+
+    @property
+    def literal_labeling(self) -> Dict[Literal, StabilityLabel]:
+        return {literal: to_stability_label(flags) for literal, flags in
+                zip(self.compiled.literals, self.literal_labels)}
+
+    @property
+    def rule_labeling(self) -> Dict[Rule, StabilityLabel]:
+        return {rule: to_stability_label(flags) for rule, flags in
+                zip(self.compiled.rules, self.rule_labels)}
+
+    def to_stability_labels(self) -> StabilityLabels:
+        return StabilityLabels(self.literal_labeling, self.rule_labeling)
+
+    def _stable_literal_ids(self):
+        """
+        For each status, the ids of the literals that are stable for it.
+        """
+        return stable_ids(self.literal_labels)
+
+    def to_stability_result(self) -> StabilityResult:
+        stability_result = StabilityResult()
+        literal_names = self.compiled.literal_names
+        for literal_id, status in self._stable_literal_ids():
+            stability_result.add_to_result(literal_names[literal_id], status)
+        return stability_result
+
+    def to_bitset_stability_result(self) -> BitsetStabilityResult:
+        bitset_stability_result = \
+            BitsetStabilityResult(self.compiled.literal_names)
+        for literal_id, status in self._stable_literal_ids():
+            bitset_stability_result.add_literal_id_to_result(
+                literal_id, status)
+        return bitset_stability_result
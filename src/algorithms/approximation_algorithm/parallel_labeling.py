@@ -0,0 +1,176 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from .label_propagation import LabelPropagator, literal_properties
+from .satisfiability_labeler import SatisfiabilityLabeler
+from ..stability_result import StabilityResult
+from ...classes.argumentation_system import ArgumentationSystem
+from ...classes.compiled_argumentation_system import \
+    CompiledArgumentationSystem
+from ...classes.defeasible_rule import DefeasibleRule
+from ...classes.incomplete_argumentation_theory import \
+    IncompleteArgumentationTheory
+from ...classes.literal import Literal
+from ...classes.strict_rule import StrictRule
+
+# A compact sub-theory: literal names, contrary pairs, rules as (identifier,
+# antecedents, consequent, is strict), queryables, axioms and ordinary
+# premises. All literals are given by their position in the tuple of literal
+# names.
+CompactTheory = Tuple[Tuple[str, ...], List[Tuple[int, int]],
+                      List[Tuple[str, Tuple[int, ...], int, bool]],
+                      List[int], List[int], List[int]]
+
+
+def weakly_connected_components(compiled: CompiledArgumentationSystem) -> \
+        List[List[int]]:
+    """
+    Split the literals into weakly connected components, where a rule
+    connects its antecedents and its consequent, and a literal is connected
+    to its contraries. The stability labels of the literals and rules in one
+    component do not depend on the other components.
+    """
+    parents = list(range(compiled.nr_of_literals))
+
+    def find(literal_id: int) -> int:
+        while parents[literal_id] != literal_id:
+            parents[literal_id] = parents[parents[literal_id]]
+            literal_id = parents[literal_id]
+        return literal_id
+
+    def union(literal_id: int, other_id: int):
+        root, other_root = find(literal_id), find(other_id)
+        if root != other_root:
+            parents[other_root] = root
+
+    for rule_id in range(compiled.nr_of_rules):
+        consequent_id = compiled.rule_consequents[rule_id]
+        for antecedent_id in compiled.antecedents(rule_id):
+            union(consequent_id, antecedent_id)
+    for literal_id in range(compiled.nr_of_literals):
+        for contrary_id in compiled.contraries(literal_id):
+            union(literal_id, contrary_id)
+
+    components = dict()
+    for literal_id in range(compiled.nr_of_literals):
+        components.setdefault(find(literal_id), []).append(literal_id)
+    return list(components.values())
+
+
+def compact_sub_theories(iat: IncompleteArgumentationTheory,
+                         nr_of_sub_theories: int) -> List[CompactTheory]:
+    """
+    Distribute the weakly connected components of the theory over at most
+    nr_of_sub_theories compact sub-theories of about the same size. Rule
+    preferences are left out, as they do not affect the stability labels.
+    """
+    compiled = iat.argumentation_system.compiled
+    components = weakly_connected_components(compiled)
+    nr_of_sub_theories = max(1, min(nr_of_sub_theories, len(components)))
+
+    # Largest components first, each to the smallest sub-theory so far
+    sub_theory_literal_ids = [[] for _ in range(nr_of_sub_theories)]
+    for component in sorted(components, key=len, reverse=True):
+        min(sub_theory_literal_ids, key=len).extend(component)
+
+    sub_theory_of = [0] * compiled.nr_of_literals
+    local_ids = [0] * compiled.nr_of_literals
+    for index, literal_ids in enumerate(sub_theory_literal_ids):
+        for local_id, literal_id in enumerate(literal_ids):
+            sub_theory_of[literal_id] = index
+            local_ids[literal_id] = local_id
+
+    sub_theories = [(tuple(compiled.literal_names[literal_id]
+                           for literal_id in literal_ids), [], [], [], [], [])
+                    for literal_ids in sub_theory_literal_ids]
+    for literal_id in range(compiled.nr_of_literals):
+        contrary_pairs = sub_theories[sub_theory_of[literal_id]][1]
+        for contrary_id in compiled.contraries(literal_id):
+            contrary_pairs.append((local_ids[literal_id],
+                                   local_ids[contrary_id]))
+    for rule_id, rule in enumerate(compiled.rules):
+        consequent_id = compiled.rule_consequents[rule_id]
+        sub_theories[sub_theory_of[consequent_id]][2].append(
+            (rule.id, tuple(local_ids[antecedent_id] for antecedent_id in
+                            compiled.antecedents(rule_id)),
+             local_ids[consequent_id], compiled.is_strict(rule_id)))
+    for position, literals in [(3, iat.queryables),
+                               (4, iat.knowledge_base_axioms),
+                               (5, iat.knowledge_base_ordinary_premises)]:
+        for literal in literals:
+            literal_id = compiled.literal_ids[literal.s1]
+            sub_theories[sub_theory_of[literal_id]][position].append(
+                local_ids[literal_id])
+    return sub_theories
+
+
+def from_compact_theory(compact_theory: CompactTheory) -> \
+        IncompleteArgumentationTheory:
+    literal_names, contrary_pairs, rules, queryables, axioms, \
+        ordinary_premises = compact_theory
+    literals = [Literal(literal_name) for literal_name in literal_names]
+    contraries_and_contradictories = {
+        literal_name: set() for literal_name in literal_names}
+    for literal_id, contrary_id in contrary_pairs:
+        contraries_and_contradictories[literal_names[literal_id]].add(
+            literals[contrary_id])
+    defeasible_rules = []
+    strict_rules = []
+    for rule_id, antecedent_ids, consequent_id, is_strict in rules:
+        rule_class, rule_list = (StrictRule, strict_rules) if is_strict \
+            else (DefeasibleRule, defeasible_rules)
+        rule_list.append(rule_class(
+            rule_id, {literals[antecedent_id]
+                      for antecedent_id in antecedent_ids},
+            literals[consequent_id]))
+    argumentation_system = ArgumentationSystem(
+        language={literal.s1: literal for literal in literals},
+        contraries_and_contradictories=contraries_and_contradictories,
+        strict_rules=strict_rules, defeasible_rules=defeasible_rules,
+        add_defeasible_rule_literals=False)
+    return IncompleteArgumentationTheory(
+        argumentation_system=argumentation_system,
+        queryables=[literals[literal_id] for literal_id in queryables],
+        knowledge_base_axioms=[literals[literal_id]
+                               for literal_id in axioms],
+        knowledge_base_ordinary_premises=[
+            literals[literal_id] for literal_id in ordinary_premises])
+
+
+def _label_compact_theory(compact_theory: CompactTheory) -> StabilityResult:
+    iat = from_compact_theory(compact_theory)
+    labels = SatisfiabilityLabeler().solve_stability(iat)
+    compiled = iat.argumentation_system.compiled
+    LabelPropagator(compiled, literal_properties(iat, compiled),
+                    labels).propagate()
+    return labels.to_stability_result()
+
+
+def solve_stability_in_parallel(iat: IncompleteArgumentationTheory,
+                                max_workers: Optional[int] = None) -> \
+        StabilityResult:
+    """
+    Label the weakly connected components of the theory in a process pool
+    and merge the results. Components are grouped into a few sub-theories per
+    worker, so that small components do not each cost a task. A theory that
+    is a single sub-theory is labeled in this process.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    sub_theories = compact_sub_theories(iat, 4 * max_workers)
+    if len(sub_theories) == 1:
+        # Nothing to label in parallel. Imported here, as the
+        # StabilityLabeler labels in parallel by this module.
+        from .stability_labeler import StabilityLabeler
+        return StabilityLabeler().solve_stability(iat)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        stability_result = StabilityResult()
+        for sub_result in executor.map(_label_compact_theory, sub_theories):
+            stability_result.stable_unsatisfiable |= \
+                sub_result.stable_unsatisfiable
+            stability_result.stable_defended |= sub_result.stable_defended
+            stability_result.stable_out |= sub_result.stable_out
+            stability_result.stable_blocked |= sub_result.stable_blocked
+    return stability_result
@@ -0,0 +1,298 @@
+from collections import deque
+from typing import List, Optional, Set, Tuple
+
+from .label_propagation import literal_properties, AXIOM, \
+    OBSERVED_CONTRARY, QUERYABLE
+from .packed_stability_labels import PackedStabilityLabels, BLOCKED, \
+    DEFENDED, OUT, UNSATISFIABLE
+from .satisfiability_labeler import SatisfiabilityLabeler
+from ...classes.compiled_argumentation_system import \
+    CompiledArgumentationSystem
+from ...classes.incomplete_argumentation_theory import \
+    IncompleteArgumentationTheory
+
+
+def contraries_of_heads(compiled: CompiledArgumentationSystem) -> \
+        List[List[int]]:
+    """
+    For each rule, get the literals that defeat it if they are observed: the
+    contraries of its consequent, or of the consequents of all rules that
+    share its identifier, as these are treated as one rule with several
+    heads. Strict rules cannot be defeated.
+    """
+    heads_by_str = dict()
+    for rule_id, rule in enumerate(compiled.rules):
+        if not compiled.is_strict(rule_id):
+            heads_by_str.setdefault(rule.id, []).append(
+                compiled.rule_consequents[rule_id])
+    return [sorted({contrary_id for head_id in heads_by_str[rule.id]
+                    for contrary_id in compiled.contraries(head_id)})
+            if not compiled.is_strict(rule_id) else []
+            for rule_id, rule in enumerate(compiled.rules)]
+
+
+def rule_attackers(iat: IncompleteArgumentationTheory,
+                   with_preferences: bool = True) -> List[List[int]]:
+    """
+    For each rule, get the rules that defeat it if they are not defeated
+    themselves: the rules for a contrary of its consequent that are not
+    strictly less preferred. As in grounded_stability_with_preferences.dl,
+    preferred(a, b) (the tuple (a, b) of the PreferencePreorder) means that
+    b is at least as preferred as a, and rules that share an identifier are
+    treated as one rule with several heads. Strict rules cannot be attacked,
+    and defeat each defeasible rule that they attack. Without preferences,
+    every rule for a contrary of its consequent is an attacker.
+    """
+    compiled = iat.argumentation_system.compiled
+    preferred = {(rule_a.id, rule_b.id) for rule_a, rule_b in
+                 iat.argumentation_system.rule_preferences.preference_tuples}
+
+    def strictly_less_preferred(rule_a_str: str, rule_b_str: str) -> bool:
+        return (rule_b_str, rule_a_str) in preferred and \
+            (rule_a_str, rule_b_str) not in preferred
+
+    return [sorted({
+        attacker_id
+        for contrary_id in rule_contrary_ids
+        for attacker_id in compiled.rules_for(contrary_id)
+        if compiled.is_strict(attacker_id) or not with_preferences or
+        not strictly_less_preferred(
+            compiled.rules[attacker_id].id, compiled.rules[rule_id].id)})
+        for rule_id, rule_contrary_ids in
+        enumerate(contraries_of_heads(compiled))]
+
+
+class PreferenceStabilityLabeler:
+    """
+    The PreferenceStabilityLabeler is a sound approximation of the
+    GroundedStabilitySolver with preferences. There, a rule is defeated by
+    an observed contrary of its consequent, or by a rule for such a contrary
+    that is not strictly less preferred. A literal is defended if it is
+    observed or concluded by a rule in the grounded extension, out if every
+    rule-based argument for it is defeated by the grounded extension, and
+    blocked otherwise.
+
+    Unlike the StabilityLabeler, rules are labeled with the status of the
+    arguments that have them as last rule, so that the defeats (which differ
+    per rule once there are preferences) are taken into account per rule.
+    Starting from the SatisfiabilityLabeler, the conditions below remove the
+    statuses that a literal or rule cannot get in any future, until no label
+    changes anymore.
+    """
+
+    def __init__(self):
+        pass
+
+    def solve_stability(self, iat: IncompleteArgumentationTheory) -> \
+            PackedStabilityLabels:
+        compiled = iat.argumentation_system.compiled
+        labels = SatisfiabilityLabeler().solve_stability(iat)
+        PreferenceLabelPropagator(
+            compiled, literal_properties(iat, compiled), labels,
+            rule_attackers(iat)).propagate()
+        return labels
+
+
+class PreferenceLabelPropagator:
+    """
+    A PreferenceLabelPropagator applies the labeling conditions of the
+    PreferenceStabilityLabeler to the initial labels (from the
+    SatisfiabilityLabeler or label_derivable), given the property flags of
+    the literals and the attackers of each rule (from rule_attackers), until
+    no label changes anymore. A literal or rule is evaluated again each time
+    the label of a child changes.
+
+    As for the LabelPropagator, if trail is set to a list, each label change
+    is recorded in it as the literal (by its id) or rule (by ~id) with its
+    old label, so that undo can restore the labels of an earlier state.
+    """
+
+    def __init__(self, compiled: CompiledArgumentationSystem,
+                 properties: bytearray, labels: PackedStabilityLabels,
+                 attackers: List[List[int]]):
+        self.compiled = compiled
+        self.properties = properties
+        self.literal_labels = labels.literal_labels
+        self.rule_labels = labels.rule_labels
+        self.attackers = attackers
+        self.trail: Optional[List[Tuple[int, int]]] = None
+
+        self._attacked_rules = [[] for _ in range(compiled.nr_of_rules)]
+        for rule_id, rule_attacker_ids in enumerate(attackers):
+            for attacker_id in rule_attacker_ids:
+                self._attacked_rules[attacker_id].append(rule_id)
+        self._contraries_of_heads = contraries_of_heads(compiled)
+
+        # Literals are queued by their id, rules by ~id (so as negatives).
+        self._queue = deque(range(compiled.nr_of_literals))
+        self._queue.extend(~rule_id for rule_id in range(compiled.nr_of_rules))
+        self._queued_literals = bytearray([1]) * compiled.nr_of_literals
+        self._queued_rules = bytearray([1]) * compiled.nr_of_rules
+
+    def _evaluate_literal(self, literal_id: int) -> int:
+        literal_label = self.literal_labels[literal_id]
+        literal_properties_ = self.properties[literal_id]
+        child_labels = [self.rule_labels[rule_id]
+                        for rule_id in self.compiled.rules_for(literal_id)]
+        observed = literal_properties_ & AXIOM
+        possibly_observed = literal_properties_ & QUERYABLE and \
+            not literal_properties_ & OBSERVED_CONTRARY
+
+        if observed or any(not child_label & UNSATISFIABLE
+                           for child_label in child_labels):
+            # The literal is observed or has a rule that is derivable in
+            # each future, so it cannot be unsatisfiable.
+            literal_label &= ~UNSATISFIABLE
+        if not possibly_observed and not any(
+                child_label & DEFENDED for child_label in child_labels):
+            # The literal cannot be observed and no rule for it can be
+            # in the grounded extension, so it cannot be defended.
+            literal_label &= ~DEFENDED
+        if observed or not any(child_label & OUT
+                               for child_label in child_labels) or \
+                any(not child_label & (UNSATISFIABLE | OUT)
+                    for child_label in child_labels):
+            # Observed literals are defended; otherwise the literal can
+            # only be out if all its rules can be out.
+            literal_label &= ~OUT
+        if observed or not any(child_label & BLOCKED
+                               for child_label in child_labels) or \
+                any(child_label == DEFENDED
+                    for child_label in child_labels):
+            # A blocked literal is not observed and has a blocked rule,
+            # but no rule in the grounded extension.
+            literal_label &= ~BLOCKED
+        return literal_label
+
+    def _evaluate_rule(self, rule_id: int) -> int:
+        properties = self.properties
+        rule_label = self.rule_labels[rule_id]
+        antecedent_labels = [self.literal_labels[antecedent_id]
+                             for antecedent_id in
+                             self.compiled.antecedents(rule_id)]
+        attacker_labels = [self.rule_labels[attacker_id]
+                           for attacker_id in self.attackers[rule_id]]
+        observed_attack = any(properties[contrary_id] & AXIOM
+                              for contrary_id in
+                              self._contraries_of_heads[rule_id])
+        possibly_observed_attack = any(
+            properties[contrary_id] & QUERYABLE and
+            not properties[contrary_id] & OBSERVED_CONTRARY
+            for contrary_id in self._contraries_of_heads[rule_id])
+
+        if not any(antecedent_label & UNSATISFIABLE
+                   for antecedent_label in antecedent_labels):
+            # All antecedents are derivable in each future.
+            rule_label &= ~UNSATISFIABLE
+        if observed_attack or any(
+                not antecedent_label & DEFENDED
+                for antecedent_label in antecedent_labels) or any(
+                not attacker_label & (UNSATISFIABLE | OUT)
+                for attacker_label in attacker_labels):
+            # The rule is defeated by an observed literal or by an
+            # undefeated attacker, or some antecedent cannot be defended.
+            rule_label &= ~DEFENDED
+        if not possibly_observed_attack and not any(
+                antecedent_label & OUT
+                for antecedent_label in antecedent_labels) and not any(
+                attacker_label & DEFENDED
+                for attacker_label in attacker_labels):
+            # The rule can only be out if some antecedent can be out or
+            # if it can be defeated by the grounded extension.
+            rule_label &= ~OUT
+        if observed_attack or any(
+                not antecedent_label & (DEFENDED | BLOCKED)
+                for antecedent_label in antecedent_labels) or any(
+                attacker_label == DEFENDED
+                for attacker_label in attacker_labels) or not any(
+                label & BLOCKED
+                for label in antecedent_labels + attacker_labels):
+            # A blocked rule is not defeated by the grounded extension,
+            # its antecedents are defended or blocked and some
+            # antecedent or attacker is blocked.
+            rule_label &= ~BLOCKED
+        return rule_label
+
+    def reevaluate_literal(self, literal_id: int):
+        """
+        Apply the conditions to the literal again, for instance because its
+        properties changed. The rules that it defeats if it is observed
+        should be evaluated again as well.
+        """
+        if not self._queued_literals[literal_id]:
+            self._queued_literals[literal_id] = 1
+            self._queue.append(literal_id)
+
+    def reevaluate_rule(self, rule_id: int):
+        if not self._queued_rules[rule_id]:
+            self._queued_rules[rule_id] = 1
+            self._queue.append(~rule_id)
+
+    def restrict_literal(self, literal_id: int, flags: int):
+        """
+        Remove all flags but the given ones from the label of the literal.
+        """
+        self._set_literal_label(literal_id,
+                                self.literal_labels[literal_id] & flags)
+
+    def restrict_rule(self, rule_id: int, flags: int):
+        """
+        Remove all flags but the given ones from the label of the rule.
+        """
+        self._set_rule_label(rule_id, self.rule_labels[rule_id] & flags)
+
+    def _set_literal_label(self, literal_id: int, literal_label: int) -> \
+            bool:
+        old_label = self.literal_labels[literal_id]
+        if literal_label == old_label:
+            return False
+        self.literal_labels[literal_id] = literal_label
+        if self.trail is not None:
+            self.trail.append((literal_id, old_label))
+        for rule_id in self.compiled.rules_using(literal_id):
+            self.reevaluate_rule(rule_id)
+        return True
+
+    def _set_rule_label(self, rule_id: int, rule_label: int):
+        old_label = self.rule_labels[rule_id]
+        if rule_label == old_label:
+            return
+        self.rule_labels[rule_id] = rule_label
+        if self.trail is not None:
+            self.trail.append((~rule_id, old_label))
+        self.reevaluate_literal(self.compiled.rule_consequents[rule_id])
+        for attacked_rule_id in self._attacked_rules[rule_id]:
+            self.reevaluate_rule(attacked_rule_id)
+
+    def propagate(self) -> Set[int]:
+        """
+        Evaluate the queued literals and rules until no label changes
+        anymore. Returns the ids of the literals whose label changed.
+        """
+        changed_literal_ids = set()
+        queue = self._queue
+        while queue:
+            node = queue.popleft()
+            if node >= 0:
+                self._queued_literals[node] = 0
+                if self._set_literal_label(node,
+                                           self._evaluate_literal(node)):
+                    changed_literal_ids.add(node)
+            else:
+                rule_id = ~node
+                self._queued_rules[rule_id] = 0
+                self._set_rule_label(rule_id, self._evaluate_rule(rule_id))
+        return changed_literal_ids
+
+    def undo(self, trail_length: int):
+        """
+        Restore the labels to the state in which the trail had the given
+        length. Nothing may be queued.
+        """
+        trail = self.trail
+        while len(trail) > trail_length:
+            node, old_label = trail.pop()
+            if node >= 0:
+                self.literal_labels[node] = old_label
+            else:
+                self.rule_labels[~node] = old_label
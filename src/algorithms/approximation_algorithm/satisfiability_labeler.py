@@ -1,50 +1,156 @@
-from .stability_label import StabilityLabel
-from .stability_labels import StabilityLabels
+from collections import deque
+from typing import Iterable, List, Optional, Tuple
+
+from .label_propagation import OBSERVED_CONTRARY, QUERYABLE
+from .labeling_statistics import LabelingStatistics
+from .packed_stability_labels import PackedStabilityLabels, ALL_STATUSES, \
+    UNSATISFIABLE
+from ...classes.compiled_argumentation_system import \
+    CompiledArgumentationSystem
 from ...classes.incomplete_argumentation_theory import \
     IncompleteArgumentationTheory
 
 
+def label_derivable(compiled: CompiledArgumentationSystem,
+                    labels: PackedStabilityLabels,
+                    initially_derived: Iterable[int]):
+    """
+    Label the literals and rules that can be derived from the initially
+    derived literals with ALL_STATUSES, and all others with UNSATISFIABLE.
+    """
+    literal_labels = labels.literal_labels
+    rule_labels = labels.rule_labels
+    rule_labels[:] = bytes([UNSATISFIABLE]) * compiled.nr_of_rules
+    literal_labels[:] = bytes([UNSATISFIABLE]) * compiled.nr_of_literals
+
+    newly_derived = deque()
+
+    def derive(derived_id: int):
+        if literal_labels[derived_id] != ALL_STATUSES:
+            literal_labels[derived_id] = ALL_STATUSES
+            newly_derived.append(derived_id)
+            # Literals that strictly follow from this one are looked up in
+            # the strict closure index.
+            for implied_id in compiled.strict_closure(derived_id):
+                if literal_labels[implied_id] != ALL_STATUSES:
+                    literal_labels[implied_id] = ALL_STATUSES
+                    newly_derived.append(implied_id)
+
+    for literal_id in initially_derived:
+        derive(literal_id)
+
+    antecedent_offsets = compiled.rule_antecedent_offsets
+    nr_of_antecedents_left = [
+        antecedent_offsets[rule_id + 1] - antecedent_offsets[rule_id]
+        for rule_id in range(compiled.nr_of_rules)]
+
+    def fire(fired_rule_id: int):
+        rule_labels[fired_rule_id] = ALL_STATUSES
+        derive(compiled.rule_consequents[fired_rule_id])
+
+    for rule_id, nr_left in enumerate(nr_of_antecedents_left):
+        if nr_left == 0:
+            fire(rule_id)
+    while newly_derived:
+        literal_id = newly_derived.popleft()
+        for rule_id in compiled.rules_using(literal_id):
+            nr_of_antecedents_left[rule_id] -= 1
+            if nr_of_antecedents_left[rule_id] == 0:
+                fire(rule_id)
+
+
+def update_derivable(compiled: CompiledArgumentationSystem,
+                     properties: bytearray, derivable_literals: bytearray,
+                     derivable_rules: bytearray,
+                     literal_ids: Iterable[int]) -> \
+        Tuple[List[int], List[int]]:
+    """
+    Update which literals and rules are derivable (from the queryables
+    without an observed contrary, given the property flags) after the given
+    literals may no longer be assumed. This is done by first removing
+    everything that was derived from them and then deriving again what still
+    has another derivation. Returns the literals and the rules that are no
+    longer derivable.
+    """
+    def is_assumable(literal_id):
+        return properties[literal_id] & \
+            (QUERYABLE | OBSERVED_CONTRARY) == QUERYABLE
+
+    # Remove everything that may have been derived from the literals
+    removed_literal_ids = []
+    removed_rule_ids = []
+    to_remove = [literal_id for literal_id in literal_ids
+                 if derivable_literals[literal_id] and
+                 not is_assumable(literal_id)]
+    for literal_id in to_remove:
+        derivable_literals[literal_id] = 0
+    while to_remove:
+        literal_id = to_remove.pop()
+        removed_literal_ids.append(literal_id)
+        for rule_id in compiled.rules_using(literal_id):
+            if derivable_rules[rule_id]:
+                derivable_rules[rule_id] = 0
+                removed_rule_ids.append(rule_id)
+                consequent_id = compiled.rule_consequents[rule_id]
+                if derivable_literals[consequent_id]:
+                    derivable_literals[consequent_id] = 0
+                    to_remove.append(consequent_id)
+    if not removed_literal_ids:
+        return [], []
+
+    # Derive again what can still be derived
+    to_derive = []
+    for literal_id in removed_literal_ids:
+        if is_assumable(literal_id) or any(
+                derivable_rules[rule_id]
+                for rule_id in compiled.rules_for(literal_id)):
+            derivable_literals[literal_id] = 1
+            to_derive.append(literal_id)
+    while to_derive:
+        literal_id = to_derive.pop()
+        for rule_id in compiled.rules_using(literal_id):
+            if not derivable_rules[rule_id] and all(
+                    derivable_literals[antecedent_id]
+                    for antecedent_id in compiled.antecedents(rule_id)):
+                derivable_rules[rule_id] = 1
+                consequent_id = compiled.rule_consequents[rule_id]
+                if not derivable_literals[consequent_id]:
+                    derivable_literals[consequent_id] = 1
+                    to_derive.append(consequent_id)
+
+    return [literal_id for literal_id in removed_literal_ids
+            if not derivable_literals[literal_id]], \
+        [rule_id for rule_id in removed_rule_ids
+         if not derivable_rules[rule_id]]
+
+
 class SatisfiabilityLabeler:
+    """
+    The SatisfiabilityLabeler gives the initial labeling: literals and rules
+    that can be derived (from queryables without an observed contrary) can
+    still have any status, while all others can only be unsatisfiable.
+
+    Derivations are found by forward chaining: each rule counts its
+    antecedents that are not derived yet and fires once this reaches zero,
+    so each rule fires exactly once. Strict rules are fired like defeasible
+    rules, but the literals that strictly follow from a single derived
+    literal are taken from the strict closure index right away.
+    """
+
     def __init__(self):
         pass
 
-    @staticmethod
-    def _preprocess_visit(rule, labels):
-        if labels.rule_labeling[rule].defended:
-            return False
-        if all([labels.literal_labeling[literal].defended
-                for literal in rule.antecedents]):
-            labels.rule_labeling[rule] = StabilityLabel(True, True, True, True)
-            labels.literal_labeling[rule.consequent] = StabilityLabel(
-                True, True, True, True)
-            return True
-        return False
-
-    def solve_stability(self, iat: IncompleteArgumentationTheory) -> \
-            StabilityLabels:
-        labels = StabilityLabels(dict(), dict())
-
-        for literal in iat.argumentation_system.\
-                language.values():
-            if iat.is_queryable(literal) and \
-                    all([contrary not in iat.knowledge_base
-                        for contrary in
-                         literal.contraries_and_contradictories]):
-                labels.literal_labeling[literal] = StabilityLabel(
-                    True, True, True, True)
-            else:
-                labels.literal_labeling[literal] = StabilityLabel(
-                    True, False, False, False)
-
-        for rule in iat.argumentation_system.defeasible_rules:
-            labels.rule_labeling[rule] = StabilityLabel(
-                True, False, False, False)
-
-        label_added = True
-        while label_added:
-            label_added = False
-            for rule in iat.argumentation_system.defeasible_rules:
-                label_added = \
-                    self._preprocess_visit(rule, labels) or label_added
+    def solve_stability(
+            self, iat: IncompleteArgumentationTheory,
+            statistics: Optional[LabelingStatistics] = None) -> \
+            PackedStabilityLabels:
+        compiled = iat.argumentation_system.compiled
+        labels = PackedStabilityLabels(compiled)
+        label_derivable(compiled, labels, [
+            literal_id for literal_id, literal in enumerate(compiled.literals)
+            if iat.is_queryable(literal) and
+            not iat.has_observed_contrary(literal)])
 
+        if statistics is not None:
+            statistics.record_satisfiability(compiled, labels)
         return labels
@@ -1,9 +1,6 @@
-from distutils.util import strtobool
-
-from parse import parse
-
-
 class StabilityLabel:
+    __slots__ = ('unsatisfiable', 'defended', 'out', 'blocked')
+
     def __init__(self, unsatisfiable: bool, defended: bool, out: bool,
                  blocked: bool):
         self.unsatisfiable = unsatisfiable
@@ -72,7 +69,20 @@ class StabilityLabel:
 
     @classmethod
     def from_str(cls, label_str: str):
+        # Imported here, so that only parsing labels depends on parse.
+        from parse import parse
+
         parse_result_str_list = parse(
             '(U:{0}, D:{1}, O:{2}, B:{3})', label_str).fixed
-        parse_result_bool_list = [strtobool(s) for s in parse_result_str_list]
+        parse_result_bool_list = [_str_to_bool(s)
+                                  for s in parse_result_str_list]
         return StabilityLabel(*parse_result_bool_list)
+
+
+def _str_to_bool(value: str) -> bool:
+    value = value.strip().lower()
+    if value in ('y', 'yes', 't', 'true', 'on', '1'):
+        return True
+    if value in ('n', 'no', 'f', 'false', 'off', '0'):
+        return False
+    raise ValueError(f'Invalid truth value {value}.')
@@ -0,0 +1,150 @@
+import hashlib
+import os
+import tempfile
+import time
+from typing import List, Sequence, Union
+
+# Part of each fingerprint, so that changing the way programs are cached
+# invalidates all cached programs.
+CACHE_FORMAT_VERSION = 1
+CACHE_FILE_SUFFIX = '.aspif'
+TEMPORARY_FILE_SUFFIX = '.tmp'
+
+
+def theory_fingerprint(lp_str: str, encoding_paths: Sequence[str]) -> str:
+    """
+    Fingerprint of the ground program of a theory (without axioms) and a set
+    of encodings. The facts of the theory are sorted, so the order in which
+    they are given does not matter, and topics are left out, as they are not
+    used by the encodings. The encodings are included by their content, so
+    that a changed encoding gives a different fingerprint.
+    """
+    import clingo
+
+    fingerprint = hashlib.sha256()
+    fingerprint.update(f'{CACHE_FORMAT_VERSION} {clingo.__version__}\n'
+                       .encode())
+    for encoding_path in encoding_paths:
+        with open(encoding_path, 'rb') as encoding_file:
+            fingerprint.update(os.path.basename(encoding_path).encode())
+            fingerprint.update(encoding_file.read())
+    for fact in sorted(line.strip() for line in lp_str.splitlines()
+                       if line.strip() and not line.startswith('topic')):
+        fingerprint.update(fact.encode() + b'\n')
+    return fingerprint.hexdigest()
+
+
+class GroundProgramCache:
+    """
+    A GroundProgramCache stores ground programs in aspif, in files in a
+    directory that are named by the fingerprint of the theory and the
+    encodings. On a hit, the ground program is loaded instead of grounding
+    the encodings again.
+
+    The cache can be shared by processes: a program is written to a
+    temporary file and then moved into place, so that other processes see
+    either the complete program or none at all. The modification time of a
+    file is its last use; if the files together are larger than max_bytes,
+    the least recently used ones are removed. Temporary files count towards
+    max_bytes as well; those that have not changed for stale_seconds are
+    left by writers that crashed and are removed.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike],
+                 max_bytes: int = 1 << 30, stale_seconds: float = 3600):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stale_seconds = stale_seconds
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, fingerprint: str) -> str:
+        return os.path.join(self.directory, fingerprint + CACHE_FILE_SUFFIX)
+
+    def control(self, lp_str: str, encoding_paths: Sequence[str],
+                arguments: List[str]):
+        """
+        Get a ground clingo control for the theory and the encodings, from
+        the cache if possible.
+        """
+        import clingo
+
+        path = self.path(theory_fingerprint(lp_str, encoding_paths))
+        if not os.path.exists(path):
+            self._store(lp_str, encoding_paths, path)
+
+        control = clingo.Control(arguments=arguments)
+        try:
+            # Mark the program as recently used
+            os.utime(path)
+            control.load(path)
+        except (OSError, RuntimeError):
+            # Removed by another process since, so ground it here
+            control = clingo.Control(arguments=arguments)
+            control.add('base', [], lp_str)
+            for encoding_path in encoding_paths:
+                control.load(encoding_path)
+        control.ground([('base', [])])
+        return control
+
+    def _store(self, lp_str: str, encoding_paths: Sequence[str], path: str):
+        import clingo
+
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            suffix=TEMPORARY_FILE_SUFFIX, dir=self.directory)
+        os.close(file_descriptor)
+        try:
+            # The backend replaces the solver, so solving only completes the
+            # ground program in the file.
+            control = clingo.Control()
+            control.register_backend(clingo.BackendType.Aspif,
+                                     temporary_path, replace=True)
+            control.add('base', [], lp_str)
+            for encoding_path in encoding_paths:
+                control.load(encoding_path)
+            control.ground([('base', [])])
+            control.solve()
+            del control
+            os.replace(temporary_path, path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+        self.evict()
+
+    def evict(self):
+        """
+        Remove the stale temporary files, and then the least recently used
+        programs until the programs and temporary files together are at most
+        max_bytes.
+        """
+        cached_files = []
+        temporary_size = 0
+        stale_time = time.time() - self.stale_seconds
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                is_temporary = entry.name.endswith(TEMPORARY_FILE_SUFFIX)
+                if not is_temporary and \
+                        not entry.name.endswith(CACHE_FILE_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                    if is_temporary and stat.st_mtime < stale_time:
+                        os.remove(entry.path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if is_temporary:
+                    temporary_size += stat.st_size
+                else:
+                    cached_files.append(
+                        (stat.st_mtime, stat.st_size, entry.path))
+        total_size = temporary_size + \
+            sum(size for _, size, _ in cached_files)
+        for _, size, cached_path in sorted(cached_files):
+            if total_size <= self.max_bytes:
+                break
+            try:
+                os.remove(cached_path)
+            except FileNotFoundError:
+                # Removed by another process
+                pass
+            total_size -= size
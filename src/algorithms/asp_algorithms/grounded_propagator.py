@@ -0,0 +1,842 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..approximation_algorithm.label_propagation import LabelPropagator, \
+    QUERYABLE, OBSERVED_CONTRARY, assignment_property_flags
+from ..approximation_algorithm.packed_stability_labels import \
+    PackedStabilityLabels, BLOCKED, DEFENDED, OUT, UNSATISFIABLE
+from ..approximation_algorithm.preference_stability_labeler import \
+    PreferenceLabelPropagator, contraries_of_heads, rule_attackers
+from ..approximation_algorithm.satisfiability_labeler import \
+    label_derivable, update_derivable
+from ..bitset_stability_result import STATUSES
+from ...classes.incomplete_argumentation_theory import \
+    IncompleteArgumentationTheory
+
+STATUS_FLAGS = dict(zip(STATUSES, (UNSATISFIABLE, DEFENDED, OUT, BLOCKED)))
+
+
+class GroundedPropagator:
+    """
+    A GroundedPropagator is a clingo propagator that replaces the grounded
+    stability encodings: the program only guesses the axioms (guess.dl or
+    relevance_externals.dl) and chooses the status of each literal
+    (grounded_propagator.dl), so that it is linear in the theory.
+
+    While the axioms are assigned, the propagator keeps the literals that
+    are derivable from the true axioms in any case, with a counter of the
+    antecedents that are still missing for each rule. Such literals are not
+    unsatisfiable. It also keeps the labels of the StabilityLabeler (or the
+    PreferenceStabilityLabeler) of the partial assignment, with the
+    unassigned axioms as queryables. An assigned axiom only changes the
+    properties of the literals around it, so the labels are updated from
+    there: literals that can no longer be assumed may no longer be
+    derivable, and the label drops are propagated. Statuses that a literal
+    cannot get anymore are false, and a status that is the only one left is
+    true. All of this is undone when the solver backtracks. Once all axioms
+    are assigned, the statuses are computed exactly, as in
+    grounded_stability.dl or grounded_stability_with_preferences.dl (see
+    GroundedFixpoint).
+
+    Each solver thread has its own state of the search.
+    """
+
+    def __init__(self, iat: IncompleteArgumentationTheory,
+                 with_preferences: bool = False):
+        compiled = iat.argumentation_system.compiled
+        self.compiled = compiled
+        self.with_preferences = with_preferences
+        self.attackers = rule_attackers(iat, with_preferences)
+        self.literal_ids = {literal_name.lower(): literal_id
+                            for literal_id, literal_name in
+                            enumerate(compiled.literal_names)}
+
+        # Literals that defeat the rule if they are axioms, for each
+        # defeasible rule (rules that share an identifier share these).
+        self.contraries_of_heads = contraries_of_heads(compiled)
+        self.nr_of_antecedents = [len(compiled.antecedents(rule_id))
+                                  for rule_id in range(compiled.nr_of_rules)]
+        # The rules that each literal defeats if it is an axiom, and the
+        # rules that each rule attacks.
+        self.defeated_rules: List[List[int]] = \
+            [[] for _ in range(compiled.nr_of_literals)]
+        self.attacked_rules: List[List[int]] = \
+            [[] for _ in range(compiled.nr_of_rules)]
+        for rule_id in range(compiled.nr_of_rules):
+            for contrary_id in self.contraries_of_heads[rule_id]:
+                self.defeated_rules[contrary_id].append(rule_id)
+            for attacker_id in self.attackers[rule_id]:
+                self.attacked_rules[attacker_id].append(rule_id)
+        # As in grounded_stability_with_preferences.dl
+        self.max_iterations = (len({
+            rule.id for rule_id, rule in enumerate(compiled.rules)
+            if not compiled.is_strict(rule_id)}) + 1) // 2
+
+        # Cones of the literals, without and with the contraries (see
+        # _label_cone), computed when they are first needed
+        self._cones: Dict[int, List[int]] = dict()
+        self._label_cones: Dict[int, List[int]] = dict()
+
+        # Solver literals of the axiom/1 atoms that are not fixed, and the
+        # literal id and value of each watched solver literal.
+        self._axiom_literals: List[Tuple[int, int]] = []
+        self._axiom_solver_literals: Dict[int, int] = dict()
+        self._watched: Dict[int, Tuple[int, bool]] = dict()
+        # Solver literal of each status/1 atom, per status and literal id.
+        self._status_literals: Dict[str, Dict[int, int]] = dict()
+        # The state of the search of each solver thread
+        self._states: List[SearchState] = []
+
+    def init(self, init):
+        # Imported here, so that importing this module stays cheap.
+        import clingo
+
+        init.check_mode = clingo.PropagatorCheckMode.Both
+        nr_of_literals = self.compiled.nr_of_literals
+        self._axiom_literals = []
+        self._watched = dict()
+        # The queryables (unassigned and true axiom/1 atoms) and axioms
+        queryables = bytearray(nr_of_literals)
+        axioms = bytearray(nr_of_literals)
+        for atom in init.symbolic_atoms.by_signature('axiom', 1):
+            literal_id = self.literal_ids[atom.symbol.arguments[0].name]
+            solver_literal = init.solver_literal(atom.literal)
+            if init.assignment.is_true(solver_literal):
+                queryables[literal_id] = axioms[literal_id] = 1
+            elif not init.assignment.is_false(solver_literal):
+                self._axiom_literals.append((literal_id, solver_literal))
+                queryables[literal_id] = 1
+                for watched_literal, value in [(solver_literal, True),
+                                               (-solver_literal, False)]:
+                    self._watched[watched_literal] = (literal_id, value)
+                    init.add_watch(watched_literal)
+        self._axiom_solver_literals = dict(self._axiom_literals)
+        self._label_cones = dict()
+
+        for status in STATUSES:
+            self._status_literals[status] = {
+                self.literal_ids[atom.symbol.arguments[0].name]:
+                    init.solver_literal(atom.literal)
+                for atom in init.symbolic_atoms.by_signature(status, 1)}
+
+        self._states = [
+            SearchState(self, queryables, axioms, len(self._axiom_literals))
+            for _ in range(init.number_of_threads)]
+        self._add_fixed_statuses(init)
+
+    def propagate(self, control, changes):
+        state = self._states[control.thread_id]
+        decision_level = state.decision_level(
+            control.assignment.decision_level)
+        first_derived = len(decision_level.derived_ids)
+        changed_literal_ids = state.assign(
+            [self._watched[solver_literal] for solver_literal in changes],
+            decision_level)
+
+        # Literals that are derivable in any case are not unsatisfiable
+        unsatisfiable_literals = self._status_literals['unsatisfiable']
+        for literal_id in decision_level.derived_ids[first_derived:]:
+            if literal_id not in unsatisfiable_literals:
+                continue
+            status_literal = unsatisfiable_literals[literal_id]
+            if control.assignment.is_false(status_literal):
+                continue
+            clause = self._reason_clause(
+                state, state.derivation_axioms(literal_id)) + \
+                [-status_literal]
+            if not control.add_clause(clause) or \
+                    not control.propagate():
+                return
+
+        self._propagate_labels(control, state, sorted(changed_literal_ids))
+
+    def undo(self, thread_id, assignment, changes):
+        self._states[thread_id].undo()
+
+    def check(self, control):
+        state = self._states[control.thread_id]
+        if not state.nr_unassigned:
+            self._enforce_statuses(control, state)
+
+    def cone(self, literal_id: int) -> List[int]:
+        """
+        Get the literals whose axioms can change the status of the literal:
+        the literal and, for each literal in the cone, the antecedents of its
+        rules and the contraries of their heads.
+        """
+        if literal_id not in self._cones:
+            compiled = self.compiled
+            in_cone = {literal_id}
+            stack = [literal_id]
+            while stack:
+                cone_literal_id = stack.pop()
+                for rule_id in compiled.rules_for(cone_literal_id):
+                    for other_id in list(compiled.antecedents(rule_id)) + \
+                            self.contraries_of_heads[rule_id]:
+                        if other_id not in in_cone:
+                            in_cone.add(other_id)
+                            stack.append(other_id)
+            self._cones[literal_id] = sorted(in_cone)
+        return self._cones[literal_id]
+
+    def statuses(self, axioms: bytearray) -> Dict[str, bytearray]:
+        """
+        Get, for each status, whether each literal has it in the grounded
+        extension of the theory with the given axioms.
+        """
+        return GroundedFixpoint(self, axioms).statuses()
+
+    def _reason_clause(self, state: 'SearchState',
+                       literal_ids: Iterable[int]) -> List[int]:
+        """
+        Get the negation of the assigned axiom/1 atoms of the literals, to
+        use as the reason of a clause.
+        """
+        clause = []
+        for literal_id in literal_ids:
+            solver_literal = self._axiom_solver_literals.get(literal_id)
+            if solver_literal is None:
+                continue
+            if state.axioms[literal_id]:
+                clause.append(-solver_literal)
+            elif not state.queryables[literal_id]:
+                clause.append(solver_literal)
+        return clause
+
+    def _add_fixed_statuses(self, init):
+        """
+        Add the statuses that each literal has (or not) for every assignment
+        of the axioms: a status that is not in its label, or its only one.
+        """
+        literal_labels = self._states[0].literal_labels
+        for status in STATUSES:
+            status_flag = STATUS_FLAGS[status]
+            for literal_id, status_literal in \
+                    self._status_literals[status].items():
+                literal_label = literal_labels[literal_id]
+                if not literal_label & status_flag:
+                    clause = [-status_literal]
+                elif literal_label == status_flag:
+                    clause = [status_literal]
+                else:
+                    continue
+                if not init.add_clause(clause):
+                    return
+
+    def _label_cone(self, literal_id: int) -> List[int]:
+        """
+        Get the cone of the literal, extended with the contraries of the
+        literals in it, on which the labels of the literal also depend. Only
+        the literals whose axiom/1 atom is not fixed are kept.
+        """
+        if literal_id not in self._label_cones:
+            compiled = self.compiled
+            in_cone = {literal_id}
+            stack = [literal_id]
+            while stack:
+                cone_literal_id = stack.pop()
+                other_ids = list(compiled.contraries(cone_literal_id))
+                for rule_id in compiled.rules_for(cone_literal_id):
+                    other_ids.extend(compiled.antecedents(rule_id))
+                    other_ids.extend(self.contraries_of_heads[rule_id])
+                for other_id in other_ids:
+                    if other_id not in in_cone:
+                        in_cone.add(other_id)
+                        stack.append(other_id)
+            self._label_cones[literal_id] = sorted(
+                in_cone.intersection(self._axiom_solver_literals))
+        return self._label_cones[literal_id]
+
+    def _propagate_labels(self, control, state: 'SearchState',
+                          literal_ids: Iterable[int]):
+        """
+        Add the statuses that the labels of the partial assignment imply
+        for the literals (whose labels changed).
+        """
+        assignment = control.assignment
+        for literal_id in literal_ids:
+            literal_label = state.literal_labels[literal_id]
+            for status in STATUSES:
+                status_literal = \
+                    self._status_literals[status].get(literal_id)
+                if status_literal is None:
+                    continue
+                status_flag = STATUS_FLAGS[status]
+                if not literal_label & status_flag:
+                    implied_literal = -status_literal
+                elif literal_label == status_flag:
+                    implied_literal = status_literal
+                else:
+                    continue
+                if assignment.is_true(implied_literal):
+                    continue
+                if not self._add_label_clause(control, state, literal_id,
+                                              implied_literal):
+                    return
+
+    def _add_label_clause(self, control, state: 'SearchState',
+                          literal_id: int, implied_literal: int) -> bool:
+        """
+        Add the clause that the labels imply the status literal of the
+        literal, with the assigned axioms in the label cone of the literal
+        as reason: the labels of the literal only depend on these. Returns
+        whether the propagation can go on.
+        """
+        clause = self._reason_clause(state, self._label_cone(literal_id)) + \
+            [implied_literal]
+        return control.add_clause(clause) and control.propagate()
+
+    def _enforce_statuses(self, control, state: 'SearchState'):
+        """
+        Add the exact statuses of the total assignment of the axioms. Each
+        literal has exactly one status (see grounded_propagator.dl), so the
+        other statuses follow.
+        """
+        assignment = control.assignment
+        if state.fixpoint is None:
+            state.fixpoint = GroundedFixpoint(self, bytearray(state.axioms))
+        statuses = state.fixpoint.statuses()
+        for status in STATUSES:
+            for literal_id, status_literal in \
+                    self._status_literals[status].items():
+                if not statuses[status][literal_id] or \
+                        assignment.is_true(status_literal):
+                    continue
+                clause = self._reason_clause(state, state.fixpoint.reason(
+                    literal_id, status, True)) + [status_literal]
+                if not control.add_clause(clause) or \
+                        not control.propagate():
+                    return
+
+
+class DecisionLevel:
+    """
+    The changes of a SearchState at a decision level: the axioms that were
+    assigned, the literals derived from them, the old property flags of the
+    literals whose flags changed, the literals and rules that are no longer
+    derivable, and the length of the trail of label drops before.
+    """
+
+    def __init__(self, level: int, trail_length: int):
+        self.level = level
+        self.assigned_ids: List[int] = []
+        self.derived_ids: List[int] = []
+        self.old_properties: List[Tuple[int, int]] = []
+        self.underivable_literal_ids: List[int] = []
+        self.underivable_rule_ids: List[int] = []
+        self.trail_length = trail_length
+
+
+class SearchState:
+    """
+    The SearchState of a solver thread of a GroundedPropagator: the
+    queryables (unassigned and true axiom/1 atoms) and axioms of its
+    current assignment, the literals that follow from the axioms (with the
+    rule that derived them first, or -1 for the axioms, and the number of
+    antecedents that each rule misses), the labels of the partial
+    assignment and the changes per decision level, to undo them.
+    """
+
+    def __init__(self, propagator: GroundedPropagator, queryables: bytearray,
+                 axioms: bytearray, nr_unassigned: int):
+        compiled = propagator.compiled
+        nr_of_literals = compiled.nr_of_literals
+        self.propagator = propagator
+        self.compiled = compiled
+        self.queryables = bytearray(queryables)
+        self.axioms = bytearray(axioms)
+        self.nr_unassigned = nr_unassigned
+        self.levels: List[DecisionLevel] = []
+        # The exact fixpoint of the current (total) assignment
+        self.fixpoint: Optional[GroundedFixpoint] = None
+
+        self.derived = bytearray(nr_of_literals)
+        self.support = [-1] * nr_of_literals
+        self.missing = list(propagator.nr_of_antecedents)
+        for literal_id in range(nr_of_literals):
+            if axioms[literal_id]:
+                self._derive_from(literal_id, -1, [])
+        for rule_id in range(compiled.nr_of_rules):
+            if not propagator.nr_of_antecedents[rule_id]:
+                self._derive_from(compiled.rule_consequents[rule_id],
+                                  rule_id, [])
+
+        # The number of contraries of each literal that are axioms
+        self.nr_of_observed_contraries = [0] * nr_of_literals
+        for literal_id in range(nr_of_literals):
+            if axioms[literal_id]:
+                for other_id in compiled.contrary_of(literal_id):
+                    self.nr_of_observed_contraries[other_id] += 1
+        self.properties = bytearray([
+            assignment_property_flags(
+                compiled, literal_id, queryables[literal_id],
+                axioms[literal_id], self.nr_of_observed_contraries)
+            for literal_id in range(nr_of_literals)])
+
+        labels = PackedStabilityLabels(compiled)
+        label_derivable(compiled, labels, (
+            literal_id for literal_id in range(nr_of_literals)
+            if self.properties[literal_id] & QUERYABLE and
+            not self.properties[literal_id] & OBSERVED_CONTRARY))
+        # label_derivable only keeps DEFENDED (and all other statuses) for
+        # literals and rules that can be derived.
+        self.derivable_literals = bytearray(
+            [bool(label & DEFENDED) for label in labels.literal_labels])
+        self.derivable_rules = bytearray(
+            [bool(label & DEFENDED) for label in labels.rule_labels])
+        if propagator.with_preferences:
+            self.label_propagator = PreferenceLabelPropagator(
+                compiled, self.properties, labels, propagator.attackers)
+        else:
+            self.label_propagator = LabelPropagator(
+                compiled, self.properties, labels)
+        self.label_propagator.propagate()
+        self.label_propagator.trail = []
+        self.literal_labels = labels.literal_labels
+
+    def decision_level(self, level: int) -> DecisionLevel:
+        """
+        Get the changes at the decision level, which is the current one.
+        """
+        if not self.levels or self.levels[-1].level != level:
+            self.levels.append(
+                DecisionLevel(level, len(self.label_propagator.trail)))
+        return self.levels[-1]
+
+    def assign(self, assignments: List[Tuple[int, bool]],
+               decision_level: DecisionLevel) -> Set[int]:
+        """
+        Assign the axiom/1 atoms of the literals (by id) at the current
+        decision level, and update the derived literals and the labels.
+        Returns the ids of the literals whose label changed.
+        """
+        compiled = self.compiled
+        propagator = self.propagator
+        label_propagator = self.label_propagator
+        # Only the properties of these literals can change: the assigned
+        # literals, the literals that have an axiom as contrary and the
+        # literals that have those as contrary.
+        affected_ids = set()
+        for literal_id, value in assignments:
+            decision_level.assigned_ids.append(literal_id)
+            affected_ids.add(literal_id)
+            if value:
+                self.axioms[literal_id] = 1
+                self._derive_from(literal_id, -1, decision_level.derived_ids)
+                for other_id in compiled.contrary_of(literal_id):
+                    self.nr_of_observed_contraries[other_id] += 1
+                    affected_ids.add(other_id)
+                    affected_ids.update(compiled.contrary_of(other_id))
+            else:
+                self.queryables[literal_id] = 0
+        self.nr_unassigned -= len(assignments)
+        self.fixpoint = None
+
+        changed_ids = []
+        for literal_id in sorted(affected_ids):
+            flags = assignment_property_flags(
+                compiled, literal_id, self.queryables[literal_id],
+                self.axioms[literal_id], self.nr_of_observed_contraries)
+            if flags == self.properties[literal_id]:
+                continue
+            decision_level.old_properties.append(
+                (literal_id, self.properties[literal_id]))
+            self.properties[literal_id] = flags
+            changed_ids.append(literal_id)
+            label_propagator.reevaluate_literal(literal_id)
+            if propagator.with_preferences:
+                for rule_id in propagator.defeated_rules[literal_id]:
+                    label_propagator.reevaluate_rule(rule_id)
+
+        # Literals that can no longer be assumed may no longer be derivable,
+        # and can then only be unsatisfiable.
+        underivable_literal_ids, underivable_rule_ids = update_derivable(
+            compiled, self.properties, self.derivable_literals,
+            self.derivable_rules, changed_ids)
+        decision_level.underivable_literal_ids.extend(underivable_literal_ids)
+        decision_level.underivable_rule_ids.extend(underivable_rule_ids)
+        for literal_id in underivable_literal_ids:
+            label_propagator.restrict_literal(literal_id, UNSATISFIABLE)
+        for rule_id in underivable_rule_ids:
+            label_propagator.restrict_rule(rule_id, UNSATISFIABLE)
+        return label_propagator.propagate()
+
+    def undo(self):
+        """
+        Undo the changes at the last decision level.
+        """
+        compiled = self.compiled
+        decision_level = self.levels.pop()
+        self.label_propagator.undo(decision_level.trail_length)
+        for literal_id in decision_level.underivable_literal_ids:
+            self.derivable_literals[literal_id] = 1
+        for rule_id in decision_level.underivable_rule_ids:
+            self.derivable_rules[rule_id] = 1
+        for literal_id, flags in reversed(decision_level.old_properties):
+            self.properties[literal_id] = flags
+        for literal_id in reversed(decision_level.derived_ids):
+            self.derived[literal_id] = 0
+            self.support[literal_id] = -1
+            for rule_id in compiled.rules_using(literal_id):
+                self.missing[rule_id] += 1
+        for literal_id in decision_level.assigned_ids:
+            if self.axioms[literal_id]:
+                for other_id in compiled.contrary_of(literal_id):
+                    self.nr_of_observed_contraries[other_id] -= 1
+            self.queryables[literal_id] = 1
+            self.axioms[literal_id] = 0
+        self.nr_unassigned += len(decision_level.assigned_ids)
+        self.fixpoint = None
+
+    def derivation_axioms(self, literal_id: int) -> Set[int]:
+        """
+        Get the axioms of the derivation of a derived literal.
+        """
+        axiom_ids = set()
+        stack = [literal_id]
+        visited = {literal_id}
+        while stack:
+            rule_id = self.support[stack.pop()]
+            if rule_id < 0:
+                continue
+            for antecedent_id in self.compiled.antecedents(rule_id):
+                if antecedent_id not in visited:
+                    visited.add(antecedent_id)
+                    stack.append(antecedent_id)
+        for visited_id in visited:
+            if self.support[visited_id] < 0 and self.axioms[visited_id]:
+                axiom_ids.add(visited_id)
+        return axiom_ids
+
+    def _derive_from(self, literal_id: int, rule_id: int,
+                     derived_ids: List[int]):
+        """
+        Derive the literal (by the rule, or as an axiom if it is -1) and the
+        literals that follow from it, and add them to the derived ids.
+        """
+        compiled = self.compiled
+        stack = [(literal_id, rule_id)]
+        while stack:
+            literal_id, rule_id = stack.pop()
+            if self.derived[literal_id]:
+                continue
+            self.derived[literal_id] = 1
+            self.support[literal_id] = rule_id
+            derived_ids.append(literal_id)
+            for using_rule_id in compiled.rules_using(literal_id):
+                self.missing[using_rule_id] -= 1
+                if not self.missing[using_rule_id]:
+                    stack.append((compiled.rule_consequents[using_rule_id],
+                                  using_rule_id))
+
+
+# The literals derived from the axioms with the usable rules, the usable
+# rules whose antecedents are all derived, the rule that derived each literal
+# first (-1 for the axioms) and the usable rules.
+Derivation = Tuple[bytearray, bytearray, List[int], bytearray]
+
+
+class GroundedFixpoint:
+    """
+    A GroundedFixpoint is the grounded fixpoint of a GroundedPropagator for
+    the given axioms, as computed by grounded_stability.dl or by
+    grounded_stability_with_preferences.dl. The derivations of each
+    iteration are kept to explain the statuses (see reason).
+    """
+
+    def __init__(self, propagator: GroundedPropagator, axioms: bytearray):
+        compiled = propagator.compiled
+        self.propagator = propagator
+        self.compiled = compiled
+        self.axioms = axioms
+        self.derivable = self._derive(bytearray([1]) * compiled.nr_of_rules)
+        self._not_defeated_by_axioms = bytearray([1]) * compiled.nr_of_rules
+        for literal_id in range(compiled.nr_of_literals):
+            if axioms[literal_id]:
+                for rule_id in propagator.defeated_rules[literal_id]:
+                    self._not_defeated_by_axioms[rule_id] = 0
+
+        # Per iteration, the derivations from the in rules (the defended
+        # literals) and from the rules that they do not defeat (the
+        # undefeated literals). Without preferences, there are no in rules
+        # in the first iteration.
+        self.defended: List[Optional[Derivation]] = []
+        self.undefeated: List[Derivation] = []
+        if propagator.with_preferences:
+            in_usable = bytearray(compiled.is_strict(rule_id)
+                                  for rule_id in range(compiled.nr_of_rules))
+            while True:
+                defended = self._derive(in_usable)
+                undefeated = self._derive(self._not_defeated(defended[1]))
+                self.defended.append(defended)
+                self.undefeated.append(undefeated)
+                iteration = len(self.defended) - 1
+                if iteration == propagator.max_iterations or iteration and \
+                        defended[1] == self.defended[-2][1]:
+                    break
+                in_usable = self._not_defeated(undefeated[1])
+            self.at_max_iterations = iteration == propagator.max_iterations
+        else:
+            undefeated = self._derive(self._not_defeated(None))
+            self.defended = [None, self._derive(
+                self._not_defeated(undefeated[1]))]
+            self.undefeated = [undefeated]
+            self.at_max_iterations = True
+
+    def _derive(self, usable_rules: bytearray) -> Derivation:
+        compiled = self.compiled
+        derived = bytearray(self.axioms)
+        triggered = bytearray(compiled.nr_of_rules)
+        support = [-1] * compiled.nr_of_literals
+        missing = list(self.propagator.nr_of_antecedents)
+        stack = [literal_id for literal_id in range(compiled.nr_of_literals)
+                 if derived[literal_id]]
+
+        def trigger(rule_id: int):
+            triggered[rule_id] = 1
+            consequent_id = compiled.rule_consequents[rule_id]
+            if not derived[consequent_id]:
+                derived[consequent_id] = 1
+                support[consequent_id] = rule_id
+                stack.append(consequent_id)
+
+        for rule_id in range(compiled.nr_of_rules):
+            if not missing[rule_id] and usable_rules[rule_id]:
+                trigger(rule_id)
+        while stack:
+            literal_id = stack.pop()
+            for rule_id in compiled.rules_using(literal_id):
+                missing[rule_id] -= 1
+                if not missing[rule_id] and usable_rules[rule_id]:
+                    trigger(rule_id)
+        return derived, triggered, support, usable_rules
+
+    def _not_defeated(self, attacking_rules: Optional[bytearray]) -> \
+            bytearray:
+        """
+        Get the rules that are not defeated by an axiom or by one of the
+        attacking rules; strict rules cannot be defeated.
+        """
+        not_defeated = bytearray(self._not_defeated_by_axioms)
+        if attacking_rules is not None:
+            attacked_rules = self.propagator.attacked_rules
+            for attacker_id, attacking in enumerate(attacking_rules):
+                if attacking:
+                    for rule_id in attacked_rules[attacker_id]:
+                        not_defeated[rule_id] = 0
+        return not_defeated
+
+    def statuses(self) -> Dict[str, bytearray]:
+        """
+        Get, for each status, whether each literal has it.
+        """
+        derivable = self.derivable[0]
+        defended = self.defended[-1][0]
+        undefeated = self.undefeated[-1][0]
+        unsatisfiable = bytearray(not derivable_literal
+                                  for derivable_literal in derivable)
+        out = bytearray(derivable[literal_id] and not undefeated[literal_id]
+                        for literal_id in range(self.compiled.nr_of_literals))
+        blocked = bytearray(
+            not unsatisfiable[literal_id] and not out[literal_id] and
+            not defended[literal_id]
+            for literal_id in range(self.compiled.nr_of_literals))
+        return {'unsatisfiable': unsatisfiable, 'defended': defended,
+                'out': out, 'blocked': blocked}
+
+    def reason(self, literal_id: int, status: str, positive: bool) -> \
+            Set[int]:
+        """
+        Get literals such that the literal has the status (if positive) or
+        not for every assignment of the axioms in which these literals are
+        axioms if and only if they are axioms now.
+
+        The value of a derivation in an iteration is explained by the
+        derivation tree of a derived literal, or by the unfounded set of an
+        underivable literal, and by the axioms and earlier derivations that
+        make its rules usable or not. With preferences, the defended literals
+        only grow and the undefeated literals only shrink after the last
+        iteration. A literal that is not defended or that is undefeated is
+        therefore explained with the in rules of the last iteration instead,
+        which also contain the in rules of the fixpoint of other assignments
+        as long as no rule in the cone of the literal can come in.
+        """
+        derivable = self.derivable[0][literal_id]
+        undefeated = self.undefeated[-1][0][literal_id]
+        if status == 'unsatisfiable':
+            facts = [('derivable', not positive)]
+        elif status == 'defended':
+            facts = [('defended', positive)]
+        elif status == 'out':
+            facts = [('derivable', True), ('undefeated', False)] \
+                if positive else [('derivable', False)] if not derivable \
+                else [('undefeated', True)]
+        elif positive:
+            facts = [('derivable', True), ('undefeated', True),
+                     ('defended', False)]
+        else:
+            facts = [('derivable', False)] if not derivable else \
+                [('undefeated', False)] if not undefeated else \
+                [('defended', True)]
+
+        # Tasks (literal or rule, kind of derivation, iteration, literal or
+        # rule id, value) to explain; rules are explained by whether their
+        # antecedents are derived and whether they are usable.
+        kept = set()
+        tasks = []
+        for kind, value in facts:
+            if kind == 'derivable':
+                tasks.append((True, kind, 0, literal_id, value))
+            elif self.at_max_iterations or \
+                    (kind == 'defended') == value:
+                iteration = len(getattr(self, kind)) - 1
+                tasks.append((True, kind, iteration, literal_id, value))
+            else:
+                tasks.append((True, 'in_' + kind, len(self.defended) - 1,
+                              literal_id, value))
+                self._add_no_rule_comes_in(literal_id, kept, tasks)
+
+        done = set()
+        while tasks:
+            task = tasks.pop()
+            if task in done:
+                continue
+            done.add(task)
+            is_literal, kind, iteration, item_id, value = task
+            if is_literal:
+                self._explain_literal(kind, iteration, item_id, value, kept,
+                                      tasks)
+            else:
+                self._explain_rule(kind, iteration, item_id, value, kept,
+                                   tasks)
+        return kept
+
+    def _derivation(self, kind: str, iteration: int) -> Derivation:
+        if kind == 'derivable':
+            return self.derivable
+        if kind.endswith('defended'):
+            return self.defended[iteration]
+        return self.undefeated[iteration]
+
+    def _add_no_rule_comes_in(self, literal_id: int, kept: Set[int],
+                              tasks: list):
+        """
+        Explain why no rule in the cone of the literal that is not in at the
+        last iteration comes in, from the in rules of the last iteration: one
+        of its antecedents is not defended, or it is defeated by the
+        undefeated literals.
+        """
+        iteration = len(self.defended) - 1
+        defended, in_rules, _, _ = self.defended[iteration]
+        triggered = self.undefeated[iteration][1]
+        propagator = self.propagator
+        for cone_literal_id in propagator.cone(literal_id):
+            for rule_id in self.compiled.rules_for(cone_literal_id):
+                if in_rules[rule_id]:
+                    continue
+                antecedent_id = next(
+                    (antecedent_id for antecedent_id in
+                     self.compiled.antecedents(rule_id)
+                     if not defended[antecedent_id]), None)
+                if antecedent_id is not None:
+                    tasks.append((True, 'in_defended', iteration,
+                                  antecedent_id, False))
+                    continue
+                contrary_id = next(
+                    (contrary_id for contrary_id in
+                     propagator.contraries_of_heads[rule_id]
+                     if self.axioms[contrary_id]), None)
+                if contrary_id is not None:
+                    kept.add(contrary_id)
+                    continue
+                attacker_id = next(
+                    attacker_id for attacker_id in
+                    propagator.attackers[rule_id] if triggered[attacker_id])
+                tasks.append((False, 'in_undefeated', iteration, attacker_id,
+                              True))
+
+    def _explain_literal(self, kind: str, iteration: int, literal_id: int,
+                         value: bool, kept: Set[int], tasks: list):
+        _, _, support, _ = self._derivation(kind, iteration)
+        if value:
+            if support[literal_id] < 0:
+                kept.add(literal_id)
+            else:
+                tasks.append((False, kind, iteration, support[literal_id],
+                              True))
+        else:
+            # The literal is no axiom, and none of its rules is triggered
+            # (possibly because of other literals in the unfounded set).
+            kept.add(literal_id)
+            for rule_id in self.compiled.rules_for(literal_id):
+                tasks.append((False, kind, iteration, rule_id, False))
+
+    def _explain_rule(self, kind: str, iteration: int, rule_id: int,
+                      value: bool, kept: Set[int], tasks: list):
+        derived, _, _, usable = self._derivation(kind, iteration)
+        antecedents = self.compiled.antecedents(rule_id)
+        if value:
+            self._explain_usable(kind, iteration, rule_id, True, kept, tasks)
+            for antecedent_id in antecedents:
+                tasks.append((True, kind, iteration, antecedent_id, True))
+            return
+        if kind == 'in_defended':
+            # Only the in rules (and the strict rules) are used
+            usable = self.defended[iteration][1]
+            if not usable[rule_id] and \
+                    not self.compiled.is_strict(rule_id):
+                return
+        elif not usable[rule_id]:
+            self._explain_usable(kind, iteration, rule_id, False, kept, tasks)
+            return
+        antecedent_id = next(antecedent_id for antecedent_id in antecedents
+                             if not derived[antecedent_id])
+        tasks.append((True, kind, iteration, antecedent_id, False))
+
+    def _explain_usable(self, kind: str, iteration: int, rule_id: int,
+                        value: bool, kept: Set[int], tasks: list):
+        """
+        Explain why a rule is usable (or not) in a derivation: it is not
+        defeated by an axiom or by an attacker in the derivation that
+        precedes it (the undefeated rules of the previous iteration for the
+        defended literals, and the in rules of the same iteration for the
+        undefeated literals).
+        """
+        if kind in ('derivable', 'in_defended') or \
+                self.compiled.is_strict(rule_id):
+            return
+        propagator = self.propagator
+        contraries = propagator.contraries_of_heads[rule_id]
+        attackers = propagator.attackers[rule_id]
+        if kind == 'in_undefeated':
+            # The in rules of the last iteration are given
+            attackers, attacking_rules = [], None
+        elif kind == 'defended':
+            if iteration == 0:
+                return
+            attacking_kind, attacking_iteration = 'undefeated', iteration - 1
+        else:
+            attacking_kind, attacking_iteration = 'defended', iteration
+        if attackers:
+            attacking_derivation = self._derivation(attacking_kind,
+                                                    attacking_iteration)
+            if attacking_derivation is None:
+                attackers = []
+            else:
+                attacking_rules = attacking_derivation[1]
+
+        if value:
+            kept.update(contraries)
+            for attacker_id in attackers:
+                tasks.append((False, attacking_kind, attacking_iteration,
+                              attacker_id, False))
+            return
+        contrary_id = next((contrary_id for contrary_id in contraries
+                            if self.axioms[contrary_id]), None)
+        if contrary_id is not None:
+            kept.add(contrary_id)
+            return
+        attacker_id = next((attacker_id for attacker_id in attackers
+                            if attacking_rules[attacker_id]), None)
+        if attacker_id is not None:
+            tasks.append((False, attacking_kind, attacking_iteration,
+                          attacker_id, True))
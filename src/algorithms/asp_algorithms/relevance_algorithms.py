@@ -1,7 +1,7 @@
 import pathlib
 
-import clingo
-
+from .grounded_propagator import GroundedPropagator
+from ...import_export.iat_from_lp_reader import read_from_lp_file
 
 PATH_TO_ENCODINGS = pathlib.Path(__file__).parent / 'encodings'
 
@@ -69,7 +69,11 @@ class RelevanceSolver:
                 self.topic = line.split('(')[1].split(')')[0]
 
     def _setup_clingo_relevance(self, iat_file,
-                                with_preferences: bool = False):
+                                with_preferences: bool = False,
+                                use_propagator: bool = False):
+        # Imported here, so that importing this module stays cheap.
+        import clingo
+
         # Initialise guess_control.
         self.guess_control = clingo.Control()
         self.guess_control.load(iat_file)
@@ -77,13 +81,22 @@ class RelevanceSolver:
         self.guess_control.ground([('base', [])], context=self)
 
         # Initialise verify_control.
-        self.verify_control = clingo.Control()
+        self.verify_control = clingo.Control(
+            arguments=['--heuristic=Domain'] if use_propagator else [])
         self.verify_control.load(iat_file)
-        self.verify_control.load(str(PATH_TO_ENCODINGS / 'derivable.dl'))
-        if with_preferences:
-            stability_file_name = 'grounded_stability_with_preferences.dl'
+        if use_propagator:
+            # The statuses are computed by the propagator instead.
+            self.verify_control.register_propagator(GroundedPropagator(
+                read_from_lp_file(iat_file), with_preferences))
+            stability_file_name = 'grounded_propagator.dl'
         else:
-            stability_file_name = 'grounded_stability.dl'
+            self.verify_control.load(
+                str(PATH_TO_ENCODINGS / 'derivable.dl'))
+            if with_preferences:
+                stability_file_name = \
+                    'grounded_stability_with_preferences.dl'
+            else:
+                stability_file_name = 'grounded_stability.dl'
         self.verify_control.load(
             str(PATH_TO_ENCODINGS / stability_file_name))
         self.verify_control.load(
@@ -105,12 +118,15 @@ class RelevanceSolver:
         self.clean()
 
     def relevance_all_incremental(self, input_file, prefs,
-                                  status='defended'):
+                                  status='defended',
+                                  use_propagator: bool = False):
+        import clingo
+
         # Parse input.
         self._parse_input(input_file)
 
         # Setup controls.
-        self._setup_clingo_relevance(input_file, prefs)
+        self._setup_clingo_relevance(input_file, prefs, use_propagator)
 
         potential_queryables = \
             {q for q in self.queryables if q not in self.initial_axioms}
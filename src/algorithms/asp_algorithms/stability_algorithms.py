@@ -1,11 +1,90 @@
-import clingo
+import os
 import pathlib
+from typing import Iterable, Optional, Union
 
+from src.algorithms.asp_algorithms.ground_program_cache import \
+    GroundProgramCache
+from src.algorithms.asp_algorithms.grounded_propagator import \
+    GroundedPropagator
+from src.algorithms.bitset_stability_result import STATUSES
 from src.algorithms.stability_result import StabilityResult
+from src.classes.incomplete_argumentation_theory import \
+    IncompleteArgumentationTheory
+from src.classes.literal import Literal
+from src.import_export.iat_from_lp_reader import read_from_lp_file
+from src.import_export.iat_to_lp_writer import to_lp_str
 
 PATH_TO_ENCODINGS = pathlib.Path(__file__).parent / 'encodings'
 
 
+def _stability_encoding(with_preferences: bool,
+                        incremental_iterations: bool = False) -> str:
+    if with_preferences and incremental_iterations:
+        return str(PATH_TO_ENCODINGS /
+                   'grounded_stability_with_preferences_incremental.dl')
+    if with_preferences:
+        return str(PATH_TO_ENCODINGS /
+                   'grounded_stability_with_preferences.dl')
+    return str(PATH_TO_ENCODINGS / 'grounded_stability.dl')
+
+
+def ground_preference_iterations(control, context=None) -> int:
+    """
+    Ground a control with grounded_stability_with_preferences_incremental.dl
+    one iteration at a time, until no guess of axioms brings in another rule
+    (or until the (N+1)/2 iterations of
+    grounded_stability_with_preferences.dl), and then the fixpoint at that
+    iteration. The eaxiom/1 externals are left free while checking, so the
+    fixpoint holds for any knowledge base. Returns the number of iterations.
+    """
+    import clingo
+
+    control.ground([('base', []), ('step', [clingo.Number(0)])],
+                   context=context)
+    nr_of_rules = sum(1 for _ in control.symbolic_atoms.by_signature(
+        'rule', 1))
+    max_iterations = (nr_of_rules + 1) // 2
+
+    externals = [atom.symbol for atom in
+                 control.symbolic_atoms.by_signature('eaxiom', 1)]
+    for external in externals:
+        control.assign_external(external, None)
+    solve_configuration = control.configuration.solve
+    enum_mode, models = solve_configuration.enum_mode, \
+        solve_configuration.models
+    solve_configuration.enum_mode, solve_configuration.models = 'auto', '1'
+
+    iteration = 0
+    while iteration < max_iterations:
+        iteration += 1
+        control.ground([('step', [clingo.Number(iteration)])],
+                       context=context)
+        changed = clingo.Function('changed', [clingo.Number(iteration)])
+        if control.symbolic_atoms[changed] is None or \
+                not control.solve(assumptions=[(changed, True)]).satisfiable:
+            break
+
+    solve_configuration.enum_mode, solve_configuration.models = \
+        enum_mode, models
+    for external in externals:
+        control.assign_external(external, False)
+    control.ground([('fixpoint', [clingo.Number(iteration)])],
+                   context=context)
+    return iteration
+
+
+def _to_stability_result(model) -> StabilityResult:
+    stability_result = StabilityResult()
+    if model:
+        for stable_literals in model:
+            literal_name = stable_literals.arguments[0].name
+            status = stable_literals.name
+            # Assigned externals are shown as well
+            if status in STATUSES:
+                stability_result.add_to_result(literal_name, status)
+    return stability_result
+
+
 class GroundedStabilitySolver:
     def __init__(self):
         self.last_model = None
@@ -13,30 +92,174 @@ class GroundedStabilitySolver:
     def on_model(self, model):
         self.last_model = model.symbols(shown=True)
 
-    def solve_stability(self, iat_file, with_preferences: bool = False):
+    def solve_stability(
+            self, iat_file: Union[str, os.PathLike,
+                                  IncompleteArgumentationTheory],
+            with_preferences: bool = False,
+            cache: Optional[GroundProgramCache] = None,
+            incremental_iterations: bool = False,
+            use_propagator: bool = False):
+        """
+        Get the stability result of a theory. With a cache, the theory is
+        solved by a GroundedStabilitySession, so that the ground program
+        does not depend on the axioms and can be shared by theories that
+        only differ in their axioms. With incremental_iterations, the
+        preference encoding is grounded by ground_preference_iterations,
+        which only grounds the iterations that are needed. With
+        use_propagator, only the axioms are guessed in ASP and the statuses
+        are computed by a GroundedPropagator.
+        """
+        if cache is not None and use_propagator:
+            raise ValueError('The propagator cannot be used with a cache.')
+        if cache is not None:
+            return GroundedStabilitySession(
+                iat_file, with_preferences, cache,
+                incremental_iterations).solve_stability()
+
+        # Imported here, so that importing this module stays cheap.
+        import clingo
+
         self.last_model = None
 
-        control = clingo.Control(arguments=['--enum-mode=cautious'])
-        control.load(str(iat_file))
+        arguments = ['--enum-mode=cautious']
+        if use_propagator:
+            arguments.append('--heuristic=Domain')
+        control = clingo.Control(arguments=arguments)
+        if isinstance(iat_file, IncompleteArgumentationTheory):
+            control.add('base', [], to_lp_str(iat_file))
+        else:
+            control.load(str(iat_file))
         control.load(str(PATH_TO_ENCODINGS / 'guess.dl'))
+        if use_propagator:
+            iat = iat_file \
+                if isinstance(iat_file, IncompleteArgumentationTheory) \
+                else read_from_lp_file(str(iat_file))
+            control.register_propagator(
+                GroundedPropagator(iat, with_preferences))
+            control.load(str(PATH_TO_ENCODINGS / 'grounded_propagator.dl'))
+            control.load(str(PATH_TO_ENCODINGS / 'filter_status.dl'))
+            control.ground([('base', [])], context=self)
+            control.solve(on_model=self.on_model)
+            return _to_stability_result(self.last_model)
+
         control.load(str(PATH_TO_ENCODINGS / 'derivable.dl'))
-        if with_preferences:
-            control.load(str(PATH_TO_ENCODINGS /
-                             'grounded_stability_with_preferences.dl'))
-        else:
-            control.load(str(PATH_TO_ENCODINGS / 'grounded_stability.dl'))
+        control.load(_stability_encoding(with_preferences,
+                                         incremental_iterations))
         control.load(str(PATH_TO_ENCODINGS / 'filter_status.dl'))
-        control.ground([('base', [])], context=self)
+        if with_preferences and incremental_iterations:
+            ground_preference_iterations(control, self)
+        else:
+            control.ground([('base', [])], context=self)
         control.solve(on_model=self.on_model)
 
-        stability_result = StabilityResult()
-        if self.last_model:
-            for stable_literals in self.last_model:
-                literal_name = stable_literals.arguments[0].name
-                status = stable_literals.name
-                stability_result.add_to_result(literal_name, status)
+        return _to_stability_result(self.last_model)
 
-        return stability_result
+
+class GroundedStabilitySession:
+    """
+    A GroundedStabilitySession grounds the argumentation system and the
+    queryables of a theory once, with the axioms given by the external
+    eaxiom/1 (see stability_externals.dl), much like the verify control of
+    the RelevanceSolver. The stability result for any knowledge base of
+    axioms is then found by assigning the externals and solving again,
+    which is much cheaper than the grounding for each knowledge base done by
+    the GroundedStabilitySolver. With a cache, the ground program is loaded
+    from the cache if it was grounded before. With incremental_iterations,
+    the preference encoding is grounded by ground_preference_iterations;
+    such programs are not cached, as the grounding needs solving.
+    """
+
+    def __init__(self, iat_file: Union[str, os.PathLike,
+                                       IncompleteArgumentationTheory],
+                 with_preferences: bool = False,
+                 cache: Optional[GroundProgramCache] = None,
+                 incremental_iterations: bool = False):
+        # Imported here, so that importing this module stays cheap.
+        import clingo
+
+        incremental_iterations = incremental_iterations and with_preferences
+        if cache is not None and incremental_iterations:
+            raise ValueError('Incrementally grounded iterations cannot be '
+                             'cached.')
+
+        # The axioms of the theory are left out of the grounded program, but
+        # kept as the default knowledge base.
+        if isinstance(iat_file, IncompleteArgumentationTheory):
+            lp_str = to_lp_str(iat_file, with_axioms=False)
+            self.axioms = frozenset(axiom.s1.lower() for axiom in
+                                    iat_file.knowledge_base_axioms)
+        else:
+            with open(iat_file, 'r') as reader:
+                lines = reader.readlines()
+            lp_str = ''.join(line for line in lines
+                             if not line.startswith('axiom'))
+            self.axioms = frozenset(
+                line.split('(', 1)[1].split(')', 1)[0]
+                for line in lines if line.startswith('axiom'))
+
+        self.last_model = None
+        encoding_paths = [str(PATH_TO_ENCODINGS / 'guess.dl'),
+                          str(PATH_TO_ENCODINGS / 'derivable.dl'),
+                          _stability_encoding(with_preferences,
+                                              incremental_iterations),
+                          str(PATH_TO_ENCODINGS / 'stability_externals.dl'),
+                          str(PATH_TO_ENCODINGS / 'filter_status.dl')]
+        arguments = ['--enum-mode=cautious']
+        if cache is not None:
+            self.control = cache.control(lp_str, encoding_paths, arguments)
+        else:
+            self.control = clingo.Control(arguments=arguments)
+            self.control.add('base', [], lp_str)
+            for encoding_path in encoding_paths:
+                self.control.load(encoding_path)
+            if incremental_iterations:
+                ground_preference_iterations(self.control, self)
+            else:
+                self.control.ground([('base', [])], context=self)
+
+        # Names of the literals with an eaxiom/1 external, and of those whose
+        # external is currently true.
+        self._external_axioms = frozenset(
+            atom.symbol.arguments[0].name for atom in
+            self.control.symbolic_atoms.by_signature('eaxiom', 1))
+        self._assigned_axioms = set()
+
+    def on_model(self, model):
+        self.last_model = model.symbols(shown=True)
+
+    def solve_stability(
+            self, axioms: Optional[Iterable[Union[str, Literal]]] = None) -> \
+            StabilityResult:
+        """
+        Get the stability result for the theory with the given axioms as its
+        knowledge base, or with its own axioms if none are given. Only the
+        externals of axioms that differ from the previous call are assigned.
+        Axiom names are not case sensitive, as in the lp files.
+        """
+        import clingo
+
+        if axioms is None:
+            axioms = self.axioms
+        else:
+            axioms = {(axiom.s1 if isinstance(axiom, Literal)
+                       else str(axiom)).lower() for axiom in axioms}
+        unknown_axioms = axioms - self._external_axioms
+        if unknown_axioms:
+            raise ValueError(f'Not a literal of the theory: '
+                             f'{", ".join(sorted(unknown_axioms))}.')
+        for axiom_name in self._assigned_axioms - axioms:
+            self.control.assign_external(
+                clingo.Function('eaxiom', [clingo.Function(axiom_name)]),
+                False)
+        for axiom_name in axioms - self._assigned_axioms:
+            self.control.assign_external(
+                clingo.Function('eaxiom', [clingo.Function(axiom_name)]),
+                True)
+        self._assigned_axioms = set(axioms)
+
+        self.last_model = None
+        self.control.solve(on_model=self.on_model)
+        return _to_stability_result(self.last_model)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,144 @@
+import hashlib
+from typing import Dict, Optional, Sequence
+
+from .stability_result import StabilityResult
+
+STATUSES = ('unsatisfiable', 'defended', 'out', 'blocked')
+
+
+def literal_order_digest(literal_names: Sequence[str]) -> bytes:
+    """
+    Digest of a literal order, which is the same in every process (unlike
+    the hash of the names).
+    """
+    return hashlib.blake2b('\0'.join(literal_names).encode(),
+                           digest_size=16).digest()
+
+
+class BitsetStabilityResult:
+    """
+    A BitsetStabilityResult stores the same information as a StabilityResult,
+    but each status is a bitset (a Python int) over a fixed order of literal
+    names, typically the literal order of a compiled argumentation system.
+    Set operations then take time in the number of machine words instead of
+    the number of literals. Results with a different literal order are
+    compared by literal name instead.
+
+    The literal order is compared by its digest, which is computed once per
+    result (or passed on from a result with the same order) and kept when
+    the result is pickled.
+    """
+    __slots__ = ('literal_names', 'literal_order_digest',
+                 'stable_unsatisfiable', 'stable_defended', 'stable_out',
+                 'stable_blocked')
+
+    def __init__(self, literal_names: Sequence[str],
+                 stable_unsatisfiable: int = 0, stable_defended: int = 0,
+                 stable_out: int = 0, stable_blocked: int = 0,
+                 order_digest: Optional[bytes] = None):
+        self.literal_names = literal_names
+        self.literal_order_digest = order_digest \
+            if order_digest is not None else \
+            literal_order_digest(literal_names)
+        self.stable_unsatisfiable = stable_unsatisfiable
+        self.stable_defended = stable_defended
+        self.stable_out = stable_out
+        self.stable_blocked = stable_blocked
+
+    @classmethod
+    def from_stability_result(cls, stability_result: StabilityResult,
+                              literal_names: Sequence[str],
+                              literal_ids: Dict[str, int] = None):
+        if literal_ids is None:
+            literal_ids = {literal_name: literal_id for literal_id,
+                           literal_name in enumerate(literal_names)}
+        result = cls(literal_names)
+        for status in STATUSES:
+            bits = 0
+            for literal_name in getattr(stability_result, 'stable_' + status):
+                bits |= 1 << literal_ids[literal_name]
+            setattr(result, 'stable_' + status, bits)
+        return result
+
+    def to_stability_result(self) -> StabilityResult:
+        stability_result = StabilityResult()
+        for status in STATUSES:
+            bits = getattr(self, 'stable_' + status)
+            while bits:
+                lowest_bit = bits & -bits
+                stability_result.add_to_result(
+                    self.literal_names[lowest_bit.bit_length() - 1], status)
+                bits ^= lowest_bit
+        return stability_result
+
+    def add_literal_id_to_result(self, literal_id: int, label: str):
+        if label not in STATUSES:
+            raise NotImplementedError('This label is not known.')
+        attribute = 'stable_' + label
+        setattr(self, attribute, getattr(self, attribute) | 1 << literal_id)
+
+    def _bitsets(self):
+        return self.stable_unsatisfiable, self.stable_defended, \
+            self.stable_out, self.stable_blocked
+
+    def __str__(self):
+        return str(self.to_stability_result())
+
+    def nr_stable(self):
+        return sum(bits.bit_count() for bits in self._bitsets())
+
+    def status_counts(self) -> Dict[str, int]:
+        return {status: bits.bit_count()
+                for status, bits in zip(STATUSES, self._bitsets())}
+
+    def _same_literal_order(self, other: 'BitsetStabilityResult') -> bool:
+        return self.literal_order_digest == other.literal_order_digest
+
+    def __eq__(self, other):
+        if not isinstance(other, BitsetStabilityResult):
+            return NotImplemented
+        if not self._same_literal_order(other):
+            return self.to_stability_result() == other.to_stability_result()
+        return self._bitsets() == other._bitsets()
+
+    def is_subset_of(self, other: 'BitsetStabilityResult'):
+        if not self._same_literal_order(other):
+            return self.to_stability_result().is_subset_of(
+                other.to_stability_result())
+        return all(not bits & ~other_bits for bits, other_bits in
+                   zip(self._bitsets(), other._bitsets()))
+
+    def difference(self, other) -> 'BitsetStabilityResult':
+        """
+        Result with, for each status, the literals that have this stable
+        status in this result but not in the other.
+        """
+        if not self._same_literal_order(other):
+            raise ValueError('The results do not share the same literal '
+                             'order.')
+        return BitsetStabilityResult(
+            self.literal_names,
+            *[bits & ~other_bits for bits, other_bits in
+              zip(self._bitsets(), other._bitsets())],
+            order_digest=self.literal_order_digest)
+
+    def to_bytes(self) -> bytes:
+        """
+        Compact encoding: the four bitsets, each as a little-endian bytes
+        string of a fixed length that depends on the number of literals.
+        The literal names are not included.
+        """
+        nr_of_bytes = (len(self.literal_names) + 7) // 8
+        return b''.join(bits.to_bytes(nr_of_bytes, 'little')
+                        for bits in self._bitsets())
+
+    @classmethod
+    def from_bytes(cls, encoded: bytes, literal_names: Sequence[str]):
+        nr_of_bytes = (len(literal_names) + 7) // 8
+        if len(encoded) != 4 * nr_of_bytes:
+            raise ValueError('The encoding does not match the number of '
+                             'literals.')
+        return cls(literal_names, *[
+            int.from_bytes(encoded[index * nr_of_bytes:
+                                   (index + 1) * nr_of_bytes], 'little')
+            for index in range(4)])
@@ -0,0 +1,94 @@
+from collections import deque
+from typing import Iterable, List
+
+from ..classes.compiled_argumentation_system import \
+    CompiledArgumentationSystem
+
+
+def _derive(compiled: CompiledArgumentationSystem, axiom_ids: Iterable[int],
+            usable_rules: bytearray) -> bytearray:
+    """
+    Forward chaining from the axioms, using only the usable rules: each rule
+    counts its antecedents that are not derived yet and fires at zero.
+    """
+    derived = bytearray(compiled.nr_of_literals)
+    newly_derived = deque()
+    for axiom_id in axiom_ids:
+        if not derived[axiom_id]:
+            derived[axiom_id] = 1
+            newly_derived.append(axiom_id)
+
+    antecedent_offsets = compiled.rule_antecedent_offsets
+    nr_of_antecedents_left = [
+        antecedent_offsets[rule_id + 1] - antecedent_offsets[rule_id]
+        for rule_id in range(compiled.nr_of_rules)]
+
+    def fire(rule_id: int):
+        consequent_id = compiled.rule_consequents[rule_id]
+        if usable_rules[rule_id] and not derived[consequent_id]:
+            derived[consequent_id] = 1
+            newly_derived.append(consequent_id)
+
+    for rule_id, nr_left in enumerate(nr_of_antecedents_left):
+        if nr_left == 0:
+            fire(rule_id)
+    while newly_derived:
+        literal_id = newly_derived.popleft()
+        for rule_id in compiled.rules_using(literal_id):
+            nr_of_antecedents_left[rule_id] -= 1
+            if nr_of_antecedents_left[rule_id] == 0:
+                fire(rule_id)
+    return derived
+
+
+def _attacked_rules(compiled: CompiledArgumentationSystem,
+                    attackers: bytearray) -> bytearray:
+    """
+    Defeasible rules of which the consequent has a contrary among the
+    attackers; strict rules cannot be attacked. As in the ASP encodings, a
+    rule identifier with several heads is attacked as soon as one of its
+    heads is.
+    """
+    attacked_rule_strs = {
+        compiled.rules[rule_id].id
+        for rule_id, consequent_id in enumerate(compiled.rule_consequents)
+        if not compiled.is_strict(rule_id) and any(attackers[contrary_id]
+               for contrary_id in compiled.contraries(consequent_id))}
+    return bytearray([rule.id in attacked_rule_strs and
+                      not compiled.is_strict(rule_id)
+                      for rule_id, rule in enumerate(compiled.rules)])
+
+
+def grounded_statuses(compiled: CompiledArgumentationSystem,
+                      axiom_ids: Iterable[int]) -> List[str]:
+    """
+    Get the status (unsatisfiable, defended, out or blocked) of each literal
+    in the argumentation theory with the given axioms, indexed by literal id.
+    This follows derivable.dl and grounded_stability.dl (so without
+    preferences), but for a single knowledge base.
+    """
+    axiom_ids = list(axiom_ids)
+    all_rules = bytearray([1]) * compiled.nr_of_rules
+
+    derivable = _derive(compiled, axiom_ids, all_rules)
+    is_axiom = bytearray(compiled.nr_of_literals)
+    for axiom_id in axiom_ids:
+        is_axiom[axiom_id] = 1
+    not_defeated = bytearray(
+        [not defeated for defeated in _attacked_rules(compiled, is_axiom)])
+    undefeated = _derive(compiled, axiom_ids, not_defeated)
+    not_defeated_by_undefeated = bytearray(
+        [not defeated for defeated in _attacked_rules(compiled, undefeated)])
+    defended = _derive(compiled, axiom_ids, not_defeated_by_undefeated)
+
+    statuses = []
+    for literal_id in range(compiled.nr_of_literals):
+        if not derivable[literal_id]:
+            statuses.append('unsatisfiable')
+        elif defended[literal_id]:
+            statuses.append('defended')
+        elif not undefeated[literal_id]:
+            statuses.append('out')
+        else:
+            statuses.append('blocked')
+    return statuses
@@ -1,4 +1,7 @@
 class StabilityResult:
+    __slots__ = ('stable_unsatisfiable', 'stable_defended', 'stable_out',
+                 'stable_blocked')
+
     def __init__(self):
         self.stable_unsatisfiable = set()
         self.stable_defended = set()
@@ -0,0 +1,49 @@
+from typing import Iterable, Tuple
+
+from ..classes.compiled_argumentation_system import \
+    CompiledArgumentationSystem
+
+
+def topic_cone(compiled: CompiledArgumentationSystem,
+               topic_ids: Iterable[int]) -> Tuple[bytearray, bytearray]:
+    """
+    Get the backward cone of the topics: all literals and rules that can
+    affect the status of some topic. A literal depends on the rules for it
+    and on its contraries, and a rule depends on its antecedents and on the
+    contraries of its consequent. As in the ASP encodings, rules that share
+    an identifier are treated as one rule with several heads.
+
+    Returns a bytearray indexed by literal id and one indexed by rule id,
+    with a 1 for the literals and rules in the cone.
+    """
+    rule_ids_by_str = dict()
+    for rule_id, rule in enumerate(compiled.rules):
+        rule_ids_by_str.setdefault(rule.id, []).append(rule_id)
+
+    literals_in_cone = bytearray(compiled.nr_of_literals)
+    rules_in_cone = bytearray(compiled.nr_of_rules)
+    to_visit = []
+
+    def visit(literal_id: int):
+        if not literals_in_cone[literal_id]:
+            literals_in_cone[literal_id] = 1
+            to_visit.append(literal_id)
+
+    for topic_id in topic_ids:
+        visit(topic_id)
+    while to_visit:
+        literal_id = to_visit.pop()
+        for contrary_id in compiled.contraries(literal_id):
+            visit(contrary_id)
+        for rule_id in compiled.rules_for(literal_id):
+            if rules_in_cone[rule_id]:
+                continue
+            for same_rule_id in \
+                    rule_ids_by_str[compiled.rules[rule_id].id]:
+                rules_in_cone[same_rule_id] = 1
+                for antecedent_id in compiled.antecedents(same_rule_id):
+                    visit(antecedent_id)
+                for contrary_id in compiled.contraries(
+                        compiled.rule_consequents[same_rule_id]):
+                    visit(contrary_id)
+    return literals_in_cone, rules_in_cone
@@ -0,0 +1,121 @@
+import os
+from typing import Iterable, Optional, Union
+
+from .topic_cone import topic_cone
+from ..classes.argumentation_system import ArgumentationSystem
+from ..classes.defeasible_rule import DefeasibleRule
+from ..classes.incomplete_argumentation_theory import \
+    IncompleteArgumentationTheory
+from ..classes.literal import Literal
+from ..classes.preference_preorder import PreferencePreorder
+from ..classes.strict_rule import StrictRule
+from ..import_export.iat_from_lp_reader import read_from_lp_file, \
+    read_topics_from_lp_file
+from ..import_export.iat_to_lp_writer import write_to_lp_file
+
+
+def slice_to_topics(iat: IncompleteArgumentationTheory,
+                    topics: Iterable[Union[Literal, str]]) -> \
+        IncompleteArgumentationTheory:
+    """
+    Reduce the theory to the backward cone of the topics: only the literals,
+    rules, queryables, axioms and preferences that can affect the status of
+    some topic are kept. Besides, queryables and axioms that conflict with a
+    queryable in the cone are kept (without their rules), as they restrict
+    which queryables can still be added to the knowledge base.
+
+    For all literals in the cone, and so for the topics, the stability and
+    relevance results for the reduced theory are the same as for the
+    original theory.
+    """
+    compiled = iat.argumentation_system.compiled
+    literal_ids = compiled.literal_ids
+    topic_ids = [literal_ids[topic.s1 if isinstance(topic, Literal)
+                             else topic] for topic in topics]
+    literals_in_cone, rules_in_cone = topic_cone(compiled, topic_ids)
+
+    keep_literal = bytearray(literals_in_cone)
+    for rule_id in range(compiled.nr_of_rules):
+        if rules_in_cone[rule_id]:
+            keep_literal[compiled.rule_consequents[rule_id]] = 1
+    for literal in iat.queryables + iat.knowledge_base:
+        literal_id = literal_ids[literal.s1]
+        if any(literals_in_cone[other_id] and
+               iat.is_queryable(compiled.literals[other_id])
+               for other_id in (*compiled.contraries(literal_id),
+                                *compiled.contrary_of(literal_id))):
+            keep_literal[literal_id] = 1
+
+    # New literals and rules, as the argumentation system sets the contraries
+    # of its literals.
+    language = {literal_str: Literal(literal_str)
+                for literal_id, literal_str in
+                enumerate(compiled.literal_names) if keep_literal[literal_id]}
+    contraries_and_contradictories = {
+        literal_str: {language[compiled.literal_names[contrary_id]]
+                      for contrary_id in compiled.contraries(
+                          literal_ids[literal_str])
+                      if keep_literal[contrary_id]}
+        for literal_str in language}
+    new_rules = dict()
+    new_strict_rules = []
+    for rule_id, rule in enumerate(compiled.rules):
+        if rules_in_cone[rule_id]:
+            antecedents = {language[antecedent.s1]
+                           for antecedent in rule.antecedents}
+            consequent = language[rule.consequent.s1]
+            if compiled.is_strict(rule_id):
+                new_strict_rules.append(
+                    StrictRule(rule.id, antecedents, consequent))
+            else:
+                new_rules[rule] = DefeasibleRule(
+                    rule.id, antecedents, consequent)
+    rule_preferences = PreferencePreorder(
+        [(new_rules[rule_a], new_rules[rule_b])
+         for rule_a, rule_b in
+         iat.argumentation_system.rule_preferences.preference_tuples
+         if rule_a in new_rules and rule_b in new_rules])
+    argumentation_system = ArgumentationSystem(
+        language=language,
+        contraries_and_contradictories=contraries_and_contradictories,
+        strict_rules=new_strict_rules,
+        defeasible_rules=list(new_rules.values()),
+        defeasible_rule_preferences=rule_preferences,
+        add_defeasible_rule_literals=False)
+
+    def kept(literals):
+        return [language[literal.s1] for literal in literals
+                if literal.s1 in language]
+
+    ordinary_premise_preferences = PreferencePreorder(
+        [(language[premise_a.s1], language[premise_b.s1])
+         for premise_a, premise_b in
+         iat.ordinary_premise_preferences.preference_tuples
+         if premise_a.s1 in language and premise_b.s1 in language])
+    return IncompleteArgumentationTheory(
+        argumentation_system=argumentation_system,
+        queryables=kept(iat.queryables),
+        knowledge_base_axioms=kept(iat.knowledge_base_axioms),
+        knowledge_base_ordinary_premises=kept(
+            iat.knowledge_base_ordinary_premises),
+        ordinary_premise_preferences=ordinary_premise_preferences)
+
+
+def slice_lp_file(input_path: Union[str, os.PathLike],
+                  output_path: Union[str, os.PathLike],
+                  topics: Optional[Iterable[str]] = None) -> \
+        IncompleteArgumentationTheory:
+    """
+    Slice the theory in an LP file to the backward cone of its topics (or of
+    the given topics) and write the result, with the topics, to another LP
+    file. The reduced file can be given to the StabilityLabeler, the
+    GroundedStabilitySolver and the RelevanceSolver.
+    """
+    if topics is None:
+        topics = read_topics_from_lp_file(input_path)
+    topics = list(topics)
+    sliced_iat = slice_to_topics(read_from_lp_file(input_path), topics)
+    write_to_lp_file(sliced_iat, output_path,
+                     [sliced_iat.argumentation_system.language[topic]
+                      for topic in topics])
+    return sliced_iat
@@ -1,10 +1,11 @@
 from typing import Dict, List, Optional, Set
 
+from .compiled_argumentation_system import CompiledArgumentationSystem
 from .defeasible_rule import DefeasibleRule
 from .preference_preorder import PreferencePreorder
 from .rule import Rule
 from .strict_rule import StrictRule
-from .literal import Literal
+from .literal import Literal, NO_CONTRARIES
 
 
 class ArgumentationSystem:
@@ -29,11 +30,12 @@ class ArgumentationSystem:
                 self.language[str(defeasible_rule_literal)] = \
                     defeasible_rule_literal
 
-        # Contradiction function
+        # Contradiction function, stored as sorted tuples (which are much
+        # smaller than sets for the typical one or two contraries)
         for literal_str, literal_contraries in \
                 contraries_and_contradictories.items():
             self.language[literal_str].contraries_and_contradictories = \
-                literal_contraries
+                tuple(sorted(literal_contraries)) or NO_CONTRARIES
 
         # Rule preferences
         if defeasible_rule_preferences:
@@ -43,6 +45,19 @@ class ArgumentationSystem:
                                for rule_a in self.defeasible_rules]
             self.rule_preferences = PreferencePreorder(reflexive_order)
 
+        self._compiled = None
+
+    @property
+    def compiled(self) -> CompiledArgumentationSystem:
+        """
+        Integer-indexed (CSR) view of this ArgumentationSystem. It is built on
+        first access and cached, so it should only be requested once the
+        language, rules and contraries are complete.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledArgumentationSystem(self)
+        return self._compiled
+
     def get_literal(self, defeasible_rule: DefeasibleRule) -> Literal:
         return self.language[defeasible_rule.id_str]
 
@@ -0,0 +1,192 @@
+from array import array
+from typing import Iterable, List, Sequence, Tuple
+
+
+def csr_from_arrays(nr_of_nodes: int, sources: Sequence[int],
+                    targets: Sequence[int]) -> Tuple[array, array]:
+    """
+    Turn parallel arrays of sources and targets into a compressed sparse row
+    adjacency: the targets of source i are indices[offsets[i]:offsets[i + 1]],
+    in the order in which they were given.
+    """
+    offsets = array('i', bytes(4 * (nr_of_nodes + 1)))
+    for source in sources:
+        offsets[source + 1] += 1
+    for node in range(nr_of_nodes):
+        offsets[node + 1] += offsets[node]
+
+    indices = array('i', bytes(4 * len(targets)))
+    fill = array('i', offsets[:-1])
+    for source, target in zip(sources, targets):
+        indices[fill[source]] = target
+        fill[source] += 1
+    return offsets, indices
+
+
+def _to_csr(nr_of_nodes: int, pairs: Iterable[Tuple[int, int]]) -> \
+        Tuple[array, array]:
+    """
+    The same as csr_from_arrays, for (source, target) pairs.
+    """
+    sources = array('i')
+    targets = array('i')
+    for source, target in pairs:
+        sources.append(source)
+        targets.append(target)
+    return csr_from_arrays(nr_of_nodes, sources, targets)
+
+
+def strict_closure_pairs(
+        nr_of_defeasible_rules: int, rule_consequents: Sequence[int],
+        rule_antecedent_offsets: Sequence[int],
+        rule_antecedent_indices: Sequence[int]) -> List[Tuple[int, int]]:
+    """
+    Get the pairs (literal, implied literal) of the strict closure index, for
+    rules in CSR form of which the strict ones come after the defeasible
+    ones.
+    """
+    single_antecedent_successors = dict()
+    for rule_id in range(nr_of_defeasible_rules, len(rule_consequents)):
+        start = rule_antecedent_offsets[rule_id]
+        if rule_antecedent_offsets[rule_id + 1] - start == 1:
+            single_antecedent_successors.setdefault(
+                rule_antecedent_indices[start], []).append(
+                rule_consequents[rule_id])
+
+    closure_pairs = []
+    for literal_id in sorted(single_antecedent_successors):
+        reached = {literal_id}
+        to_visit = [literal_id]
+        while to_visit:
+            for successor_id in single_antecedent_successors.get(
+                    to_visit.pop(), []):
+                if successor_id not in reached:
+                    reached.add(successor_id)
+                    to_visit.append(successor_id)
+                    closure_pairs.append((literal_id, successor_id))
+    return closure_pairs
+
+
+class CompiledArgumentationSystem:
+    """
+    A CompiledArgumentationSystem is an integer-indexed view of an
+    ArgumentationSystem. Literals and defeasible rules are interned to dense
+    ids (their position in the language and in the list of defeasible rules)
+    and all adjacency is stored in compressed sparse row (CSR) form, so that
+    algorithms can walk the graph without hashing Literal or Rule objects.
+
+    For each relation there is an offsets array and an indices array: the
+    neighbours of node i are indices[offsets[i]:offsets[i + 1]].
+
+    The strict rules come after the defeasible rules, so a rule id is strict
+    if it is at least nr_of_defeasible_rules. For each literal, the literals
+    that strictly follow from it alone (by chains of strict rules with a
+    single antecedent) are precomputed in the strict closure index.
+    """
+
+    def __init__(self, argumentation_system):
+        self.literals = list(argumentation_system.language.values())
+        self.literal_ids = {
+            literal.s1: literal_id
+            for literal_id, literal in enumerate(self.literals)}
+        self.rules = list(argumentation_system.defeasible_rules) + \
+            list(argumentation_system.strict_rules)
+        self.nr_of_defeasible_rules = \
+            len(argumentation_system.defeasible_rules)
+        # Keyed by the identity of the Rule: rules with several heads share
+        # their identifier and Rules compare by their string form, so
+        # neither tells two compiled rules apart.
+        self.rule_ids = {id(rule): rule_id
+                         for rule_id, rule in enumerate(self.rules)}
+
+        self.literal_names = tuple(literal.s1 for literal in self.literals)
+        self.nr_of_literals = len(self.literals)
+        self.nr_of_rules = len(self.rules)
+
+        literal_ids = self.literal_ids
+        self.rule_consequents = array(
+            'i', [literal_ids[rule.consequent.s1] for rule in self.rules])
+
+        # Rule -> antecedents
+        antecedent_pairs = [(rule_id, literal_ids[antecedent.s1])
+                            for rule_id, rule in enumerate(self.rules)
+                            for antecedent in rule.antecedents]
+        self.rule_antecedent_offsets, self.rule_antecedent_indices = \
+            _to_csr(self.nr_of_rules, antecedent_pairs)
+
+        # Literal -> rules concluding it
+        self.rules_for_offsets, self.rules_for_indices = _to_csr(
+            self.nr_of_literals,
+            ((consequent, rule_id)
+             for rule_id, consequent in enumerate(self.rule_consequents)))
+
+        # Literal -> rules using it as an antecedent
+        self.rules_using_offsets, self.rules_using_indices = _to_csr(
+            self.nr_of_literals,
+            ((literal_id, rule_id)
+             for rule_id, literal_id in antecedent_pairs))
+
+        # Literal -> its contraries and contradictories, and the reverse
+        contrary_pairs = [(literal_id, literal_ids[contrary.s1])
+                          for literal_id, literal in enumerate(self.literals)
+                          for contrary in
+                          literal.contraries_and_contradictories]
+        self.contrary_offsets, self.contrary_indices = \
+            _to_csr(self.nr_of_literals, contrary_pairs)
+        self.contrary_of_offsets, self.contrary_of_indices = _to_csr(
+            self.nr_of_literals,
+            ((contrary_id, literal_id)
+             for literal_id, contrary_id in contrary_pairs))
+
+        # Literal -> literals that strictly follow from it alone
+        self.strict_closure_offsets, self.strict_closure_indices = _to_csr(
+            self.nr_of_literals, strict_closure_pairs(
+                self.nr_of_defeasible_rules, self.rule_consequents,
+                self.rule_antecedent_offsets, self.rule_antecedent_indices))
+
+    def is_strict(self, rule_id: int) -> bool:
+        return rule_id >= self.nr_of_defeasible_rules
+
+    def antecedents(self, rule_id: int) -> array:
+        return self.rule_antecedent_indices[
+               self.rule_antecedent_offsets[rule_id]:
+               self.rule_antecedent_offsets[rule_id + 1]]
+
+    def rules_for(self, literal_id: int) -> array:
+        """
+        Ids of the rules that have the literal as their consequent.
+        """
+        return self.rules_for_indices[
+               self.rules_for_offsets[literal_id]:
+               self.rules_for_offsets[literal_id + 1]]
+
+    def rules_using(self, literal_id: int) -> array:
+        """
+        Ids of the rules that have the literal as one of their antecedents.
+        """
+        return self.rules_using_indices[
+               self.rules_using_offsets[literal_id]:
+               self.rules_using_offsets[literal_id + 1]]
+
+    def contraries(self, literal_id: int) -> array:
+        return self.contrary_indices[
+               self.contrary_offsets[literal_id]:
+               self.contrary_offsets[literal_id + 1]]
+
+    def strict_closure(self, literal_id: int) -> array:
+        """
+        Ids of the literals (other than the literal itself) that follow from
+        the literal alone by strict rules with a single antecedent.
+        """
+        return self.strict_closure_indices[
+               self.strict_closure_offsets[literal_id]:
+               self.strict_closure_offsets[literal_id + 1]]
+
+    def contrary_of(self, literal_id: int) -> array:
+        """
+        Ids of the literals that have this literal as a contrary or
+        contradictory.
+        """
+        return self.contrary_of_indices[
+               self.contrary_of_offsets[literal_id]:
+               self.contrary_of_offsets[literal_id + 1]]
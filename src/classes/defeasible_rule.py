@@ -5,6 +5,8 @@ from .rule import Rule
 
 
 class DefeasibleRule(Rule):
+    __slots__ = ()
+
     def __init__(self, rule_id: str, antecedents: Set[Literal],
                  consequent: Literal):
         super().__init__(rule_id, antecedents, consequent)
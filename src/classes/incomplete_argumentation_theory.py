@@ -1,16 +1,31 @@
-from typing import List, Optional, Union
+import bisect
+from array import array
+from typing import FrozenSet, Iterable, List, Optional, Union
 
 from .argumentation_system import ArgumentationSystem
 from .literal import Literal
 from .preference_preorder import PreferencePreorder
 
 
+def _in_sorted(sorted_literals: List[Literal], literal: Literal) -> bool:
+    index = bisect.bisect_left(sorted_literals, literal)
+    return index < len(sorted_literals) and \
+        sorted_literals[index] == literal
+
+
 class IncompleteArgumentationTheory:
     """
     An IncompleteArgumentationTheory consists of an ArgumentationSystem, a
     knowledge base and a set of queryables.
     By adding queryables, or their negations, to the knowledge base, future
     ArgumentationTheories can be obtained.
+
+    Membership of the knowledge base is indexed, and for each literal of the
+    language we keep track of how many of its contraries are observed (that
+    is, in the knowledge base) and how many of its contraries have an
+    observed contrary. The counts and the queryable bitset are built from the
+    compiled argumentation system when they are first needed, and the counts
+    are kept up to date when the knowledge base changes from then on.
     """
 
     def __init__(
@@ -40,6 +55,65 @@ class IncompleteArgumentationTheory:
                 PreferencePreorder.create_reflexive_preorder(
                     self._knowledge_base_ordinary_premises)
 
+        self._queryable_bitset = None
+        self._knowledge_base = None
+        self._knowledge_base_frozenset = None
+        self._knowledge_base_set = set(
+            self._knowledge_base_axioms +
+            self._knowledge_base_ordinary_premises)
+        self._observed_contrary_counts = None
+        self._contraries_with_observed_contrary_counts = None
+
+    def _build_contrary_counts(self):
+        if self._observed_contrary_counts is not None:
+            return
+        nr_of_literals = self.argumentation_system.compiled.nr_of_literals
+        self._observed_contrary_counts = \
+            array('i', bytes(4 * nr_of_literals))
+        self._contraries_with_observed_contrary_counts = \
+            array('i', bytes(4 * nr_of_literals))
+        for literal in self._knowledge_base_set:
+            self._count_observed_contraries(literal)
+
+    def _index_knowledge_base_literal(self, literal: Literal):
+        if literal in self._knowledge_base_set:
+            return
+        self._knowledge_base_set.add(literal)
+        self._knowledge_base = None
+        self._knowledge_base_frozenset = None
+        if self._observed_contrary_counts is not None:
+            self._count_observed_contraries(literal)
+
+    def _count_observed_contraries(self, literal: Literal):
+        compiled = self.argumentation_system.compiled
+        for literal_id in compiled.contrary_of(
+                compiled.literal_ids[literal.s1]):
+            self._observed_contrary_counts[literal_id] += 1
+            if self._observed_contrary_counts[literal_id] == 1:
+                for other_id in compiled.contrary_of(literal_id):
+                    self._contraries_with_observed_contrary_counts[
+                        other_id] += 1
+
+    def _unindex_knowledge_base_literal(self, literal: Literal):
+        if self.is_knowledge_base_axiom(literal) or \
+                _in_sorted(self._knowledge_base_ordinary_premises, literal):
+            # The literal is still in the knowledge base in another role.
+            return
+        self._knowledge_base_set.discard(literal)
+        self._knowledge_base = None
+        self._knowledge_base_frozenset = None
+        if self._observed_contrary_counts is None:
+            return
+
+        compiled = self.argumentation_system.compiled
+        for literal_id in compiled.contrary_of(
+                compiled.literal_ids[literal.s1]):
+            self._observed_contrary_counts[literal_id] -= 1
+            if self._observed_contrary_counts[literal_id] == 0:
+                for other_id in compiled.contrary_of(literal_id):
+                    self._contraries_with_observed_contrary_counts[
+                        other_id] -= 1
+
     @property
     def argumentation_system(self):
         return self._argumentation_system
@@ -48,6 +122,21 @@ class IncompleteArgumentationTheory:
     def queryables(self):
         return self._queryables
 
+    @property
+    def queryable_bitset(self) -> int:
+        """
+        Bitset over the literal ids of the compiled argumentation system, in
+        which bit i is set if and only if literal i is queryable.
+        """
+        if self._queryable_bitset is None:
+            compiled = self.argumentation_system.compiled
+            bitmap = bytearray((compiled.nr_of_literals + 7) // 8)
+            for queryable in self._queryables:
+                literal_id = compiled.literal_ids[queryable.s1]
+                bitmap[literal_id >> 3] |= 1 << (literal_id & 7)
+            self._queryable_bitset = int.from_bytes(bitmap, 'little')
+        return self._queryable_bitset
+
     def is_queryable(self, literal: Union[Literal, str]):
         if isinstance(literal, str):
             return self._is_queryable_dict[literal]
@@ -55,8 +144,21 @@ class IncompleteArgumentationTheory:
 
     @property
     def knowledge_base(self):
-        return self._knowledge_base_axioms + \
-            self._knowledge_base_ordinary_premises
+        """
+        The axioms followed by the ordinary premises. The list is cached, so
+        it should not be changed by the caller.
+        """
+        if self._knowledge_base is None:
+            self._knowledge_base = self._knowledge_base_axioms + \
+                self._knowledge_base_ordinary_premises
+        return self._knowledge_base
+
+    @property
+    def knowledge_base_set(self) -> FrozenSet[Literal]:
+        if self._knowledge_base_frozenset is None:
+            self._knowledge_base_frozenset = \
+                frozenset(self._knowledge_base_set)
+        return self._knowledge_base_frozenset
 
     @property
     def knowledge_base_axioms(self):
@@ -66,6 +168,64 @@ class IncompleteArgumentationTheory:
     def knowledge_base_ordinary_premises(self):
         return self._knowledge_base_ordinary_premises
 
+    def is_in_knowledge_base(self, literal: Literal) -> bool:
+        return literal in self._knowledge_base_set
+
+    def is_knowledge_base_axiom(self, literal: Literal) -> bool:
+        return _in_sorted(self.knowledge_base_axioms, literal)
+
+    def has_observed_contrary(self, literal: Literal) -> bool:
+        """
+        Boolean indicating if some contrary or contradictory of the literal
+        is in the knowledge base.
+        """
+        self._build_contrary_counts()
+        literal_id = self.argumentation_system.compiled.literal_ids[
+            literal.s1]
+        return self._observed_contrary_counts[literal_id] > 0
+
+    def all_contraries_have_observed_contrary(self, literal: Literal) -> \
+            bool:
+        """
+        Boolean indicating if each contrary or contradictory of the literal
+        has a contrary or contradictory in the knowledge base.
+        """
+        self._build_contrary_counts()
+        literal_id = self.argumentation_system.compiled.literal_ids[
+            literal.s1]
+        return self._contraries_with_observed_contrary_counts[literal_id] == \
+            len(literal.contraries_and_contradictories)
+
+    def add_knowledge_base_axiom(self, literal: Literal):
+        if self.is_knowledge_base_axiom(literal):
+            return
+        bisect.insort(self._knowledge_base_axioms, literal)
+        self._index_knowledge_base_literal(literal)
+
+    def remove_knowledge_base_axiom(self, literal: Literal):
+        if not self.is_knowledge_base_axiom(literal):
+            return
+        self._knowledge_base_axioms.remove(literal)
+        self._unindex_knowledge_base_literal(literal)
+
+    def with_axioms(self, axioms: Iterable[Literal]) -> \
+            'DerivedIncompleteArgumentationTheory':
+        """
+        Future theory in which the given literals are added to the axioms.
+        The result is a lightweight view that shares everything except the
+        knowledge base with this theory.
+        """
+        return DerivedIncompleteArgumentationTheory(self, axioms, [])
+
+    def without_axioms(self, axioms: Iterable[Literal]) -> \
+            'DerivedIncompleteArgumentationTheory':
+        """
+        Theory in which the given literals are removed from the axioms. The
+        result is a lightweight view that shares everything except the
+        knowledge base with this theory.
+        """
+        return DerivedIncompleteArgumentationTheory(self, [], axioms)
+
     def __eq__(self, other):
         return isinstance(other, IncompleteArgumentationTheory) and \
             self.argumentation_system == other.argumentation_system and \
@@ -75,3 +235,148 @@ class IncompleteArgumentationTheory:
             knowledge_base_ordinary_premises and \
             self.ordinary_premise_preferences == other.\
             ordinary_premise_preferences
+
+
+class DerivedIncompleteArgumentationTheory(IncompleteArgumentationTheory):
+    """
+    A DerivedIncompleteArgumentationTheory is a copy-on-write view on some
+    base IncompleteArgumentationTheory that only differs in its axioms. It
+    shares the argumentation system, the queryables (and their index) and the
+    preferences with its base and only stores the axioms that were added and
+    removed, so deriving it takes time in the size of that difference.
+
+    Knowledge base queries combine the indexes of the base with the
+    difference. The base should not be changed while views on it are in use.
+    """
+
+    def __init__(self, base: IncompleteArgumentationTheory,
+                 added_axioms: Iterable[Literal],
+                 removed_axioms: Iterable[Literal]):
+        # Views on views are views on the original base, with the
+        # differences combined.
+        if isinstance(base, DerivedIncompleteArgumentationTheory):
+            added = set(base._added_axioms)
+            removed = set(base._removed_axioms)
+            base = base._base
+        else:
+            added = set()
+            removed = set()
+        for axiom in added_axioms:
+            removed.discard(axiom)
+            if not base.is_knowledge_base_axiom(axiom):
+                added.add(axiom)
+        for axiom in removed_axioms:
+            added.discard(axiom)
+            if base.is_knowledge_base_axiom(axiom):
+                removed.add(axiom)
+
+        self._base = base
+        self._added_axioms = added
+        self._removed_axioms = removed
+
+        # Shared with the base
+        self._argumentation_system = base.argumentation_system
+        self._queryables = base.queryables
+        self._is_queryable_dict = base._is_queryable_dict
+        self._knowledge_base_ordinary_premises = \
+            base.knowledge_base_ordinary_premises
+        self.ordinary_premise_preferences = base.ordinary_premise_preferences
+
+        self._clear_cache()
+
+    def _clear_cache(self):
+        self._knowledge_base_axioms = None
+        self._knowledge_base = None
+        self._knowledge_base_frozenset = None
+
+        # Difference with the knowledge base of the base theory
+        self._added_to_knowledge_base = {
+            axiom for axiom in self._added_axioms
+            if not self._base.is_in_knowledge_base(axiom)}
+        self._removed_from_knowledge_base = {
+            axiom for axiom in self._removed_axioms
+            if not _in_sorted(self._knowledge_base_ordinary_premises, axiom)}
+
+    @property
+    def base(self) -> IncompleteArgumentationTheory:
+        return self._base
+
+    @property
+    def queryable_bitset(self) -> int:
+        return self._base.queryable_bitset
+
+    @property
+    def knowledge_base_axioms(self):
+        if self._knowledge_base_axioms is None:
+            self._knowledge_base_axioms = sorted(
+                [axiom for axiom in self._base.knowledge_base_axioms
+                 if axiom not in self._removed_axioms] +
+                list(self._added_axioms))
+        return self._knowledge_base_axioms
+
+    @property
+    def knowledge_base(self):
+        if self._knowledge_base is None:
+            self._knowledge_base = self.knowledge_base_axioms + \
+                self._knowledge_base_ordinary_premises
+        return self._knowledge_base
+
+    @property
+    def knowledge_base_set(self) -> FrozenSet[Literal]:
+        if self._knowledge_base_frozenset is None:
+            self._knowledge_base_frozenset = \
+                (self._base.knowledge_base_set -
+                 self._removed_from_knowledge_base) | \
+                self._added_to_knowledge_base
+        return self._knowledge_base_frozenset
+
+    def is_in_knowledge_base(self, literal: Literal) -> bool:
+        if literal in self._added_to_knowledge_base:
+            return True
+        if literal in self._removed_from_knowledge_base:
+            return False
+        return self._base.is_in_knowledge_base(literal)
+
+    def is_knowledge_base_axiom(self, literal: Literal) -> bool:
+        if literal in self._added_axioms:
+            return True
+        if literal in self._removed_axioms:
+            return False
+        return self._base.is_knowledge_base_axiom(literal)
+
+    def _nr_of_observed_contraries(self, literal: Literal) -> int:
+        literal_id = self.argumentation_system.compiled.literal_ids[
+            literal.s1]
+        self._base._build_contrary_counts()
+        nr_observed = self._base._observed_contrary_counts[literal_id]
+        if self._added_to_knowledge_base or \
+                self._removed_from_knowledge_base:
+            for contrary in literal.contraries_and_contradictories:
+                if contrary in self._added_to_knowledge_base:
+                    nr_observed += 1
+                elif contrary in self._removed_from_knowledge_base:
+                    nr_observed -= 1
+        return nr_observed
+
+    def has_observed_contrary(self, literal: Literal) -> bool:
+        return self._nr_of_observed_contraries(literal) > 0
+
+    def all_contraries_have_observed_contrary(self, literal: Literal) -> \
+            bool:
+        if not self._added_to_knowledge_base and \
+                not self._removed_from_knowledge_base:
+            return self._base.all_contraries_have_observed_contrary(literal)
+        return all(self.has_observed_contrary(contrary)
+                   for contrary in literal.contraries_and_contradictories)
+
+    def add_knowledge_base_axiom(self, literal: Literal):
+        self._removed_axioms.discard(literal)
+        if not self._base.is_knowledge_base_axiom(literal):
+            self._added_axioms.add(literal)
+        self._clear_cache()
+
+    def remove_knowledge_base_axiom(self, literal: Literal):
+        self._added_axioms.discard(literal)
+        if self._base.is_knowledge_base_axiom(literal):
+            self._removed_axioms.add(literal)
+        self._clear_cache()
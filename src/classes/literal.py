@@ -1,12 +1,19 @@
+import sys
 from functools import total_ordering
 
+# Shared by all literals without contraries or contradictories, instead of a
+# fresh (mutable) container per Literal.
+NO_CONTRARIES = ()
+
 
 @total_ordering
 class Literal:
+    __slots__ = ('s1', 's1_hash', 'contraries_and_contradictories')
+
     def __init__(self, literal_str: str):
-        self.s1 = literal_str
+        self.s1 = sys.intern(literal_str)
         self.s1_hash = hash(self.s1)
-        self.contraries_and_contradictories = []
+        self.contraries_and_contradictories = NO_CONTRARIES
 
     def __str__(self):
         return self.s1
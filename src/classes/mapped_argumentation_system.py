@@ -0,0 +1,132 @@
+import json
+import mmap
+import os
+from array import array
+from typing import Union
+
+from .compiled_argumentation_system import CompiledArgumentationSystem
+
+FORMAT_VERSION = 1
+HEADER_FILE = 'header.json'
+LITERAL_NAMES_FILE = 'literal_names'
+QUERYABLES_FILE = 'queryables'
+AXIOMS_FILE = 'axioms'
+
+# Int arrays of a CompiledArgumentationSystem, each stored in a file with the
+# same name. The offsets of the literal names in LITERAL_NAMES_FILE are
+# stored with 64 bits, as the names together may be larger than 2 GB.
+INT_ARRAYS = ('rule_consequents',
+              'rule_antecedent_offsets', 'rule_antecedent_indices',
+              'rules_for_offsets', 'rules_for_indices',
+              'rules_using_offsets', 'rules_using_indices',
+              'contrary_offsets', 'contrary_indices',
+              'contrary_of_offsets', 'contrary_of_indices',
+              'strict_closure_offsets', 'strict_closure_indices')
+LITERAL_NAME_OFFSETS = 'literal_name_offsets'
+
+
+def open_mapped_file(path: Union[str, os.PathLike], writable: bool = False):
+    """
+    Memory-map a file, or get an empty bytearray for an empty file (which
+    cannot be mapped).
+    """
+    with open(path, 'r+b' if writable else 'rb') as mapped_file:
+        if os.fstat(mapped_file.fileno()).st_size == 0:
+            return bytearray()
+        return mmap.mmap(mapped_file.fileno(), 0, access=mmap.ACCESS_WRITE
+                         if writable else mmap.ACCESS_READ)
+
+
+class _MappedNames:
+    """
+    Sequence of the literal names, decoded from the mapped names file when
+    they are looked up.
+    """
+
+    def __init__(self, names: Union[mmap.mmap, bytearray],
+                 offsets: memoryview):
+        self._names = names
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, literal_id: int) -> str:
+        return self._names[self._offsets[literal_id]:
+                           self._offsets[literal_id + 1]].decode()
+
+    def __iter__(self):
+        for literal_id in range(len(self)):
+            yield self[literal_id]
+
+
+class MappedArgumentationSystem(CompiledArgumentationSystem):
+    """
+    A MappedArgumentationSystem has the same integer ids and CSR arrays as a
+    CompiledArgumentationSystem, but the arrays live in memory-mapped files
+    (written by convert_lp_file), so that they are paged in by the operating
+    system as they are used. Next to the arrays, there are bitmaps of the
+    queryables and axioms.
+
+    Only the arrays and the literal names are available: there are no
+    Literal or Rule objects, and so no literals, rules, literal_ids or
+    rule_ids.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike]):
+        self.directory = directory
+        with open(os.path.join(directory, HEADER_FILE), 'r') as header_file:
+            header = json.load(header_file)
+        if header['version'] != FORMAT_VERSION:
+            raise ValueError(f'Unsupported format version '
+                             f'{header["version"]} in {directory}.')
+        self.nr_of_literals = header['nr_of_literals']
+        self.nr_of_rules = header['nr_of_rules']
+        self.nr_of_defeasible_rules = header['nr_of_defeasible_rules']
+
+        self._mapped_files = []
+        self._views = []
+        for array_name in INT_ARRAYS:
+            setattr(self, array_name, self._map_array(array_name, 'i'))
+        self.literal_names = _MappedNames(
+            self._map(LITERAL_NAMES_FILE),
+            self._map_array(LITERAL_NAME_OFFSETS, 'q'))
+        self.queryables = self._map(QUERYABLES_FILE)
+        self.axioms = self._map(AXIOMS_FILE)
+
+    def _map(self, file_name: str) -> Union[mmap.mmap, bytearray]:
+        mapped = open_mapped_file(os.path.join(self.directory, file_name))
+        self._mapped_files.append(mapped)
+        return mapped
+
+    def _map_array(self, file_name: str, typecode: str) -> memoryview:
+        mapped = self._map(file_name)
+        if not mapped:
+            return memoryview(array(typecode))
+        view = memoryview(mapped).cast(typecode)
+        self._views.append(view)
+        return view
+
+    def close(self):
+        """
+        Release the views on the mapped files and close them.
+        """
+        for view in self._views:
+            view.release()
+        for mapped in self._mapped_files:
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+        self._views = []
+        self._mapped_files = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def is_queryable(self, literal_id: int) -> bool:
+        return bool(self.queryables[literal_id >> 3] >> (literal_id & 7) & 1)
+
+    def is_axiom(self, literal_id: int) -> bool:
+        return bool(self.axioms[literal_id >> 3] >> (literal_id & 7) & 1)
@@ -1,29 +1,39 @@
-import itertools
-from typing import List, Tuple, Hashable, Optional
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from .strongly_connected_components import strongly_connected_components
 
 
 class PreferencePreorder:
+    """
+    A PreferencePreorder stores tuples (a, b), meaning that a is weaker than
+    b. The tuples are kept in an insertion-ordered dict, so that comparisons
+    are constant-time lookups.
+    """
     def __init__(
             self, preference_tuples:
             Optional[List[Tuple[Hashable, Hashable]]] = None):
+        self._preference_tuples: Dict[Tuple[Hashable, Hashable], None] = \
+            dict()
         if preference_tuples:
-            self.preference_tuples = preference_tuples
-        else:
-            self.preference_tuples = []
+            self._preference_tuples = dict.fromkeys(preference_tuples)
+
+    @property
+    def preference_tuples(self) -> List[Tuple[Hashable, Hashable]]:
+        return list(self._preference_tuples)
 
     def is_weaker_than(self, object_a, object_b):
-        return (object_a, object_b) in self.preference_tuples
+        return (object_a, object_b) in self._preference_tuples
 
     def is_strictly_weaker_than(self, object_a, object_b):
         return self.is_weaker_than(object_a, object_b) and not \
             self.is_weaker_than(object_b, object_a)
 
     def __eq__(self, other):
-        return set(sorted(self.preference_tuples)) == set(
-            sorted(other.preference_tuples))
+        return self._preference_tuples.keys() == \
+            set(other.preference_tuples)
 
     def append(self, item: Tuple[Hashable, Hashable]):
-        self.preference_tuples.append(item)
+        self._preference_tuples[item] = None
 
     @classmethod
     def create_reflexive_preorder(cls, items_to_be_ordered: List[Hashable]):
@@ -32,16 +42,97 @@ class PreferencePreorder:
         return cls(preference_tuples)
 
     def fix_transitivity(self):
-        do_fix = True
-        while do_fix:
-            add_ordering_items = []
-            do_fix = False
-            for ordering_item_a, ordering_item_b in itertools.permutations(
-                    self.preference_tuples, 2):
-                if ordering_item_a[1] == ordering_item_b[0]:
-                    ordering_item_combined = \
-                        (ordering_item_a[0], ordering_item_b[1])
-                    if ordering_item_combined not in self.preference_tuples:
-                        add_ordering_items.append(ordering_item_combined)
-                        do_fix = True
-            self.preference_tuples += add_ordering_items
+        """
+        Add all tuples that are needed to make the order transitive.
+
+        The strongly connected components of the order are computed with
+        (an iterative version of) Tarjan's algorithm, which yields them in
+        reverse topological order. The items reachable from each component
+        can then be collected in a single pass, as bitsets over the items.
+        """
+        item_ids = dict()
+        successors = []
+        for object_a, object_b in self._preference_tuples:
+            for item in (object_a, object_b):
+                if item not in item_ids:
+                    item_ids[item] = len(successors)
+                    successors.append([])
+            successors[item_ids[object_a]].append(item_ids[object_b])
+        items = list(item_ids)
+
+        reachable = [0] * len(items)
+        for component in strongly_connected_components(successors):
+            component_bits = 0
+            is_cyclic = len(component) > 1
+            for item_id in component:
+                component_bits |= 1 << item_id
+            for item_id in component:
+                if item_id in successors[item_id]:
+                    is_cyclic = True
+            component_reachable = component_bits if is_cyclic else 0
+            for item_id in component:
+                for successor_id in successors[item_id]:
+                    component_reachable |= \
+                        reachable[successor_id] | (1 << successor_id)
+            for item_id in component:
+                reachable[item_id] = component_reachable
+
+        for item_id, item in enumerate(items):
+            bits = reachable[item_id]
+            while bits:
+                lowest_bit = bits & -bits
+                self.append((item, items[lowest_bit.bit_length() - 1]))
+                bits ^= lowest_bit
+
+    def covering_tuples(self) -> List[Tuple[Hashable, Hashable]]:
+        """
+        Get the tuples of the Hasse diagram of the order, which give back
+        the transitive closure of the order by fix_transitivity.
+
+        Items that are weaker than each other (a strongly connected
+        component) are connected in a cycle, and a component is connected
+        to another only from its first to its first item, and only if the
+        other is not already reachable through a closer component. As the
+        components are yielded in reverse topological order, a component
+        that reaches another comes after it.
+        """
+        item_ids = dict()
+        successors = []
+        for object_a, object_b in self._preference_tuples:
+            for item in (object_a, object_b):
+                if item not in item_ids:
+                    item_ids[item] = len(successors)
+                    successors.append([])
+            successors[item_ids[object_a]].append(item_ids[object_b])
+        items = list(item_ids)
+
+        covering = []
+        component_ids = [0] * len(items)
+        representatives = []
+        reachable = []
+        for component_id, component in enumerate(
+                strongly_connected_components(successors)):
+            for item_id in component:
+                component_ids[item_id] = component_id
+            representatives.append(component[0])
+            if len(component) > 1:
+                for index, item_id in enumerate(component):
+                    covering.append((items[item_id], items[
+                        component[(index + 1) % len(component)]]))
+            elif component[0] in successors[component[0]]:
+                covering.append((items[component[0]], items[component[0]]))
+
+            successor_components = sorted(
+                {component_ids[successor_id] for item_id in component
+                 for successor_id in successors[item_id]} -
+                {component_id}, reverse=True)
+            component_reachable = 0
+            for successor_component in successor_components:
+                if not component_reachable >> successor_component & 1:
+                    covering.append((
+                        items[component[0]],
+                        items[representatives[successor_component]]))
+                component_reachable |= reachable[successor_component] | \
+                    (1 << successor_component)
+            reachable.append(component_reachable)
+        return covering
@@ -1,3 +1,4 @@
+import sys
 from typing import Set
 
 from .literal import Literal
@@ -6,17 +7,25 @@ from .literal import Literal
 class Rule:
     """
     A Rule has a list of antecedents and a single consequent.
+
+    Only the hash of the string form of the Rule is stored; the string itself
+    is computed again when it is needed.
     """
+    __slots__ = ('id', 'antecedents', 'consequent', 'rule_hash')
+
     def __init__(self, rule_id: str, antecedents: Set[Literal],
                  consequent: Literal):
-        self.id = str(rule_id)
-        self.antecedents = sorted(antecedents)
+        self.id = sys.intern(str(rule_id))
+        self.antecedents = tuple(sorted(antecedents))
         self.consequent = consequent
-        self.rule_str = ','.join([str(antecedent)
-                                  for antecedent in self.antecedents]) + \
-                        '=>' + str(self.consequent)
         self.rule_hash = hash(self.rule_str)
 
+    @property
+    def rule_str(self) -> str:
+        return ','.join([str(antecedent)
+                         for antecedent in self.antecedents]) + \
+            '=>' + str(self.consequent)
+
     def is_rule_for(self, literal: Literal) -> bool:
         """
         Check if this is a Rule for a specific Literal.
@@ -1,10 +1,12 @@
-from typing import Set
+from typing import List, Set
 
 from .literal import Literal
 from .rule import Rule
 
 
 class StrictRule(Rule):
+    __slots__ = ()
+
     def __init__(self, rule_id: str, antecedents: Set[Literal],
                  consequent: Literal):
         super().__init__(rule_id, antecedents, consequent)
@@ -15,3 +17,40 @@ class StrictRule(Rule):
 
     def __str__(self):
         return self.__repr__()
+
+
+def _contradictories(literal: Literal) -> List[Literal]:
+    return [contrary for contrary in literal.contraries_and_contradictories
+            if literal in contrary.contraries_and_contradictories]
+
+
+def close_under_transposition(strict_rules: List[StrictRule]) -> \
+        List[StrictRule]:
+    """
+    Add the transpositions of the strict rules until the set is closed under
+    transposition: for a rule a_1, ..., a_n -> c, each rule that replaces
+    some a_i by a contradictory of c and concludes a contradictory of a_i.
+    Contradictories are the literals that are each other's contrary, so the
+    contraries of the literals must be set before.
+
+    Transposed rules get the identifier of the original rule, extended with
+    the position of the transposition.
+    """
+    closed_rules = dict.fromkeys(strict_rules)
+    to_transpose = list(strict_rules)
+    while to_transpose:
+        rule = to_transpose.pop()
+        transposition_nr = 0
+        for antecedent in rule.antecedents:
+            other_antecedents = set(rule.antecedents) - {antecedent}
+            for negated_consequent in _contradictories(rule.consequent):
+                for negated_antecedent in _contradictories(antecedent):
+                    transposed_rule = StrictRule(
+                        f'{rule.id}_t{transposition_nr}',
+                        other_antecedents | {negated_consequent},
+                        negated_antecedent)
+                    transposition_nr += 1
+                    if transposed_rule not in closed_rules:
+                        closed_rules[transposed_rule] = None
+                        to_transpose.append(transposed_rule)
+    return list(closed_rules)
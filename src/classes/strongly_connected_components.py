@@ -0,0 +1,55 @@
+from typing import List
+
+
+def strongly_connected_components(successors: List[List[int]]) -> \
+        List[List[int]]:
+    """
+    Iterative version of Tarjan's algorithm. The components are returned in
+    reverse topological order: a component comes after all components that
+    can be reached from it.
+    """
+    index_counter = 0
+    indices = [-1] * len(successors)
+    low_links = [0] * len(successors)
+    on_stack = [False] * len(successors)
+    stack = []
+    components = []
+
+    for root in range(len(successors)):
+        if indices[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, successor_position = work.pop()
+            if successor_position == 0:
+                indices[node] = low_links[node] = index_counter
+                index_counter += 1
+                stack.append(node)
+                on_stack[node] = True
+            recurse = False
+            node_successors = successors[node]
+            while successor_position < len(node_successors):
+                successor = node_successors[successor_position]
+                successor_position += 1
+                if indices[successor] == -1:
+                    work.append((node, successor_position))
+                    work.append((successor, 0))
+                    recurse = True
+                    break
+                if on_stack[successor]:
+                    low_links[node] = min(low_links[node], indices[successor])
+            if recurse:
+                continue
+            if low_links[node] == indices[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+            if work:
+                parent = work[-1][0]
+                low_links[parent] = min(low_links[parent], low_links[node])
+    return components
@@ -0,0 +1,81 @@
+import gc
+import random
+import tracemalloc
+
+from src.classes.argumentation_system import ArgumentationSystem
+from src.classes.defeasible_rule import DefeasibleRule
+from src.classes.literal import Literal
+
+NR_OF_LITERALS = 20000
+NR_OF_RULES = 100000
+MAX_NR_OF_ANTECEDENTS = 5
+
+
+def _traced_bytes(build_function):
+    """
+    Run build_function and return its result together with the number of
+    bytes that are still allocated by it afterwards.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = build_function()
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, after - before
+
+
+def build_language(nr_of_literals: int):
+    language = dict()
+    for pos_literal_index in range(int(nr_of_literals / 2)):
+        for literal_str in ['l' + str(pos_literal_index),
+                            'not_l' + str(pos_literal_index)]:
+            language[literal_str] = Literal(literal_str)
+    return language
+
+
+def build_contradictories(language):
+    return {literal_str: {language['not_' + literal_str]}
+            if not literal_str.startswith('not_') else
+            {language[literal_str[4:]]}
+            for literal_str in language.keys()}
+
+
+def build_rules(language, nr_of_rules: int):
+    literals = list(language.values())
+    return [DefeasibleRule(
+        'd' + str(rule_index),
+        set(random.sample(literals,
+                          random.randint(1, MAX_NR_OF_ANTECEDENTS))),
+        random.choice(literals))
+        for rule_index in range(nr_of_rules)]
+
+
+def build_argumentation_system(nr_of_literals: int, nr_of_rules: int):
+    language = build_language(nr_of_literals)
+    rules = build_rules(language, nr_of_rules)
+    return ArgumentationSystem(language, build_contradictories(language), [],
+                               rules, add_defeasible_rule_literals=False)
+
+
+def run_memory_benchmark(nr_of_literals: int = NR_OF_LITERALS,
+                         nr_of_rules: int = NR_OF_RULES):
+    random.seed(0)
+    language, language_bytes = _traced_bytes(
+        lambda: build_language(nr_of_literals))
+    _, rule_bytes = _traced_bytes(lambda: build_rules(language, nr_of_rules))
+    _, system_bytes = _traced_bytes(
+        lambda: build_argumentation_system(nr_of_literals, nr_of_rules))
+
+    print(f'{nr_of_literals} literals, {nr_of_rules} rules')
+    print(f'Bytes per literal (including name and language entry): '
+          f'{language_bytes / nr_of_literals:.1f}')
+    print(f'Bytes per rule (including antecedents): '
+          f'{rule_bytes / nr_of_rules:.1f}')
+    print(f'Bytes for the complete argumentation system (including '
+          f'contraries and the default rule preferences): {system_bytes}')
+
+
+if __name__ == '__main__':
+    run_memory_benchmark()
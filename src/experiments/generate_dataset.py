@@ -1,11 +1,7 @@
 import pathlib
 import random
 
-from src.classes.incomplete_argumentation_theory import \
-    IncompleteArgumentationTheory
 from src.experiments.run_experiments import RESULTS_PATH, run_stability_experiments, run_relevance_experiments
-from src.generators.iat_generator import \
-    generate_single_layered, generate_single_random
 from src.import_export.iat_from_lp_reader import read_from_lp_file
 from src.import_export.iat_to_lp_writer import write_to_lp_file
 
@@ -43,12 +39,7 @@ def generate_police_dataset():
                     axiom_candidates.remove(new_axiom_contrary)
 
         # Export
-        iat_with_axioms = \
-            IncompleteArgumentationTheory(
-                argumentation_system=iat.argumentation_system,
-                queryables=iat.queryables,
-                knowledge_base_axioms=axioms,
-                knowledge_base_ordinary_premises=[])
+        iat_with_axioms = iat.with_axioms(axioms)
         write_path = str(
             pathlib.Path(__file__).parent.parent.parent / 'dataset' /
             'police' / ('police_60lit_' + str(generated_index) + '.lp'))
@@ -57,6 +48,8 @@ def generate_police_dataset():
 
 
 def generate_layered_dataset(small=True):
+    from src.generators.iat_generator import generate_single_layered
+
     if small:
         nr_of_literals_list = SMALL_NR_OF_LITERALS
         folder_name = 'layered_small'
@@ -76,6 +69,8 @@ def generate_layered_dataset(small=True):
 
 
 def generate_random_dataset(small=True):
+    from src.generators.iat_generator import generate_single_random
+
     if small:
         nr_of_literals_list = SMALL_NR_OF_LITERALS
         folder_name = 'random_small'
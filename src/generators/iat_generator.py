@@ -1,8 +1,6 @@
 import random
 from typing import Optional, List
 
-from .layered_as_generator import LayeredArgumentationSystemGenerator
-from .random_as_generator import RandomArgumentationSystemGenerator
 from ..classes.argumentation_system import ArgumentationSystem
 from ..classes.literal import Literal
 from ..classes.incomplete_argumentation_theory import \
@@ -103,7 +101,10 @@ class IncompleteArgumentationTheoryGenerator:
             knowledge_base_ordinary_premises=ordinary_premises)
 
 
-def generate_single_layered(nr_literals):
+def generate_single_layered(nr_literals, add_rule_preferences=False,
+                            strict_rule_ratio=0):
+    from .layered_as_generator import LayeredArgumentationSystemGenerator
+
     nr_rules = int((nr_literals * 3) / 2)
     rule_antecedent_distribution = {1: int(nr_rules / 3),
                                     2: int(nr_rules / 3),
@@ -125,12 +126,13 @@ def generate_single_layered(nr_literals):
             nr_of_rules=nr_rules,
             rule_antecedent_distribution=rule_antecedent_distribution,
             literal_layer_distribution=literal_layer_distribution,
-            strict_rule_ratio=0)
+            strict_rule_ratio=strict_rule_ratio)
 
     # Generate the argumentation system, and keep the "layers" of literals.
     arg_sys, layered_language = \
         layered_argumentation_system_generator.generate(
-            return_layered_language=True, add_rule_preferences=False)
+            return_layered_language=True,
+            add_rule_preferences=add_rule_preferences)
 
     # Generate an incomplete argumentation theory, where only literals on the
     # first layer can be queryable.
@@ -155,6 +157,8 @@ def generate_single_layered(nr_literals):
 
 
 def generate_single_random(nr_literals):
+    from .random_as_generator import RandomArgumentationSystemGenerator
+
     nr_rules = int((nr_literals * 3) / 2)
     rule_antecedent_distribution = {1: int(nr_rules / 3),
                                     2: int(nr_rules / 3),
@@ -1,5 +1,5 @@
-import itertools
 import random
+from collections import defaultdict
 from typing import Dict, List, Tuple, Set
 
 from ..classes.argumentation_system import ArgumentationSystem
@@ -263,12 +263,16 @@ class LayeredArgumentationSystemGenerator:
             rule_preferences = PreferencePreorder()
             shuffled_defeasible_rules = defeasible_rules.copy()
             random.shuffle(shuffled_defeasible_rules)
-            contradicting_rules = {
-                (rule_a, rule_b)
-                for rule_a, rule_b in itertools.combinations(
-                    shuffled_defeasible_rules, 2)
-                if rule_a.consequent in contradictories[
-                    str(rule_b.consequent)]}
+            # Pairs (rule_a, rule_b) of rules with contradicting
+            # consequents, where rule_a comes first in the shuffled order.
+            earlier_rules_by_consequent = defaultdict(list)
+            contradicting_rules = set()
+            for rule_b in shuffled_defeasible_rules:
+                for contrary in contradictories[str(rule_b.consequent)]:
+                    for rule_a in earlier_rules_by_consequent[str(contrary)]:
+                        contradicting_rules.add((rule_a, rule_b))
+                earlier_rules_by_consequent[str(rule_b.consequent)].append(
+                    rule_b)
             leq_rules = random.sample(list(contradicting_rules),
                                       int(len(contradicting_rules) / 2))
             for geq_tuple in leq_rules:
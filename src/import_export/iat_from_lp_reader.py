@@ -1,7 +1,10 @@
+from typing import List
+
 from ..classes.argumentation_system import ArgumentationSystem
 from ..classes.defeasible_rule import DefeasibleRule
 from ..classes.literal import Literal
 from ..classes.preference_preorder import PreferencePreorder
+from ..classes.strict_rule import StrictRule
 from ..classes.incomplete_argumentation_theory import \
     IncompleteArgumentationTheory
 
@@ -12,8 +15,11 @@ def read_from_lp_file(file_path: str) -> IncompleteArgumentationTheory:
     axiom_strs = []
     defeasible_rule_bodies = []
     defeasible_rule_heads = []
+    strict_rule_bodies = []
+    strict_rule_heads = []
     contradiction_pairs = []
     preferred_pairs = []
+    preferred_cover_pairs = []
 
     reader = open(file_path, 'r')
     for line in reader:
@@ -31,10 +37,19 @@ def read_from_lp_file(file_path: str) -> IncompleteArgumentationTheory:
         if line.startswith('head'):
             defeasible_rule_heads.append((line.split(
                 '(', 1)[1].split(')', 1)[0]).split(',', 1))
+        if line.startswith('strict_body'):
+            strict_rule_bodies.append((line.split(
+                '(', 1)[1].split(')', 1)[0]).split(',', 1))
+        if line.startswith('strict_head'):
+            strict_rule_heads.append((line.split(
+                '(', 1)[1].split(')', 1)[0]).split(',', 1))
         if line.startswith('neg'):
             contradiction_pairs.append((line.split(
                 '(', 1)[1].split(')', 1)[0]).split(',', 1))
-        if line.startswith('preferred'):
+        if line.startswith('preferred_cover'):
+            preferred_cover_pairs.append((line.split(
+                '(', 1)[1].split(')', 1)[0]).split(',', 1))
+        elif line.startswith('preferred'):
             preferred_pairs.append((line.split(
                 '(', 1)[1].split(')', 1)[0]).split(',', 1))
     reader.close()
@@ -57,16 +72,32 @@ def read_from_lp_file(file_path: str) -> IncompleteArgumentationTheory:
             language[rule_head])
         defeasible_rules.append(defeasible_rule)
 
+    strict_rules = []
+    for rule_nr, rule_head in strict_rule_heads:
+        rule_antecedents = [
+            rule_body_literal
+            for rule_body_nr, rule_body_literal in strict_rule_bodies
+            if rule_body_nr == rule_nr]
+        strict_rules.append(StrictRule(
+            rule_nr, {language[ant_str] for ant_str in rule_antecedents},
+            language[rule_head]))
+
     def_rules_lookup = {defeasible_rule.id: defeasible_rule
                         for defeasible_rule in defeasible_rules}
     preference_preorder = PreferencePreorder(
         [(def_rules_lookup[rule_a], def_rules_lookup[rule_b])
          for rule_a, rule_b in preferred_pairs])
+    if preferred_cover_pairs:
+        # Hasse diagram of the preferences, as written by write_lp
+        for rule_a, rule_b in preferred_cover_pairs:
+            preference_preorder.append(
+                (def_rules_lookup[rule_a], def_rules_lookup[rule_b]))
+        preference_preorder.fix_transitivity()
 
     argumentation_system = ArgumentationSystem(
         language=language,
         contraries_and_contradictories=contraries_and_contradictories,
-        strict_rules=[], defeasible_rules=defeasible_rules,
+        strict_rules=strict_rules, defeasible_rules=defeasible_rules,
         defeasible_rule_preferences=preference_preorder,
         add_defeasible_rule_literals=False)
 
@@ -80,3 +111,12 @@ def read_from_lp_file(file_path: str) -> IncompleteArgumentationTheory:
         knowledge_base_ordinary_premises=[],
         ordinary_premise_preferences=None
     )
+
+
+def read_topics_from_lp_file(file_path: str) -> List[str]:
+    topic_strs = []
+    with open(file_path, 'r') as reader:
+        for line in reader:
+            if line.startswith('topic'):
+                topic_strs.append(line.split('(', 1)[1].split(')', 1)[0])
+    return topic_strs
@@ -1,8 +1,10 @@
-from typing import Optional, List
+import io
+from typing import Optional, List, TextIO
 
 from ..classes.incomplete_argumentation_theory import \
     IncompleteArgumentationTheory
 from ..classes.literal import Literal
+from ..classes.preference_preorder import PreferencePreorder
 
 
 def write_to_lp_file(
@@ -10,37 +12,81 @@ def write_to_lp_file(
         write_path: str,
         topic_literals: Optional[List[Literal]] = None):
     with open(write_path, 'w') as write_file:
-        for literal in iat.argumentation_system.language:
-            write_file.write(f'literal({literal.lower()}).\n')
-        write_file.write('\n')
+        write_lp(iat, write_file, topic_literals)
 
-        for queryable in iat.queryables:
-            write_file.write(f'queryable({queryable.s1.lower()}).\n')
-        write_file.write('\n')
 
+def to_lp_str(iat: IncompleteArgumentationTheory,
+              topic_literals: Optional[List[Literal]] = None,
+              with_axioms: bool = True) -> str:
+    """
+    Get the LP program of the theory as a string, for instance to add it to
+    a clingo control without writing a file.
+    """
+    lp_str = io.StringIO()
+    write_lp(iat, lp_str, topic_literals, with_axioms)
+    return lp_str.getvalue()
+
+
+def write_lp(iat: IncompleteArgumentationTheory, write_file: TextIO,
+             topic_literals: Optional[List[Literal]] = None,
+             with_axioms: bool = True):
+    """
+    Write the LP program of the theory to a text stream. Without axioms,
+    only the argumentation system, the queryables and the topics are
+    written.
+    """
+    for literal in iat.argumentation_system.language:
+        write_file.write(f'literal({literal.lower()}).\n')
+    write_file.write('\n')
+
+    for queryable in iat.queryables:
+        write_file.write(f'queryable({queryable.s1.lower()}).\n')
+    write_file.write('\n')
+
+    if with_axioms:
         for axiom in iat.knowledge_base_axioms:
             write_file.write(f'axiom({axiom.s1.lower()}).\n')
         write_file.write('\n')
 
-        for literal_str, literal in iat.argumentation_system.language.items():
-            for contrary in literal.contraries_and_contradictories:
-                write_file.write(f'neg({literal_str.lower()},'
-                                 f'{contrary.s1.lower()}).\n')
-        write_file.write('\n')
+    for literal_str, literal in iat.argumentation_system.language.items():
+        for contrary in literal.contraries_and_contradictories:
+            write_file.write(f'neg({literal_str.lower()},'
+                             f'{contrary.s1.lower()}).\n')
+    write_file.write('\n')
 
-        for rule in iat.argumentation_system.defeasible_rules:
-            for antecedent in rule.antecedents:
-                write_file.write(f'body({str(rule.id)},'
-                                 f'{antecedent.s1.lower()}).\n')
-            write_file.write(f'head({str(rule.id)},'
-                             f'{rule.consequent.s1.lower()}).\n')
-        write_file.write('\n')
+    for rule in iat.argumentation_system.defeasible_rules:
+        for antecedent in rule.antecedents:
+            write_file.write(f'body({str(rule.id)},'
+                             f'{antecedent.s1.lower()}).\n')
+        write_file.write(f'head({str(rule.id)},'
+                         f'{rule.consequent.s1.lower()}).\n')
+    write_file.write('\n')
 
-        for (r1, r2) in iat.argumentation_system.rule_preferences.\
-                preference_tuples:
-            write_file.write(f'preferred({r1.id},{r2.id}).\n')
-        write_file.write('\n')
+    for rule in iat.argumentation_system.strict_rules:
+        for antecedent in rule.antecedents:
+            write_file.write(f'strict_body({str(rule.id)},'
+                             f'{antecedent.s1.lower()}).\n')
+        write_file.write(f'strict_head({str(rule.id)},'
+                         f'{rule.consequent.s1.lower()}).\n')
+    write_file.write('\n')
+
+    # If the rule preferences are transitive, only their Hasse diagram is
+    # written, as the encodings and the reader take its transitive closure.
+    # Other rule preferences are written as they are.
+    rule_id_preferences = PreferencePreorder(
+        [(r1.id, r2.id) for (r1, r2) in
+         iat.argumentation_system.rule_preferences.preference_tuples])
+    closed_preferences = PreferencePreorder(
+        rule_id_preferences.preference_tuples)
+    closed_preferences.fix_transitivity()
+    if closed_preferences == rule_id_preferences:
+        for (r1_id, r2_id) in rule_id_preferences.covering_tuples():
+            write_file.write(f'preferred_cover({r1_id},{r2_id}).\n')
+    else:
+        for (r1_id, r2_id) in rule_id_preferences.preference_tuples:
+            write_file.write(f'preferred({r1_id},{r2_id}).\n')
+    write_file.write('\n')
 
-        if topic_literals:
-            for topic_literal in topic_literals:
-                write_file.write(f'topic({topic_literal.s1.lower()}).\n')
+    if topic_literals:
+        for topic_literal in topic_literals:
+            write_file.write(f'topic({topic_literal.s1.lower()}).\n')
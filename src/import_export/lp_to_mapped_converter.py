@@ -0,0 +1,182 @@
+import json
+import os
+from array import array
+from typing import Dict, Tuple, Union
+
+from ..classes.compiled_argumentation_system import csr_from_arrays, \
+    strict_closure_pairs
+from ..classes.mapped_argumentation_system import MappedArgumentationSystem, \
+    FORMAT_VERSION, HEADER_FILE, LITERAL_NAMES_FILE, QUERYABLES_FILE, \
+    AXIOMS_FILE, INT_ARRAYS, LITERAL_NAME_OFFSETS
+
+# Facts about rules: whether they are about defeasible (0) or strict (1)
+# rules and whether they give a body literal or the head.
+_RULE_FACTS = {'body': (0, True), 'head': (0, False),
+               'strict_body': (1, True), 'strict_head': (1, False)}
+
+
+def _unique_rows(offsets: array, indices: array) -> Tuple[array, array]:
+    """
+    Remove repeated targets from each row of a CSR adjacency.
+    """
+    unique_offsets = array('i', [0])
+    unique_indices = array('i')
+    for node in range(len(offsets) - 1):
+        unique_indices.extend(dict.fromkeys(
+            indices[offsets[node]:offsets[node + 1]]))
+        unique_offsets.append(len(unique_indices))
+    return unique_offsets, unique_indices
+
+
+def _to_bitmap(nr_of_bits: int, bit_ids: array) -> bytearray:
+    bitmap = bytearray((nr_of_bits + 7) // 8)
+    for bit_id in bit_ids:
+        bitmap[bit_id >> 3] |= 1 << (bit_id & 7)
+    return bitmap
+
+
+def convert_lp_file(lp_path: Union[str, os.PathLike],
+                    directory: Union[str, os.PathLike]) -> \
+        MappedArgumentationSystem:
+    """
+    Convert a theory in an LP file to the files of a
+    MappedArgumentationSystem in the directory, and open it.
+
+    The file is read in one pass, without creating Literal or Rule objects:
+    literals are numbered in order of first occurrence and all relations are
+    collected in int arrays. As for read_from_lp_file, rules that share an
+    identifier share their body, and each head gives a rule. Rule
+    preferences and topics are left out, as the StabilityLabeler does not
+    use them.
+    """
+    os.makedirs(directory, exist_ok=True)
+    header_path = os.path.join(directory, HEADER_FILE)
+    if os.path.exists(header_path):
+        os.remove(header_path)
+    literal_ids: Dict[str, int] = dict()
+    literal_name_offsets = array('q', [0])
+    queryable_ids = array('i')
+    axiom_ids = array('i')
+    contrary_sources = array('i')
+    contrary_targets = array('i')
+    # For defeasible and strict rules: the identifiers of the rules, and the
+    # body and head facts by the position of their identifier.
+    rule_str_ids = [dict(), dict()]
+    body_rules = [array('i'), array('i')]
+    body_literals = [array('i'), array('i')]
+    head_rules = [array('i'), array('i')]
+    head_literals = [array('i'), array('i')]
+
+    with open(os.path.join(directory, LITERAL_NAMES_FILE), 'wb') as \
+            names_file:
+        def intern_literal(literal_str: str) -> int:
+            if literal_str not in literal_ids:
+                literal_ids[literal_str] = len(literal_ids)
+                encoded_name = literal_str.encode()
+                names_file.write(encoded_name)
+                literal_name_offsets.append(
+                    literal_name_offsets[-1] + len(encoded_name))
+            return literal_ids[literal_str]
+
+        def intern_rule(kind: int, rule_str: str) -> int:
+            return rule_str_ids[kind].setdefault(
+                rule_str, len(rule_str_ids[kind]))
+
+        with open(lp_path, 'r') as reader:
+            for line in reader:
+                predicate, _, arguments = line.partition('(')
+                arguments = arguments.split(')', 1)[0]
+                if predicate == 'literal':
+                    intern_literal(arguments)
+                elif predicate == 'queryable':
+                    queryable_ids.append(intern_literal(arguments))
+                elif predicate == 'axiom':
+                    axiom_ids.append(intern_literal(arguments))
+                elif predicate == 'neg':
+                    literal_str, contrary_str = arguments.split(',', 1)
+                    contrary_sources.append(intern_literal(literal_str))
+                    contrary_targets.append(intern_literal(contrary_str))
+                elif predicate in _RULE_FACTS:
+                    kind, is_body = _RULE_FACTS[predicate]
+                    rule_str, literal_str = arguments.split(',', 1)
+                    rules, literals = (body_rules, body_literals) \
+                        if is_body else (head_rules, head_literals)
+                    rules[kind].append(intern_rule(kind, rule_str))
+                    literals[kind].append(intern_literal(literal_str))
+    # The names are in the names file now, so they can be dropped.
+    nr_of_literals = len(literal_ids)
+    del literal_ids
+
+    # Each head gives a rule, with the (distinct) body literals of its
+    # identifier as antecedents. The strict rules come after the defeasible
+    # rules.
+    arrays = dict()
+    rule_consequents = array('i')
+    antecedent_offsets = array('i', [0])
+    antecedent_indices = array('i')
+    for kind in (0, 1):
+        body_offsets, body_indices = csr_from_arrays(
+            len(rule_str_ids[kind]), body_rules[kind], body_literals[kind])
+        for rule_str_id, consequent_id in zip(head_rules[kind],
+                                               head_literals[kind]):
+            rule_consequents.append(consequent_id)
+            antecedent_indices.extend(dict.fromkeys(
+                body_indices[body_offsets[rule_str_id]:
+                             body_offsets[rule_str_id + 1]]))
+            antecedent_offsets.append(len(antecedent_indices))
+    nr_of_defeasible_rules = len(head_rules[0])
+    nr_of_rules = len(rule_consequents)
+    arrays['rule_consequents'] = rule_consequents
+    arrays['rule_antecedent_offsets'] = antecedent_offsets
+    arrays['rule_antecedent_indices'] = antecedent_indices
+
+    arrays['rules_for_offsets'], arrays['rules_for_indices'] = \
+        csr_from_arrays(nr_of_literals, rule_consequents, range(nr_of_rules))
+    antecedent_rules = array('i')
+    for rule_id in range(nr_of_rules):
+        antecedent_rules.extend(
+            [rule_id] * (antecedent_offsets[rule_id + 1] -
+                         antecedent_offsets[rule_id]))
+    arrays['rules_using_offsets'], arrays['rules_using_indices'] = \
+        csr_from_arrays(nr_of_literals, antecedent_indices, antecedent_rules)
+
+    contrary_offsets, contrary_indices = _unique_rows(*csr_from_arrays(
+        nr_of_literals, contrary_sources, contrary_targets))
+    contrary_literals = array('i')
+    for literal_id in range(nr_of_literals):
+        contrary_literals.extend(
+            [literal_id] * (contrary_offsets[literal_id + 1] -
+                             contrary_offsets[literal_id]))
+    arrays['contrary_offsets'] = contrary_offsets
+    arrays['contrary_indices'] = contrary_indices
+    arrays['contrary_of_offsets'], arrays['contrary_of_indices'] = \
+        csr_from_arrays(nr_of_literals, contrary_indices, contrary_literals)
+
+    closure_sources = array('i')
+    closure_targets = array('i')
+    for literal_id, implied_id in strict_closure_pairs(
+            nr_of_defeasible_rules, rule_consequents, antecedent_offsets,
+            antecedent_indices):
+        closure_sources.append(literal_id)
+        closure_targets.append(implied_id)
+    arrays['strict_closure_offsets'], arrays['strict_closure_indices'] = \
+        csr_from_arrays(nr_of_literals, closure_sources, closure_targets)
+    arrays[LITERAL_NAME_OFFSETS] = literal_name_offsets
+
+    for array_name in (*INT_ARRAYS, LITERAL_NAME_OFFSETS):
+        with open(os.path.join(directory, array_name), 'wb') as array_file:
+            arrays[array_name].tofile(array_file)
+    for file_name, bit_ids in [(QUERYABLES_FILE, queryable_ids),
+                               (AXIOMS_FILE, axiom_ids)]:
+        with open(os.path.join(directory, file_name), 'wb') as bitmap_file:
+            bitmap_file.write(_to_bitmap(nr_of_literals, bit_ids))
+
+    # The header is written last, so that an interrupted conversion cannot
+    # be opened.
+    with open(header_path, 'w') as header_file:
+        json.dump({'version': FORMAT_VERSION,
+                   'nr_of_literals': nr_of_literals,
+                   'nr_of_rules': nr_of_rules,
+                   'nr_of_defeasible_rules': nr_of_defeasible_rules},
+                  header_file)
+    return MappedArgumentationSystem(directory)
@@ -0,0 +1,53 @@
+import pathlib
+import random
+import tempfile
+import unittest
+
+from src.algorithms.approximation_algorithm.approximate_relevance import \
+    ApproximateRelevanceSolver
+from src.algorithms.asp_algorithms.relevance_algorithms import RelevanceSolver
+from src.generators.iat_generator import generate_single_layered
+from src.import_export.iat_from_lp_reader import read_from_lp_file
+from src.import_export.iat_to_lp_writer import write_to_lp_file
+
+EXAMPLE_PATH = str(pathlib.Path(__file__).parent.parent.parent / 'dataset' /
+                   'examples' / 'police_small.lp')
+
+
+class TestApproximateRelevance(unittest.TestCase):
+    def test_sound_with_respect_to_asp(self):
+        random.seed(2)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index in range(3):
+                iat, topic = generate_single_layered(30)
+                iat_path = f'{temp_dir}/iat_{index}.lp'
+                write_to_lp_file(iat, iat_path, [topic])
+
+                potential_queryables = {
+                    queryable.s1 for queryable in iat.queryables
+                    if not iat.is_knowledge_base_axiom(queryable)}
+                for status in ['unsatisfiable', 'defended', 'out',
+                               'blocked']:
+                    approximation = \
+                        ApproximateRelevanceSolver().relevance_all(
+                            iat_path, status=status)
+                    relevant = RelevanceSolver().relevance_all_incremental(
+                        iat_path, False, status)
+
+                    self.assertSetEqual(
+                        approximation.certainly_relevant |
+                        approximation.certainly_irrelevant |
+                        approximation.unknown, potential_queryables)
+                    self.assertTrue(
+                        approximation.certainly_relevant.issubset(relevant))
+                    self.assertFalse(
+                        approximation.certainly_irrelevant & relevant)
+
+    def test_topic_of_theory_is_needed(self):
+        iat = read_from_lp_file(EXAMPLE_PATH)
+        approximation = ApproximateRelevanceSolver().relevance_all(
+            iat, 'deception')
+        self.assertEqual(str(approximation), str(
+            ApproximateRelevanceSolver().relevance_all(EXAMPLE_PATH)))
+        with self.assertRaises(ValueError):
+            ApproximateRelevanceSolver().relevance_all(iat)
@@ -0,0 +1,34 @@
+import random
+import unittest
+
+from src.algorithms.approximation_algorithm.batch_stability_labeler import \
+    BatchStabilityLabeler
+from src.algorithms.approximation_algorithm.stability_labeler import \
+    StabilityLabeler
+from src.classes.incomplete_argumentation_theory import \
+    IncompleteArgumentationTheory
+from src.generators.iat_generator import generate_single_layered, \
+    generate_single_random
+
+
+class TestBatchStabilityLabeler(unittest.TestCase):
+    def test_same_as_labeling_each_knowledge_base(self):
+        random.seed(11)
+        for iat, _ in [generate_single_layered(100),
+                       generate_single_random(100)]:
+            knowledge_bases = [
+                [queryable for queryable in iat.queryables
+                 if random.random() < 0.3]
+                for _ in range(20)]
+            batch_results = BatchStabilityLabeler().solve_stability(
+                iat.argumentation_system, iat.queryables, knowledge_bases)
+
+            self.assertEqual(len(batch_results), len(knowledge_bases))
+            for knowledge_base, batch_result in zip(knowledge_bases,
+                                                    batch_results):
+                single_iat = IncompleteArgumentationTheory(
+                    iat.argumentation_system, iat.queryables,
+                    knowledge_base, [])
+                self.assertEqual(
+                    batch_result,
+                    StabilityLabeler().solve_stability(single_iat))
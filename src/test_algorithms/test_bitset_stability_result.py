@@ -0,0 +1,72 @@
+import pathlib
+import pickle
+import unittest
+
+from src.algorithms.approximation_algorithm.stability_labeler import \
+    StabilityLabeler
+from src.algorithms.bitset_stability_result import \
+    BitsetStabilityResult, literal_order_digest
+from src.import_export.iat_from_lp_reader import read_from_lp_file
+
+EXAMPLE_PATH = str(pathlib.Path(__file__).parent.parent.parent / 'dataset' /
+                   'examples' / 'police_small.lp')
+
+
+class TestBitsetStabilityResult(unittest.TestCase):
+    def test_round_trip_and_set_algebra(self):
+        iat = read_from_lp_file(EXAMPLE_PATH)
+        compiled = iat.argumentation_system.compiled
+        stability_result = StabilityLabeler().solve_stability(iat)
+
+        bitset_result = BitsetStabilityResult.from_stability_result(
+            stability_result, compiled.literal_names, compiled.literal_ids)
+        self.assertEqual(bitset_result.to_stability_result(),
+                         stability_result)
+        self.assertEqual(bitset_result.nr_stable(),
+                         stability_result.nr_stable())
+        self.assertEqual(bitset_result.status_counts()['defended'],
+                         len(stability_result.stable_defended))
+
+        encoded = bitset_result.to_bytes()
+        self.assertEqual(len(encoded),
+                         4 * ((compiled.nr_of_literals + 7) // 8))
+        decoded = BitsetStabilityResult.from_bytes(
+            encoded, compiled.literal_names)
+        self.assertEqual(decoded, bitset_result)
+        self.assertEqual(pickle.loads(pickle.dumps(bitset_result)),
+                         bitset_result)
+
+        empty_result = BitsetStabilityResult(compiled.literal_names)
+        self.assertTrue(empty_result.is_subset_of(bitset_result))
+        self.assertFalse(bitset_result.is_subset_of(empty_result))
+        self.assertEqual(bitset_result.difference(empty_result),
+                         bitset_result)
+        self.assertEqual(bitset_result.difference(bitset_result),
+                         empty_result)
+
+    def test_compare_other_literal_order(self):
+        result = BitsetStabilityResult(['a', 'b', 'c'], stable_defended=0b011)
+        reordered = BitsetStabilityResult(['b', 'a', 'c'],
+                                          stable_defended=0b011)
+        shifted = BitsetStabilityResult(['b', 'c', 'a'],
+                                        stable_defended=0b011)
+        self.assertEqual(result, reordered)
+        self.assertNotEqual(result, shifted)
+        self.assertTrue(result.is_subset_of(reordered))
+        self.assertFalse(shifted.is_subset_of(result))
+        self.assertEqual(result.__eq__(result.to_stability_result()),
+                         NotImplemented)
+        with self.assertRaises(ValueError):
+            result.difference(shifted)
+
+    def test_literal_order_digest(self):
+        result = BitsetStabilityResult(['a', 'b', 'c'], stable_defended=0b011)
+        unpickled = pickle.loads(pickle.dumps(result))
+        self.assertIsNot(unpickled.literal_names, result.literal_names)
+        self.assertEqual(unpickled.literal_order_digest,
+                         result.literal_order_digest)
+        self.assertEqual(unpickled, result)
+        self.assertEqual(literal_order_digest(('a', 'b', 'c')),
+                         result.literal_order_digest)
+        self.assertNotEqual(literal_order_digest(['ab', 'c']),
+                            literal_order_digest(['a', 'bc']))
@@ -0,0 +1,65 @@
+import pathlib
+import unittest
+
+from src.classes.argumentation_system import ArgumentationSystem
+from src.classes.defeasible_rule import DefeasibleRule
+from src.classes.literal import Literal
+from src.import_export.iat_from_lp_reader import read_from_lp_file
+
+EXAMPLE_PATH = str(pathlib.Path(__file__).parent.parent.parent / 'dataset' /
+                   'examples' / 'small.lp')
+
+
+class TestCompiledArgumentationSystem(unittest.TestCase):
+    def test_adjacency(self):
+        iat = read_from_lp_file(EXAMPLE_PATH)
+        argumentation_system = iat.argumentation_system
+        compiled = argumentation_system.compiled
+        self.assertIs(compiled, argumentation_system.compiled)
+
+        self.assertEqual(compiled.nr_of_literals,
+                         len(argumentation_system.language))
+        self.assertEqual(compiled.nr_of_rules,
+                         len(argumentation_system.defeasible_rules))
+
+        for rule_id, rule in enumerate(compiled.rules):
+            self.assertEqual(
+                compiled.literals[compiled.rule_consequents[rule_id]],
+                rule.consequent)
+            self.assertSetEqual(
+                {compiled.literals[literal_id]
+                 for literal_id in compiled.antecedents(rule_id)},
+                set(rule.antecedents))
+
+        for literal_id, literal in enumerate(compiled.literals):
+            self.assertSetEqual(
+                {compiled.rules[rule_id]
+                 for rule_id in compiled.rules_for(literal_id)},
+                {rule for rule in argumentation_system.defeasible_rules
+                 if rule.consequent == literal})
+            self.assertSetEqual(
+                {compiled.rules[rule_id]
+                 for rule_id in compiled.rules_using(literal_id)},
+                {rule for rule in argumentation_system.defeasible_rules
+                 if literal in rule.antecedents})
+            self.assertSetEqual(
+                {compiled.literals[contrary_id]
+                 for contrary_id in compiled.contraries(literal_id)},
+                set(literal.contraries_and_contradictories))
+            self.assertSetEqual(
+                {compiled.literals[other_id]
+                 for other_id in compiled.contrary_of(literal_id)},
+                {other for other in compiled.literals
+                 if literal in other.contraries_and_contradictories})
+
+    def test_rule_ids_of_equal_rules(self):
+        language = {name: Literal(name) for name in ['a', 'b']}
+        rules = [DefeasibleRule(rule_id, {language['a']}, language['b'])
+                 for rule_id in ['d1', 'd2']]
+        compiled = ArgumentationSystem(
+            language, {}, [], rules,
+            add_defeasible_rule_literals=False).compiled
+
+        self.assertEqual(compiled.nr_of_rules, 2)
+        for rule_id, rule in enumerate(compiled.rules):
+            self.assertEqual(compiled.rule_ids[id(rule)], rule_id)
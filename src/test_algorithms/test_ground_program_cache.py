@@ -0,0 +1,74 @@
+import os
+import pathlib
+import random
+import tempfile
+import unittest
+
+from src.algorithms.asp_algorithms.ground_program_cache import \
+    GroundProgramCache
+from src.algorithms.asp_algorithms.stability_algorithms import \
+    GroundedStabilitySolver
+from src.generators.iat_generator import generate_single_layered
+from src.import_export.iat_from_lp_reader import read_from_lp_file
+
+EXAMPLE_PATH = str(pathlib.Path(__file__).parent.parent.parent / 'dataset' /
+                   'examples' / 'police_small.lp')
+
+
+class TestGroundProgramCache(unittest.TestCase):
+    def test_same_result_from_cache(self):
+        iat = read_from_lp_file(EXAMPLE_PATH)
+        language = iat.argumentation_system.language
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = GroundProgramCache(cache_dir)
+            for with_preferences in [False, True]:
+                for axiom_strs in [[], ['too_cheap'], ['trusted']]:
+                    future_iat = iat.with_axioms(
+                        [language[axiom_str] for axiom_str in axiom_strs])
+                    self.assertEqual(
+                        GroundedStabilitySolver().solve_stability(
+                            future_iat, with_preferences, cache),
+                        GroundedStabilitySolver().solve_stability(
+                            future_iat, with_preferences))
+            # One program per encoding set, shared by all knowledge bases
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+    def test_least_recently_used_evicted(self):
+        random.seed(2)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = GroundProgramCache(cache_dir)
+            iats = [generate_single_layered(20)[0] for _ in range(3)]
+            program_names = []
+            for index, iat in enumerate(iats):
+                GroundedStabilitySolver().solve_stability(iat, cache=cache)
+                program_name, = set(os.listdir(cache_dir)) - \
+                    set(program_names)
+                program_names.append(program_name)
+                # Distinct times of last use, oldest first
+                os.utime(os.path.join(cache_dir, program_name),
+                         (1000 * (index + 1), 1000 * (index + 1)))
+            total_size = sum(
+                os.path.getsize(os.path.join(cache_dir, program_name))
+                for program_name in program_names)
+
+            # A hit makes the oldest program the most recently used one
+            GroundedStabilitySolver().solve_stability(iats[0], cache=cache)
+            cache.max_bytes = total_size - 1
+            cache.evict()
+            self.assertSetEqual(set(os.listdir(cache_dir)),
+                                {program_names[0], program_names[2]})
+
+    def test_temporary_files_evicted(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = GroundProgramCache(cache_dir, max_bytes=100)
+            stale_path = os.path.join(cache_dir, 'stale.tmp')
+            fresh_path = os.path.join(cache_dir, 'fresh.tmp')
+            program_path = cache.path('program')
+            for path in [stale_path, fresh_path, program_path]:
+                with open(path, 'wb') as file:
+                    file.write(bytes(60))
+            os.utime(stale_path, (1000, 1000))
+
+            # The fresh temporary file is in use, so the program goes.
+            cache.evict()
+            self.assertListEqual(os.listdir(cache_dir), ['fresh.tmp'])
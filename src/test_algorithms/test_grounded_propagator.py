@@ -0,0 +1,153 @@
+import pathlib
+import random
+import tempfile
+import unittest
+
+from src.algorithms.asp_algorithms.grounded_propagator import \
+    GroundedFixpoint, GroundedPropagator
+from src.algorithms.asp_algorithms.relevance_algorithms import RelevanceSolver
+from src.algorithms.asp_algorithms.stability_algorithms import \
+    GroundedStabilitySolver, PATH_TO_ENCODINGS
+from src.algorithms.bitset_stability_result import STATUSES
+from src.generators.iat_generator import generate_single_layered
+from src.import_export.iat_from_lp_reader import read_from_lp_file
+from src.import_export.iat_to_lp_writer import write_to_lp_file
+
+EXAMPLE_PATH = str(pathlib.Path(__file__).parent.parent.parent / 'dataset' /
+                   'examples' / 'police_small.lp')
+
+
+class ConflictRecordingPropagator(GroundedPropagator):
+    """
+    A GroundedPropagator that records the number of unassigned axioms at
+    each conflict that the labels of a partial assignment find.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.nrs_unassigned_at_conflicts = []
+
+    def _add_label_clause(self, control, state, literal_id, implied_literal):
+        if control.assignment.is_false(implied_literal):
+            self.nrs_unassigned_at_conflicts.append(state.nr_unassigned)
+        return super()._add_label_clause(control, state, literal_id,
+                                         implied_literal)
+
+
+class TestGroundedPropagator(unittest.TestCase):
+    def test_same_stability_as_encodings(self):
+        random.seed(6)
+        for index in range(4):
+            with_preferences = index >= 2
+            iat, _ = generate_single_layered(
+                40, add_rule_preferences=with_preferences,
+                strict_rule_ratio=0.3 * (index % 2))
+            self.assertEqual(
+                GroundedStabilitySolver().solve_stability(
+                    iat, with_preferences, use_propagator=True),
+                GroundedStabilitySolver().solve_stability(
+                    iat, with_preferences))
+
+    def test_same_relevance_as_encodings(self):
+        random.seed(7)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            iat, topic = generate_single_layered(
+                30, add_rule_preferences=True)
+            iat_path = f'{temp_dir}/iat.lp'
+            write_to_lp_file(iat, iat_path, [topic])
+            for iat_file in [EXAMPLE_PATH, iat_path]:
+                for status in ['unsatisfiable', 'defended', 'out',
+                               'blocked']:
+                    self.assertSetEqual(
+                        RelevanceSolver().relevance_all_incremental(
+                            iat_file, True, status, use_propagator=True),
+                        RelevanceSolver().relevance_all_incremental(
+                            iat_file, True, status))
+
+    def test_reasons_keep_statuses(self):
+        random.seed(8)
+        for with_preferences in [False, True]:
+            iat, _ = generate_single_layered(
+                40, add_rule_preferences=with_preferences,
+                strict_rule_ratio=0.3)
+            propagator = GroundedPropagator(iat, with_preferences)
+            queryable_ids = [propagator.literal_ids[str(queryable).lower()]
+                             for queryable in iat.queryables]
+            axioms = bytearray(propagator.compiled.nr_of_literals)
+            for queryable_id in random.sample(queryable_ids, 8):
+                axioms[queryable_id] = 1
+            fixpoint = GroundedFixpoint(propagator, axioms)
+            statuses = fixpoint.statuses()
+            for literal_id in range(propagator.compiled.nr_of_literals):
+                for status in STATUSES:
+                    positive = bool(statuses[status][literal_id])
+                    reason = fixpoint.reason(literal_id, status, positive)
+                    # Any other assignment of the axioms outside the reason
+                    other_axioms = bytearray(axioms)
+                    for queryable_id in queryable_ids:
+                        if queryable_id not in reason:
+                            other_axioms[queryable_id] = random.random() < 0.5
+                    self.assertEqual(bool(propagator.statuses(
+                        other_axioms)[status][literal_id]), positive)
+
+    def test_reasons_on_example(self):
+        propagator = GroundedPropagator(read_from_lp_file(EXAMPLE_PATH))
+        literal_ids = propagator.literal_ids
+        axioms = bytearray(propagator.compiled.nr_of_literals)
+        axioms[literal_ids['similar_url']] = axioms[literal_ids['trusted']] = 1
+        fixpoint = GroundedFixpoint(propagator, axioms)
+
+        def reason(literal, status, positive):
+            return {propagator.compiled.literal_names[literal_id]
+                    for literal_id in fixpoint.reason(
+                        literal_ids[literal], status, positive)}
+
+        self.assertSetEqual(
+            reason('not_deception', 'unsatisfiable', False), {'trusted'})
+        self.assertSetEqual(
+            reason('too_cheap', 'unsatisfiable', True), {'too_cheap'})
+        self.assertSetEqual(
+            reason('deception', 'blocked', True),
+            {'deception', 'not_deception', 'not_typosquatting', 'trusted'})
+
+    def test_conflict_before_total_assignment(self):
+        import clingo
+
+        # With trusted as an axiom, not_deception is derived and deception
+        # cannot be defended, which the labels find before the other axioms
+        # are assigned.
+        propagator = ConflictRecordingPropagator(
+            read_from_lp_file(EXAMPLE_PATH), False)
+        control = clingo.Control()
+        control.load(EXAMPLE_PATH)
+        control.load(str(PATH_TO_ENCODINGS / 'guess.dl'))
+        control.load(str(PATH_TO_ENCODINGS / 'grounded_propagator.dl'))
+        control.add('base', [], ':- not defended(deception).')
+        control.register_propagator(propagator)
+        control.ground([('base', [])])
+        trusted = clingo.Function('axiom', [clingo.Function('trusted')])
+        self.assertTrue(control.solve(
+            assumptions=[(trusted, True)]).unsatisfiable)
+        self.assertTrue(propagator.nrs_unassigned_at_conflicts)
+        self.assertTrue(all(propagator.nrs_unassigned_at_conflicts))
+
+    def test_several_threads(self):
+        import clingo
+
+        def models(nr_of_threads):
+            control = clingo.Control(
+                arguments=['0', f'--parallel-mode={nr_of_threads}',
+                           '--heuristic=Domain'],
+                logger=lambda code, message: None)
+            control.load(EXAMPLE_PATH)
+            control.load(str(PATH_TO_ENCODINGS / 'guess.dl'))
+            control.load(str(PATH_TO_ENCODINGS / 'grounded_propagator.dl'))
+            control.register_propagator(
+                GroundedPropagator(read_from_lp_file(EXAMPLE_PATH)))
+            control.ground([('base', [])])
+            found = set()
+            control.solve(on_model=lambda model: found.add(frozenset(
+                str(symbol) for symbol in model.symbols(shown=True))))
+            return found
+
+        self.assertSetEqual(models(3), models(1))
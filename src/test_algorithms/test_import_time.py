@@ -0,0 +1,47 @@
+import pathlib
+import subprocess
+import sys
+import unittest
+
+REPOSITORY_PATH = pathlib.Path(__file__).parent.parent.parent
+
+# Import budget (in seconds) for the modules needed for a labeler run.
+IMPORT_TIME_BUDGET = 0.25
+
+MEASURE_IMPORT_TIME = '''
+import sys
+import time
+start_time = time.perf_counter()
+import {module}
+print(time.perf_counter() - start_time)
+for lazy_module in {lazy_modules}:
+    print(lazy_module in sys.modules)
+'''
+
+
+class TestImportTime(unittest.TestCase):
+    def assert_fast_import(self, module: str):
+        lazy_modules = ['clingo', 'parse', 'distutils',
+                        'src.generators.iat_generator',
+                        'src.generators.layered_as_generator',
+                        'src.generators.random_as_generator']
+        # Best of three fresh interpreters, to reduce noise.
+        import_times = []
+        for _ in range(3):
+            output = subprocess.run(
+                [sys.executable, '-c', MEASURE_IMPORT_TIME.format(
+                    module=module, lazy_modules=lazy_modules)],
+                cwd=REPOSITORY_PATH, capture_output=True, text=True,
+                check=True).stdout.split()
+            import_times.append(float(output[0]))
+            for lazy_module, is_imported in zip(lazy_modules, output[1:]):
+                self.assertEqual(is_imported, 'False',
+                                 f'{module} imports {lazy_module}')
+        self.assertLess(min(import_times), IMPORT_TIME_BUDGET)
+
+    def test_labeler_import_time(self):
+        self.assert_fast_import(
+            'src.algorithms.approximation_algorithm.stability_labeler')
+
+    def test_experiment_runner_import_time(self):
+        self.assert_fast_import('src.experiments.run_experiments')
@@ -0,0 +1,89 @@
+import pathlib
+import unittest
+
+from src.import_export.iat_from_lp_reader import read_from_lp_file
+
+EXAMPLE_PATH = str(pathlib.Path(__file__).parent.parent.parent / 'dataset' /
+                   'examples' / 'police_small.lp')
+
+
+class TestIncompleteArgumentationTheory(unittest.TestCase):
+    def assert_indexes_consistent(self, iat):
+        knowledge_base = iat.knowledge_base_axioms + \
+            iat.knowledge_base_ordinary_premises
+        self.assertListEqual(iat.knowledge_base, knowledge_base)
+        self.assertSetEqual(iat.knowledge_base_set, set(knowledge_base))
+        for literal in iat.argumentation_system.language.values():
+            self.assertEqual(iat.is_in_knowledge_base(literal),
+                             literal in knowledge_base)
+            self.assertEqual(
+                iat.has_observed_contrary(literal),
+                any(contrary in knowledge_base
+                    for contrary in literal.contraries_and_contradictories))
+            self.assertEqual(
+                iat.all_contraries_have_observed_contrary(literal),
+                all(any(contrary_contrary in knowledge_base
+                        for contrary_contrary in
+                        contrary.contraries_and_contradictories)
+                    for contrary in literal.contraries_and_contradictories))
+
+    def test_knowledge_base_indexes(self):
+        iat = read_from_lp_file(EXAMPLE_PATH)
+        self.assert_indexes_consistent(iat)
+
+        compiled = iat.argumentation_system.compiled
+        for queryable in iat.queryables:
+            self.assertTrue(iat.queryable_bitset >>
+                            compiled.literal_ids[queryable.s1] & 1)
+
+        language = iat.argumentation_system.language
+        iat.add_knowledge_base_axiom(language['too_cheap'])
+        iat.add_knowledge_base_axiom(language['not_trusted'])
+        self.assert_indexes_consistent(iat)
+
+        iat.remove_knowledge_base_axiom(language['too_cheap'])
+        self.assert_indexes_consistent(iat)
+
+    def test_indexes_are_built_lazily(self):
+        iat = read_from_lp_file(EXAMPLE_PATH)
+        self.assertIsNone(iat.argumentation_system._compiled)
+
+        # Changes before the indexes are built are in the built indexes.
+        language = iat.argumentation_system.language
+        iat.add_knowledge_base_axiom(language['too_cheap'])
+        iat.remove_knowledge_base_axiom(language['similar_url'])
+        self.assert_indexes_consistent(iat)
+
+        compiled = iat.argumentation_system.compiled
+        self.assertEqual(iat.queryable_bitset, sum(
+            1 << compiled.literal_ids[queryable.s1]
+            for queryable in iat.queryables))
+
+    def test_with_and_without_axioms(self):
+        iat = read_from_lp_file(EXAMPLE_PATH)
+        language = iat.argumentation_system.language
+
+        view = iat.with_axioms([language['too_cheap'],
+                                language['not_trusted']])
+        self.assertIs(view.argumentation_system, iat.argumentation_system)
+        self.assertListEqual(
+            [literal.s1 for literal in view.knowledge_base_axioms],
+            ['not_trusted', 'similar_url', 'too_cheap'])
+        self.assert_indexes_consistent(view)
+
+        nested_view = view.without_axioms([language['similar_url'],
+                                           language['too_cheap']])
+        self.assertIs(nested_view.base, iat)
+        self.assertListEqual(
+            [literal.s1 for literal in nested_view.knowledge_base_axioms],
+            ['not_trusted'])
+        self.assert_indexes_consistent(nested_view)
+
+        nested_view.add_knowledge_base_axiom(language['typosquatting'])
+        self.assert_indexes_consistent(nested_view)
+
+        # The base theory is not changed by its views.
+        self.assertListEqual(
+            [literal.s1 for literal in iat.knowledge_base_axioms],
+            ['similar_url'])
+        self.assert_indexes_consistent(iat)
@@ -0,0 +1,33 @@
+import random
+import unittest
+
+from src.algorithms.asp_algorithms.stability_algorithms import \
+    GroundedStabilitySession, GroundedStabilitySolver
+from src.generators.iat_generator import generate_single_layered
+
+
+class TestIncrementalPreferenceGrounding(unittest.TestCase):
+    def test_same_result_as_all_iterations(self):
+        random.seed(3)
+        for index in range(4):
+            iat, _ = generate_single_layered(
+                40, add_rule_preferences=True,
+                strict_rule_ratio=0.3 * (index % 2))
+            self.assertEqual(
+                GroundedStabilitySolver().solve_stability(
+                    iat, with_preferences=True, incremental_iterations=True),
+                GroundedStabilitySolver().solve_stability(
+                    iat, with_preferences=True))
+
+    def test_session_for_other_axioms(self):
+        random.seed(4)
+        iat, _ = generate_single_layered(40, add_rule_preferences=True)
+        queryables = sorted(iat.queryables, key=str)
+        session = GroundedStabilitySession(iat, with_preferences=True,
+                                           incremental_iterations=True)
+        for _ in range(5):
+            future_iat = iat.with_axioms(random.sample(queryables, 3))
+            self.assertEqual(
+                session.solve_stability(future_iat.knowledge_base_axioms),
+                GroundedStabilitySolver().solve_stability(
+                    future_iat, with_preferences=True))
@@ -0,0 +1,44 @@
+import random
+import unittest
+
+from src.algorithms.approximation_algorithm.incremental_stability_labeler \
+    import IncrementalStabilityLabeler
+from src.algorithms.approximation_algorithm.stability_labeler import \
+    StabilityLabeler
+from src.generators.iat_generator import generate_single_random
+
+
+class TestIncrementalStabilityLabeler(unittest.TestCase):
+    def test_same_as_labeling_from_scratch(self):
+        random.seed(5)
+        iat, _ = generate_single_random(150)
+        labeler = IncrementalStabilityLabeler(iat)
+        self.assertEqual(labeler.stability_result(),
+                         StabilityLabeler().solve_stability(iat))
+
+        queryables = [queryable for queryable in iat.queryables
+                      if not iat.is_in_knowledge_base(queryable)]
+        random.shuffle(queryables)
+        added_axioms = []
+        for queryable in queryables[:10]:
+            old_result = labeler.stability_result()
+            changed_literals = labeler.add_axiom(queryable)
+            added_axioms.append(queryable)
+
+            new_result = labeler.stability_result()
+            self.assertEqual(
+                new_result,
+                StabilityLabeler().solve_stability(
+                    iat.with_axioms(added_axioms)))
+            for status in ['unsatisfiable', 'defended', 'out', 'blocked']:
+                for literal_str in \
+                        getattr(new_result, 'stable_' + status) ^ \
+                        getattr(old_result, 'stable_' + status):
+                    self.assertIn(
+                        iat.argumentation_system.language[literal_str],
+                        changed_literals)
+
+        # The theory that was given is not changed.
+        self.assertFalse(any(iat.is_in_knowledge_base(axiom)
+                             for axiom in added_axioms))
+        self.assertEqual(labeler.add_axiom(added_axioms[0]), [])
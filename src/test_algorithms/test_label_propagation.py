@@ -0,0 +1,46 @@
+import random
+import unittest
+
+from src.algorithms.approximation_algorithm.label_propagation import \
+    LabelPropagator, literal_properties
+from src.algorithms.approximation_algorithm.satisfiability_labeler import \
+    SatisfiabilityLabeler
+from src.generators.iat_generator import generate_single_layered, \
+    generate_single_random
+
+
+class TestLabelPropagation(unittest.TestCase):
+    def test_propagation_reaches_fixpoint(self):
+        random.seed(3)
+        iat, _ = generate_single_layered(150)
+        compiled = iat.argumentation_system.compiled
+        labels = SatisfiabilityLabeler().solve_stability(iat)
+        propagator = LabelPropagator(
+            compiled, literal_properties(iat, compiled), labels)
+        propagator.propagate()
+
+        # Counters that were updated incrementally must equal the counters of
+        # a propagator that starts from the final labels, and applying the
+        # conditions again must not change anything.
+        recounted = LabelPropagator(
+            compiled, literal_properties(iat, compiled), labels)
+        self.assertEqual(propagator._child_counts, recounted._child_counts)
+        self.assertEqual(propagator._contrary_child_counts,
+                         recounted._contrary_child_counts)
+        self.assertEqual(propagator._antecedent_counts,
+                         recounted._antecedent_counts)
+        self.assertFalse(recounted._queue)
+
+    def test_scc_ordered_propagation_gives_same_labels(self):
+        random.seed(5)
+        iat, _ = generate_single_random(100)
+        compiled = iat.argumentation_system.compiled
+        labels = SatisfiabilityLabeler().solve_stability(iat)
+        scc_ordered_labels = SatisfiabilityLabeler().solve_stability(iat)
+        LabelPropagator(compiled, literal_properties(iat, compiled),
+                        labels).propagate()
+        LabelPropagator(compiled, literal_properties(iat, compiled),
+                        scc_ordered_labels, scc_ordered=True).propagate()
+        self.assertEqual(labels.literal_labels,
+                         scc_ordered_labels.literal_labels)
+        self.assertEqual(labels.rule_labels, scc_ordered_labels.rule_labels)
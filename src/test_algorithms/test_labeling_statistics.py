@@ -0,0 +1,56 @@
+import json
+import random
+import unittest
+
+from src.algorithms.approximation_algorithm.labeling_statistics import \
+    LabelingStatistics
+from src.algorithms.approximation_algorithm.stability_labeler import \
+    StabilityLabeler
+from src.classes.argumentation_system import ArgumentationSystem
+from src.classes.defeasible_rule import DefeasibleRule
+from src.classes.incomplete_argumentation_theory import \
+    IncompleteArgumentationTheory
+from src.classes.literal import Literal
+from src.generators.iat_generator import generate_single_layered
+
+
+class TestLabelingStatistics(unittest.TestCase):
+    def test_statistics_do_not_change_result(self):
+        random.seed(7)
+        iat, _ = generate_single_layered(100)
+        statistics = LabelingStatistics(provenance=True)
+        self.assertEqual(
+            StabilityLabeler().solve_stability(iat),
+            StabilityLabeler().solve_stability(iat, statistics=statistics))
+
+        # Every flag that was removed from a literal is explained by exactly
+        # one condition.
+        labels = StabilityLabeler().solve_stability(iat)
+        for literal_str in labels.stable_defended:
+            self.assertEqual(
+                set(statistics.literal_provenance[literal_str]),
+                {'unsatisfiable', 'out', 'blocked'})
+        self.assertEqual(
+            sum(statistics.condition_counts.values()),
+            sum(len(removed) for provenance in
+                [statistics.literal_provenance, statistics.rule_provenance]
+                for removed in provenance.values()))
+
+        exported = json.loads(statistics.to_json())
+        self.assertEqual(exported['condition_counts'],
+                         statistics.condition_counts)
+
+    def test_rule_with_two_heads(self):
+        language = {name: Literal(name) for name in ['a', 'b', 'c']}
+        rules = [DefeasibleRule('r1', {language['a']}, language['b']),
+                 DefeasibleRule('r1', {language['a']}, language['c'])]
+        iat = IncompleteArgumentationTheory(
+            ArgumentationSystem(language, {}, [], rules,
+                                add_defeasible_rule_literals=False),
+            [language['a']], [], [])
+        statistics = LabelingStatistics(provenance=True)
+        StabilityLabeler().solve_stability(iat, statistics=statistics)
+
+        # Each head is a rule of its own, with its own provenance.
+        self.assertSetEqual(set(statistics.rule_evaluations), {0, 1})
+        self.assertSetEqual(set(statistics.rule_provenance), {0, 1})
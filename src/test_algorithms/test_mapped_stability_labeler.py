@@ -0,0 +1,62 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from src.algorithms.approximation_algorithm.mapped_stability_labeler import \
+    CompactLabelPropagator, LABELS_FILE, MappedStabilityLabeler
+from src.algorithms.approximation_algorithm.stability_labeler import \
+    StabilityLabeler
+from src.generators.iat_generator import generate_single_layered
+from src.import_export.iat_to_lp_writer import write_to_lp_file
+from src.import_export.lp_to_mapped_converter import convert_lp_file
+
+
+class TestMappedStabilityLabeler(unittest.TestCase):
+    def test_same_arrays_and_result_as_compiled(self):
+        random.seed(9)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index in range(4):
+                iat, topic = generate_single_layered(
+                    40, strict_rule_ratio=0.3 * (index % 2))
+                iat_path = f'{temp_dir}/iat_{index}.lp'
+                mapped_dir = f'{temp_dir}/mapped_{index}'
+                write_to_lp_file(iat, iat_path, [topic])
+
+                compiled = iat.argumentation_system.compiled
+                mapped = convert_lp_file(iat_path, mapped_dir)
+                self.assertEqual(list(mapped.literal_names),
+                                 list(compiled.literal_names))
+                self.assertEqual(list(mapped.rule_consequents),
+                                 list(compiled.rule_consequents))
+                for literal_id in range(compiled.nr_of_literals):
+                    self.assertEqual(list(mapped.rules_using(literal_id)),
+                                     list(compiled.rules_using(literal_id)))
+                    self.assertSetEqual(
+                        set(mapped.contraries(literal_id)),
+                        set(compiled.contraries(literal_id)))
+                    self.assertSetEqual(
+                        set(mapped.strict_closure(literal_id)),
+                        set(compiled.strict_closure(literal_id)))
+                mapped.close()
+
+                self.assertEqual(
+                    StabilityLabeler().solve_stability(iat),
+                    MappedStabilityLabeler().solve_stability(mapped_dir))
+
+    def test_no_labels_file_after_error(self):
+        random.seed(10)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            iat, topic = generate_single_layered(20)
+            iat_path = f'{temp_dir}/iat.lp'
+            mapped_dir = f'{temp_dir}/mapped'
+            write_to_lp_file(iat, iat_path, [topic])
+            convert_lp_file(iat_path, mapped_dir).close()
+
+            with mock.patch.object(CompactLabelPropagator, 'propagate',
+                                   side_effect=RuntimeError):
+                with self.assertRaises(RuntimeError):
+                    MappedStabilityLabeler().solve_stability(mapped_dir)
+            self.assertFalse(os.path.exists(
+                os.path.join(mapped_dir, LABELS_FILE)))
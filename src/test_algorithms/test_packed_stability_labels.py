@@ -0,0 +1,53 @@
+import random
+import unittest
+
+from src.algorithms.approximation_algorithm.packed_stability_labels import \
+    PackedStabilityLabels, from_stability_label, to_stability_label
+from src.algorithms.approximation_algorithm.stability_label import \
+    StabilityLabel
+from src.classes.argumentation_system import ArgumentationSystem
+from src.classes.defeasible_rule import DefeasibleRule
+from src.classes.literal import Literal
+
+
+class TestPackedStabilityLabels(unittest.TestCase):
+    def test_matches_unpacked_labels(self):
+        language = {name: Literal(name) for name in
+                    ['l' + str(index) for index in range(40)]}
+        argumentation_system = ArgumentationSystem(language, {}, [], [])
+        labels = PackedStabilityLabels(argumentation_system.compiled)
+
+        random_generator = random.Random(7)
+        for literal_id in range(len(language)):
+            labels.literal_labels[literal_id] = random_generator.randrange(16)
+
+        for flags in range(16):
+            self.assertEqual(
+                from_stability_label(to_stability_label(flags)), flags)
+        for literal, flags in zip(argumentation_system.compiled.literals,
+                                  labels.literal_labels):
+            self.assertEqual(labels.literal_label(literal),
+                             to_stability_label(flags))
+        self.assertEqual(labels.to_stability_result(),
+                         labels.to_stability_labels().to_stability_result())
+        self.assertEqual(
+            labels.to_bitset_stability_result().to_stability_result(),
+            labels.to_stability_result())
+        self.assertIsInstance(labels.literal_label(language['l0']),
+                              StabilityLabel)
+
+    def test_rule_label_of_rule_with_two_heads(self):
+        language = {name: Literal(name) for name in ['a', 'b', 'c']}
+        rules = [DefeasibleRule('r1', {language['a']}, language['b']),
+                 DefeasibleRule('r1', {language['a']}, language['c'])]
+        argumentation_system = ArgumentationSystem(
+            language, {}, [], rules, add_defeasible_rule_literals=False)
+        labels = PackedStabilityLabels(argumentation_system.compiled)
+        for rule_id, flags in enumerate([1, 2]):
+            labels.rule_labels[rule_id] = flags
+
+        for rule_id, rule in enumerate(argumentation_system.compiled.rules):
+            self.assertEqual(labels.rule_label(rule), to_stability_label(
+                labels.rule_labels[rule_id]))
+        self.assertNotEqual(labels.rule_label(rules[0]),
+                            labels.rule_label(rules[1]))
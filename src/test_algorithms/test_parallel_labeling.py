@@ -0,0 +1,46 @@
+import pathlib
+import random
+import unittest
+from unittest import mock
+
+from src.algorithms.approximation_algorithm import parallel_labeling
+from src.algorithms.approximation_algorithm.parallel_labeling import \
+    compact_sub_theories, weakly_connected_components
+from src.algorithms.approximation_algorithm.stability_labeler import \
+    StabilityLabeler
+from src.generators.iat_generator import generate_single_random
+from src.import_export.iat_from_lp_reader import read_from_lp_file
+
+EXAMPLE_PATH = str(pathlib.Path(__file__).parent.parent.parent / 'dataset' /
+                   'examples' / 'small.lp')
+
+
+class TestParallelLabeling(unittest.TestCase):
+    def test_same_result_as_sequential_labeling(self):
+        random.seed(6)
+        iat, _ = generate_single_random(100)
+        compiled = iat.argumentation_system.compiled
+
+        components = weakly_connected_components(compiled)
+        self.assertEqual(sorted(literal_id for component in components
+                                for literal_id in component),
+                         list(range(compiled.nr_of_literals)))
+        sub_theories = compact_sub_theories(iat, 3)
+        self.assertEqual(sum(len(rules) for _, _, rules, _, _, _ in
+                             sub_theories), compiled.nr_of_rules)
+
+        self.assertEqual(
+            StabilityLabeler().solve_stability(iat),
+            StabilityLabeler().solve_stability(iat, parallel=True,
+                                               max_workers=2))
+
+    def test_single_sub_theory_is_labeled_in_process(self):
+        iat = read_from_lp_file(EXAMPLE_PATH)
+        self.assertEqual(len(compact_sub_theories(iat, 8)), 1)
+        with mock.patch.object(parallel_labeling,
+                               'ProcessPoolExecutor') as executor:
+            self.assertEqual(
+                StabilityLabeler().solve_stability(iat, parallel=True,
+                                                   max_workers=2),
+                StabilityLabeler().solve_stability(iat))
+        executor.assert_not_called()
@@ -5,7 +5,7 @@ from src.algorithms.approximation_algorithm.stability_labeler import \
     StabilityLabeler
 from src.algorithms.asp_algorithms.relevance_algorithms import RelevanceSolver
 from src.algorithms.asp_algorithms.stability_algorithms import \
-    GroundedStabilitySolver
+    GroundedStabilitySession, GroundedStabilitySolver
 from src.import_export.iat_from_lp_reader import read_from_lp_file
 
 EXAMPLE_PATH = str(pathlib.Path(__file__).parent.parent.parent / 'dataset' /
@@ -33,6 +33,26 @@ class TestPoliceExample(unittest.TestCase):
         self.assertSetEqual(labels.stable_out, set())
         self.assertSetEqual(labels.stable_blocked, set())
 
+    def test_stability_session(self):
+        iat = read_from_lp_file(EXAMPLE_PATH)
+        language = iat.argumentation_system.language
+        session = GroundedStabilitySession(EXAMPLE_PATH)
+        self.assertEqual(session.solve_stability(),
+                         GroundedStabilitySolver().solve_stability(iat))
+        for axiom_strs in [['too_cheap', 'not_trusted'], ['typosquatting'],
+                           ['not_too_cheap', 'trusted', 'typosquatting']]:
+            axioms = [language[axiom_str] for axiom_str in axiom_strs]
+            self.assertEqual(
+                session.solve_stability(iat.knowledge_base_axioms + axioms),
+                GroundedStabilitySolver().solve_stability(
+                    iat.with_axioms(axioms)))
+        self.assertEqual(
+            session.solve_stability(['TOO_CHEAP', 'Not_Trusted']),
+            session.solve_stability([language['too_cheap'],
+                                     language['not_trusted']]))
+        with self.assertRaises(ValueError):
+            session.solve_stability(['unknown_literal'])
+
     def test_relevance_asp(self):
         asp_algorithm = RelevanceSolver()
         asp_pref_result = asp_algorithm.relevance_all_incremental(
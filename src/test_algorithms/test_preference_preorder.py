@@ -0,0 +1,73 @@
+import random
+import tempfile
+import unittest
+
+from src.classes.preference_preorder import PreferencePreorder
+from src.generators.iat_generator import generate_single_layered
+from src.import_export.iat_from_lp_reader import read_from_lp_file
+from src.import_export.iat_to_lp_writer import write_to_lp_file
+
+
+class TestPreferencePreorder(unittest.TestCase):
+    def test_fix_transitivity(self):
+        preorder = PreferencePreorder([('a', 'b'), ('b', 'c'), ('c', 'b'),
+                                       ('d', 'a')])
+        preorder.fix_transitivity()
+
+        self.assertSetEqual(
+            set(preorder.preference_tuples),
+            {('a', 'b'), ('a', 'c'), ('b', 'b'), ('b', 'c'), ('c', 'b'),
+             ('c', 'c'), ('d', 'a'), ('d', 'b'), ('d', 'c')})
+        self.assertTrue(preorder.is_strictly_weaker_than('d', 'c'))
+        self.assertTrue(preorder.is_weaker_than('b', 'c'))
+        self.assertFalse(preorder.is_strictly_weaker_than('b', 'c'))
+        self.assertFalse(preorder.is_weaker_than('a', 'a'))
+        self.assertFalse(preorder.is_weaker_than('c', 'a'))
+
+    def test_duplicates_and_equality(self):
+        preorder = PreferencePreorder([('a', 'b')])
+        preorder.append(('a', 'b'))
+        self.assertListEqual(preorder.preference_tuples, [('a', 'b')])
+        self.assertEqual(preorder, PreferencePreorder([('a', 'b')]))
+        self.assertNotEqual(preorder, PreferencePreorder([('b', 'a')]))
+
+    def test_covering_tuples(self):
+        preorder = PreferencePreorder([('a', 'b'), ('b', 'c'), ('c', 'b'),
+                                       ('d', 'a'), ('e', 'e')])
+        preorder.fix_transitivity()
+        covering = preorder.covering_tuples()
+        self.assertEqual(len(covering), 5)
+        self.assertIn(('e', 'e'), covering)
+
+        random.seed(1)
+        for _ in range(20):
+            preorder = PreferencePreorder(
+                [(random.randrange(12), random.randrange(12))
+                 for _ in range(15)])
+            preorder.fix_transitivity()
+            covering_preorder = PreferencePreorder(preorder.covering_tuples())
+            covering_preorder.fix_transitivity()
+            self.assertEqual(covering_preorder, preorder)
+
+    def test_lp_round_trip(self):
+        random.seed(5)
+        iat, _ = generate_single_layered(20, add_rule_preferences=True)
+        argumentation_system = iat.argumentation_system
+        rules = argumentation_system.defeasible_rules[:3]
+        not_closed = PreferencePreorder([(rules[0], rules[1]),
+                                         (rules[1], rules[2])])
+        closed = PreferencePreorder(not_closed.preference_tuples)
+        closed.fix_transitivity()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for rule_preferences in [not_closed, closed]:
+                argumentation_system.rule_preferences = rule_preferences
+                write_to_lp_file(iat, f'{temp_dir}/iat.lp')
+                read_preferences = read_from_lp_file(
+                    f'{temp_dir}/iat.lp').argumentation_system.\
+                    rule_preferences
+                self.assertSetEqual(
+                    {(rule_a.id, rule_b.id) for rule_a, rule_b in
+                     read_preferences.preference_tuples},
+                    {(rule_a.id, rule_b.id) for rule_a, rule_b in
+                     rule_preferences.preference_tuples})
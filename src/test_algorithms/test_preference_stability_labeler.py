@@ -0,0 +1,27 @@
+import random
+import tempfile
+import unittest
+
+from src.algorithms.approximation_algorithm.stability_labeler import \
+    StabilityLabeler
+from src.algorithms.asp_algorithms.stability_algorithms import \
+    GroundedStabilitySolver
+from src.generators.iat_generator import generate_single_layered
+from src.import_export.iat_to_lp_writer import write_to_lp_file
+
+
+class TestPreferenceStabilityLabeler(unittest.TestCase):
+    def test_sound_with_respect_to_asp(self):
+        random.seed(8)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index in range(3):
+                iat, topic = generate_single_layered(
+                    40, add_rule_preferences=True)
+                iat_path = f'{temp_dir}/iat_{index}.lp'
+                write_to_lp_file(iat, iat_path, [topic])
+
+                approximation = StabilityLabeler().solve_stability(
+                    iat_path, with_preferences=True)
+                exact = GroundedStabilitySolver().solve_stability(
+                    iat_path, with_preferences=True)
+                self.assertTrue(approximation.is_subset_of(exact))
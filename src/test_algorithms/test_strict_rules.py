@@ -0,0 +1,68 @@
+import random
+import tempfile
+import unittest
+
+from src.algorithms.approximation_algorithm.stability_labeler import \
+    StabilityLabeler
+from src.algorithms.asp_algorithms.stability_algorithms import \
+    GroundedStabilitySolver
+from src.classes.argumentation_system import ArgumentationSystem
+from src.classes.literal import Literal
+from src.classes.strict_rule import StrictRule, close_under_transposition
+from src.generators.iat_generator import generate_single_layered
+from src.import_export.iat_from_lp_reader import read_from_lp_file
+from src.import_export.iat_to_lp_writer import write_to_lp_file
+
+
+class TestStrictRules(unittest.TestCase):
+    def test_transposition_and_closure_index(self):
+        language = {literal_str: Literal(literal_str)
+                    for literal_str in ['a', 'not_a', 'b', 'not_b', 'c',
+                                        'not_c']}
+        contraries_and_contradictories = {
+            literal_str: {language['not_' + literal_str]}
+            if not literal_str.startswith('not_')
+            else {language[literal_str[4:]]}
+            for literal_str in language}
+        # Sets the contraries of the literals, which the transposition needs
+        ArgumentationSystem(language, contraries_and_contradictories, [], [],
+                            add_defeasible_rule_literals=False)
+        strict_rules = close_under_transposition(
+            [StrictRule('s0', {language['a']}, language['b']),
+             StrictRule('s1', {language['b']}, language['c'])])
+        self.assertSetEqual(
+            {str(rule) for rule in strict_rules},
+            {'a->b', 'b->c', 'not_b->not_a', 'not_c->not_b'})
+
+        argumentation_system = ArgumentationSystem(
+            language, {}, strict_rules, [],
+            add_defeasible_rule_literals=False)
+        compiled = argumentation_system.compiled
+        self.assertSetEqual(
+            {compiled.literal_names[literal_id] for literal_id in
+             compiled.strict_closure(compiled.literal_ids['not_c'])},
+            {'not_b', 'not_a'})
+        self.assertSetEqual(
+            {compiled.literal_names[literal_id] for literal_id in
+             compiled.strict_closure(compiled.literal_ids['a'])},
+            {'b', 'c'})
+
+    def test_sound_with_respect_to_asp(self):
+        random.seed(9)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index in range(3):
+                iat, topic = generate_single_layered(
+                    40, strict_rule_ratio=0.4)
+                iat_path = f'{temp_dir}/iat_{index}.lp'
+                write_to_lp_file(iat, iat_path, [topic])
+                self.assertSetEqual(
+                    set(read_from_lp_file(
+                        iat_path).argumentation_system.strict_rules),
+                    set(iat.argumentation_system.strict_rules))
+
+                for with_preferences in [False, True]:
+                    approximation = StabilityLabeler().solve_stability(
+                        iat_path, with_preferences=with_preferences)
+                    exact = GroundedStabilitySolver().solve_stability(
+                        iat_path, with_preferences=with_preferences)
+                    self.assertTrue(approximation.is_subset_of(exact))
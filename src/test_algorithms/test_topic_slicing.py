@@ -0,0 +1,59 @@
+import random
+import tempfile
+import unittest
+
+from src.algorithms.approximation_algorithm.stability_labeler import \
+    StabilityLabeler
+from src.algorithms.asp_algorithms.relevance_algorithms import RelevanceSolver
+from src.algorithms.asp_algorithms.stability_algorithms import \
+    GroundedStabilitySolver
+from src.algorithms.topic_cone import topic_cone
+from src.algorithms.topic_slicing import slice_lp_file
+from src.generators.iat_generator import generate_single_random
+from src.import_export.iat_to_lp_writer import write_to_lp_file
+
+
+def _restrict(stability_result, literal_strs):
+    return [stable_literals & literal_strs for stable_literals in
+            [stability_result.stable_unsatisfiable,
+             stability_result.stable_defended,
+             stability_result.stable_out,
+             stability_result.stable_blocked]]
+
+
+class TestTopicSlicing(unittest.TestCase):
+    def test_same_results_in_cone(self):
+        random.seed(4)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index in range(3):
+                iat, topic = generate_single_random(30)
+                iat_path = f'{temp_dir}/iat_{index}.lp'
+                sliced_path = f'{temp_dir}/sliced_{index}.lp'
+                write_to_lp_file(iat, iat_path, [topic])
+                sliced_iat = slice_lp_file(iat_path, sliced_path)
+
+                compiled = iat.argumentation_system.compiled
+                literals_in_cone, _ = topic_cone(
+                    compiled, [compiled.literal_ids[topic.s1]])
+                cone_strs = {
+                    literal_str for literal_id, literal_str in
+                    enumerate(compiled.literal_names)
+                    if literals_in_cone[literal_id]}
+                self.assertTrue(cone_strs.issubset(
+                    sliced_iat.argumentation_system.language))
+
+                self.assertEqual(
+                    _restrict(StabilityLabeler().solve_stability(iat_path),
+                              cone_strs),
+                    _restrict(StabilityLabeler().solve_stability(
+                        sliced_path), cone_strs))
+                self.assertEqual(
+                    _restrict(GroundedStabilitySolver().solve_stability(
+                        iat_path), cone_strs),
+                    _restrict(GroundedStabilitySolver().solve_stability(
+                        sliced_path), cone_strs))
+                self.assertSetEqual(
+                    RelevanceSolver().relevance_all_incremental(
+                        iat_path, False, 'defended'),
+                    RelevanceSolver().relevance_all_incremental(
+                        sliced_path, False, 'defended'))